@@ -0,0 +1,70 @@
+"""Compiled, event-driven achievement checks.
+
+Achievement conditions such as "plants_planted >= 10" are parsed once into
+predicates over the statistics table. Each achievement is indexed under the
+statistics it reads, so when a statistic changes only the achievements that
+depend on it are re-checked, and earned achievements are tracked in a set.
+"""
+import operator
+import re
+
+OPERATORS = {
+    ">=": operator.ge,
+    ">": operator.gt,
+    "<=": operator.le,
+    "<": operator.lt,
+    "==": operator.eq
+}
+
+# One comparison, e.g. "plants_planted >= 10"; conditions join these with "and"
+COMPARISON = re.compile(r"^\s*([a-z_]+)\s*(>=|<=|==|>|<)\s*(-?\d+(?:\.\d+)?)\s*$")
+
+
+def compile_condition(condition):
+    """Parse a condition string into a list of (stat, compare, value) clauses"""
+    clauses = []
+    for part in condition.split(" and "):
+        match = COMPARISON.match(part)
+        if not match:
+            raise ValueError(f"Unsupported achievement condition: {condition!r}")
+        stat, symbol, value = match.groups()
+        clauses.append((stat, OPERATORS[symbol], float(value)))
+    return clauses
+
+
+class AchievementEngine:
+    """Award achievements when the statistics they depend on change"""
+
+    def __init__(self, achievement_types, award):
+        self.award = award  # callback(achievement)
+        self.achievements = []  # (achievement, clauses)
+        self.by_stat = {}  # stat name -> [(achievement, clauses)]
+        self.earned = set()  # names of earned achievements
+
+        for achievement in achievement_types:
+            entry = (achievement, compile_condition(achievement["condition"]))
+            self.achievements.append(entry)
+            for stat in {clause[0] for clause in entry[1]}:
+                self.by_stat.setdefault(stat, []).append(entry)
+
+    def reset(self, earned_names, stats):
+        """Adopt a loaded set of earned achievements and award any now due"""
+        self.earned = set(earned_names)
+        for entry in self.achievements:
+            self.check(entry, stats)
+
+    def stat_changed(self, stat, stats):
+        """Re-check only the achievements that read a changed statistic"""
+        for entry in self.by_stat.get(stat, ()):
+            self.check(entry, stats)
+
+    def check(self, entry, stats):
+        """Award one achievement if it is unearned and its condition holds"""
+        achievement, clauses = entry
+        if achievement["name"] in self.earned:
+            return
+        for stat, compare, value in clauses:
+            if not compare(stats.get(stat, 0), value):
+                return
+        self.earned.add(achievement["name"])
+        self.award(achievement)
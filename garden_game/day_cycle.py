@@ -0,0 +1,104 @@
+"""Day/night lighting from precomputed curves.
+
+The sun and ambient light colours, the sun's direction and the sky colour are
+sampled once, at startup, into a table over day_time. Each frame a row is
+interpolated from the table and rounded to a quantum - one 8-bit colour step,
+or 1/DIRECTION_STEPS of a direction component - and a light or the sky is
+only touched when its rounded value differs from what it already shows.
+Lights therefore change a few times a minute rather than every frame, and
+the render states built from them are reused from Panda's state cache instead
+of being rebuilt for the whole scene.
+"""
+import numpy as np
+from panda3d.core import Vec3, Vec4
+
+TABLE_SIZE = 2048  # Samples per day
+COLOR_STEPS = 255
+DIRECTION_STEPS = 512
+SUN_DISTANCE = 50
+
+# Columns of a table row
+SUN = slice(0, 3)
+AMBIENT = slice(3, 6)
+DIRECTION = slice(6, 9)
+SKY = slice(9, 12)
+
+NIGHT_SUN = (0.09, 0.09, 0.15)  # Moonlight
+NIGHT_AMBIENT = (0.1, 0.1, 0.2)
+NIGHT_SKY = (0.05, 0.05, 0.15)
+WEATHER_LIGHT = {
+    "Stormy": (0.3, 0.3, 0.4),
+    "Rainy": (0.4, 0.4, 0.5)
+}
+CLEAR_LIGHT = (0.5, 0.5, 0.7)
+
+
+def build_table(size=TABLE_SIZE):
+    """Return size + 1 rows of lighting sampled evenly over a day, the last repeating the first"""
+    t = np.linspace(0.0, 1.0, size + 1)
+    t[-1] = 0.0
+    day = ((t > 0.25) & (t < 0.75))[:, None]
+    intensity = np.sin((t - 0.25) * 2 * np.pi)[:, None]
+    angle = np.where(day[:, 0], t - 0.25, t - 0.75) * 2 * np.pi
+
+    table = np.empty((size + 1, 12))
+    table[:, SUN] = np.where(day, 0.8 * intensity, NIGHT_SUN)
+    table[:, AMBIENT] = np.where(day, 0.4 * intensity, NIGHT_AMBIENT)
+    table[:, DIRECTION] = np.stack([-np.cos(angle), -np.sin(angle), -np.sin(angle)], axis=1)
+    table[:, SKY] = np.where(day, np.stack([np.full_like(t, 0.3), np.full_like(t, 0.4), 0.5 + 0.3 * intensity[:, 0]], axis=1),
+                             NIGHT_SKY)
+    return table
+
+
+class DayCycleLighting:
+    """Drive the scene lights and sky from the precomputed day table"""
+
+    def __init__(self, sun_light, sun_light_node, ambient_light, weather_light, sky, table_size=TABLE_SIZE):
+        self.sun_light = sun_light
+        self.sun_light_node = sun_light_node
+        self.ambient_light = ambient_light
+        self.weather_light = weather_light
+        self.sky = sky
+        self.table = build_table(table_size)
+        self.table_size = table_size
+        self.shown = {}  # target -> quantized value it currently shows
+
+    def sample(self, day_time):
+        """Return the table row for a time of day, interpolated between samples"""
+        position = (day_time % 1.0) * self.table_size
+        index = min(int(position), self.table_size - 1)
+        low, high = self.table[index], self.table[index + 1]
+        return low + (high - low) * (position - index)
+
+    def changed(self, target, value):
+        """Remember a quantized value; return True if it differs from what the target shows"""
+        if self.shown.get(target) == value:
+            return False
+        self.shown[target] = value
+        return True
+
+    def update(self, day_time, weather):
+        """Push the lighting for a time of day and weather, skipping unchanged lights"""
+        row = self.sample(day_time)
+        colors = np.rint(row * COLOR_STEPS).astype(int)
+        directions = np.rint(row[DIRECTION] * DIRECTION_STEPS).astype(int)
+
+        sun = tuple(colors[SUN])
+        if self.changed("sun", sun):
+            self.sun_light.setColor(Vec4(*(c / COLOR_STEPS for c in sun), 1))
+        ambient = tuple(colors[AMBIENT])
+        if self.changed("ambient", ambient):
+            self.ambient_light.setColor(Vec4(*(c / COLOR_STEPS for c in ambient), 1))
+        sky = tuple(colors[SKY])
+        if self.changed("sky", sky):
+            self.sky.setColor(Vec4(*(c / COLOR_STEPS for c in sky), 1))
+
+        direction = tuple(directions)
+        if self.changed("direction", direction):
+            direction = Vec3(*(d / DIRECTION_STEPS for d in direction))
+            self.sun_light.setDirection(direction)
+            self.sun_light_node.setPos(-direction * SUN_DISTANCE)
+
+        weather_color = WEATHER_LIGHT.get(weather, CLEAR_LIGHT)
+        if self.changed("weather", weather_color):
+            self.weather_light.setColor(Vec4(*weather_color, 1))
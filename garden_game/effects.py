@@ -0,0 +1,153 @@
+"""Pooled transient effects.
+
+Short-lived visuals such as water splashes and fertilizer sparkles are drawn
+with cards taken from a per-type pool instead of new nodes, and animated by a
+single task instead of one interval per effect, so thousands of waterings
+over a long session neither accumulate nodes nor grow the interval manager.
+At most MAX_ACTIVE effects run at once; when the budget is spent a new effect
+takes over the oldest one-shot effect, or is skipped if only looping effects
+are running.
+
+Every effect belongs to an owner (a plant's plot position). Releasing the
+owner, e.g. when the plant is harvested, returns all of its effects - looping
+ones included - to their pools. An effect can be played under any parent, such
+as the detail level of a garden chunk, so it is hidden along with it.
+"""
+from direct.task import Task
+from panda3d.core import CardMaker, NodePath, TransparencyAttrib
+
+MAX_ACTIVE = 256
+
+
+def ease_in(t):
+    """Start slow, end fast"""
+    return t * t
+
+
+def ease_out(t):
+    """Start fast, end slow"""
+    return 1.0 - (1.0 - t) ** 2
+
+
+def ease_in_out(t):
+    """Start and end slow"""
+    return t * t * (3.0 - 2.0 * t)
+
+
+# effect type -> (card half size, colour, keyframes of (seconds, start height, end height, easing), loops, pool size)
+EFFECT_TYPES = {
+    "water": (0.1, (0.2, 0.4, 0.8, 0.7), ((0.5, 1.0, 1.5, ease_out), (0.5, 1.5, 0.5, ease_in)), False, 64),
+    "fertilizer": (0.05, (0.8, 0.8, 0.2, 0.5), ((1.0, 1.0, 1.5, ease_in_out), (1.0, 1.5, 1.0, ease_in_out)), True, MAX_ACTIVE)
+}
+
+
+class EffectManager:
+    """Play pooled, owner-tracked effects within a global budget"""
+
+    def __init__(self, parent, task_manager, max_active=MAX_ACTIVE):
+        self.task_manager = task_manager
+        self.max_active = max_active
+        self.root = parent.attachNewNode("effects")
+
+        self.templates = {}
+        self.free = {}  # effect type -> stashed card nodes ready for reuse
+        self.created = {}  # effect type -> cards built so far
+        for effect_type, (size, color, _, _, _) in EFFECT_TYPES.items():
+            cm = CardMaker(effect_type)
+            cm.setFrame(-size, size, -size, size)
+            template = NodePath(cm.generate())
+            template.setColor(*color)
+            template.setTransparency(TransparencyAttrib.MAlpha)
+            template.setLightOff()
+            self.templates[effect_type] = template
+            self.free[effect_type] = []
+            self.created[effect_type] = 0
+
+        self.active = []  # Effect records in start order
+        self.by_owner = {}  # owner -> effect records
+
+    def play(self, effect_type, owner, x, y, parent=None):
+        """Start an effect above (x, y), under parent if given; return False if no card could be spared"""
+        loops = EFFECT_TYPES[effect_type][3]
+        if loops and any(effect["type"] == effect_type for effect in self.by_owner.get(owner, ())):
+            return True
+
+        if len(self.active) >= self.max_active:
+            oldest = next((effect for effect in self.active if not EFFECT_TYPES[effect["type"]][3]), None)
+            if oldest is None:
+                return False
+            self.release(oldest)
+
+        node = self.acquire(effect_type)
+        if node is None:
+            return False
+        node.reparentTo(parent or self.root)
+        node.setPos(x, y, EFFECT_TYPES[effect_type][2][0][1])
+        effect = {"type": effect_type, "node": node, "owner": owner, "x": x, "y": y,
+                  "started": globalClock.getFrameTime()}
+        self.active.append(effect)
+        self.by_owner.setdefault(owner, []).append(effect)
+
+        if not self.task_manager.hasTaskNamed("effects_task"):
+            self.task_manager.add(self.update, "effects_task")
+        return True
+
+    def acquire(self, effect_type):
+        """Take a card from a type's pool, building one if the pool is not full yet"""
+        free = self.free[effect_type]
+        if free:
+            node = free.pop()
+            node.unstash()
+            return node
+        if self.created[effect_type] >= EFFECT_TYPES[effect_type][4]:
+            return None
+        self.created[effect_type] += 1
+        return self.templates[effect_type].copyTo(self.root)
+
+    def release(self, effect):
+        """Stop an effect and return its card to the pool"""
+        self.active.remove(effect)
+        owned = self.by_owner[effect["owner"]]
+        owned.remove(effect)
+        if not owned:
+            del self.by_owner[effect["owner"]]
+        effect["node"].stash()
+        self.free[effect["type"]].append(effect["node"])
+
+    def release_owner(self, owner):
+        """Stop every effect belonging to an owner"""
+        for effect in list(self.by_owner.get(owner, ())):
+            self.release(effect)
+
+    def clear(self):
+        """Stop every effect"""
+        for effect in list(self.active):
+            self.release(effect)
+
+    def update(self, task):
+        """Move every active effect along its keyframes; stop once none are left"""
+        now = globalClock.getFrameTime()
+        finished = []
+        for effect in self.active:
+            _, _, keyframes, loops, _ = EFFECT_TYPES[effect["type"]]
+            elapsed = now - effect["started"]
+            total = sum(keyframe[0] for keyframe in keyframes)
+            if loops:
+                elapsed %= total
+            elif elapsed >= total:
+                finished.append(effect)
+                continue
+
+            for duration, start, end, easing in keyframes:
+                if elapsed < duration:
+                    break
+                elapsed -= duration
+            z = start + (end - start) * easing(min(1.0, elapsed / duration))
+            effect["node"].setPos(effect["x"], effect["y"], z)
+
+        for effect in finished:
+            self.release(effect)
+
+        if self.active:
+            return Task.cont
+        return Task.done
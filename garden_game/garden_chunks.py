@@ -0,0 +1,213 @@
+"""Spatial chunks with distance LOD for the garden view.
+
+The garden's chunks of land (see GardenGrid) each get a LODNode whose bounds
+are fixed to the box its plots and plants occupy, so Panda culls a chunk -
+plots, plants, pests and effects - with one bounds test instead of testing
+every node in it. A LODNode shows one child at a time:
+
+    detail    plots, full plant cards, pests and effects
+    reduced   plots and a single card per plant; no pests or effects
+    impostor  one textured card for the whole chunk
+
+Only owned land has chunk nodes, and a chunk's geometry - its plot mesh and
+impostor - is built the first time it enters the camera's view, so startup
+cost follows the land owned and looked at rather than the map size.
+
+The impostor texture holds TEXELS_PER_PLOT texels per plot side - a ring of
+border colour around the soil, or the plant's tint where something grows. The
+plot mesh and plant instancer report colour changes and dirty chunks are
+repainted with NumPy on flush(), so no render-to-texture pass is needed.
+"""
+import numpy as np
+from panda3d.core import (BoundingBox, CardMaker, Geom, GeomNode, GeomTriangles, GeomVertexData,
+                          GeomVertexFormat, GeomVertexWriter, LODNode, Point3, SamplerState, Texture,
+                          TransparencyAttrib)
+
+from plot_geometry import BORDER_COLOR, PLOT_COLOR, PLOT_HEIGHT
+
+DETAIL_DISTANCE = 80  # Camera distance from a chunk centre where plants lose detail
+IMPOSTOR_DISTANCE = 200  # Camera distance where a chunk becomes a single card
+FAR_DISTANCE = 100000
+CHUNK_HEIGHT = 3.0  # Height of a chunk's bounding box; taller than any plant
+TEXELS_PER_PLOT = 4
+FOR_SALE_COLOR = (0.9, 0.8, 0.3, 0.25)  # Tint over land that can be bought
+
+
+def texels(colors):
+    """Convert RGBA colours in 0-1 to the BGRA bytes Panda stores in RAM images"""
+    return (np.asarray(colors)[..., [2, 1, 0, 3]] * 255).astype(np.uint8)
+
+
+class GardenChunk:
+    """LOD levels, bounds and impostor of one chunk of land"""
+
+    def __init__(self, parent, key, grid):
+        self.key = key
+        self.cells = grid.chunk_cells(key)
+        self.origin = self.cells[0]
+        width = self.cells[-1][0] - self.origin[0] + 1
+        height = self.cells[-1][1] - self.origin[1] + 1
+        spacing = grid.spacing
+        low = Point3((self.origin[0] - 0.5) * spacing, (self.origin[1] - 0.5) * spacing, 0)
+        high = Point3(low.x + width * spacing, low.y + height * spacing, CHUNK_HEIGHT)
+        self.bounds = BoundingBox(low, high)
+        self.uv_scale = (width / grid.chunk_size, height / grid.chunk_size)
+        self.realized = False
+
+        lod = LODNode(f"chunk_{key[0]}_{key[1]}")
+        lod.addSwitch(DETAIL_DISTANCE, 0)
+        lod.addSwitch(IMPOSTOR_DISTANCE, DETAIL_DISTANCE)
+        lod.addSwitch(FAR_DISTANCE, IMPOSTOR_DISTANCE)
+        lod.setCenter((low + high) * 0.5)
+        # Cull the chunk as a whole; nothing inside is tested on its own
+        lod.setBounds(self.bounds)
+        lod.setFinal(True)
+        self.node = parent.attachNewNode(lod)
+        self.detail = self.node.attachNewNode("detail")
+        self.reduced = self.node.attachNewNode("reduced")
+
+        # Soil and plant colours per plot; a plant colour with zero alpha means no plant
+        self.soil = np.tile(np.array(PLOT_COLOR, np.float32), (grid.chunk_size, grid.chunk_size, 1))
+        self.plants = np.zeros((grid.chunk_size, grid.chunk_size, 4), np.float32)
+        self.image = None
+        self.texture = None
+
+    def realize(self):
+        """Build the impostor card and texture"""
+        size = len(self.soil)
+        side = size * TEXELS_PER_PLOT
+        self.image = np.tile(texels(BORDER_COLOR), (side, side, 1))
+        self.texture = Texture(f"chunk_{self.key[0]}_{self.key[1]}_impostor")
+        self.texture.setup2dTexture(side, side, Texture.T_unsigned_byte, Texture.F_rgba8)
+        self.texture.setMagfilter(SamplerState.FT_nearest)
+        self.texture.setMinfilter(SamplerState.FT_linear)
+        self.texture.setWrapU(SamplerState.WM_clamp)
+        self.texture.setWrapV(SamplerState.WM_clamp)
+        impostor = self.node.attachNewNode(self.make_card())
+        impostor.setTexture(self.texture)
+        self.realized = True
+        self.paint()
+
+    def make_card(self):
+        """Build the impostor card covering the chunk's plots"""
+        low, high = self.bounds.getMin(), self.bounds.getMax()
+        vertex_data = GeomVertexData("impostor", GeomVertexFormat.getV3n3t2(), Geom.UHStatic)
+        vertex_writer = GeomVertexWriter(vertex_data, "vertex")
+        normal_writer = GeomVertexWriter(vertex_data, "normal")
+        uv_writer = GeomVertexWriter(vertex_data, "texcoord")
+        for corner_x, corner_y in ((0, 0), (1, 0), (1, 1), (0, 1)):
+            vertex_writer.addData3(low.x + corner_x * (high.x - low.x), low.y + corner_y * (high.y - low.y), PLOT_HEIGHT)
+            normal_writer.addData3(0, 0, 1)
+            uv_writer.addData2(corner_x * self.uv_scale[0], corner_y * self.uv_scale[1])
+        triangles = GeomTriangles(Geom.UHStatic)
+        triangles.addVertices(0, 1, 2)
+        triangles.addVertices(0, 2, 3)
+        geom = Geom(vertex_data)
+        geom.addPrimitive(triangles)
+        geom_node = GeomNode(f"chunk_{self.key[0]}_{self.key[1]}_impostor")
+        geom_node.addGeom(geom)
+        return geom_node
+
+    def local(self, cell):
+        """Return a cell's (row, column) in the chunk's colour arrays"""
+        return cell[1] - self.origin[1], cell[0] - self.origin[0]
+
+    def paint(self):
+        """Redraw the impostor texture from the soil and plant colours"""
+        if not self.realized:
+            return
+        size = len(self.soil)
+        inner = texels(np.where(self.plants[:, :, 3:] > 0, self.plants, self.soil))
+        blocks = self.image.reshape(size, TEXELS_PER_PLOT, size, TEXELS_PER_PLOT, 4)
+        blocks[:, 1:-1, :, 1:-1] = inner[:, None, :, None]
+        image = np.frombuffer(memoryview(self.texture.modifyRamImage()), np.uint8)
+        image[:] = self.image.reshape(-1)
+
+
+class GardenChunks:
+    """Chunk nodes for owned land, created on first use and built once seen"""
+
+    def __init__(self, grid, parent):
+        self.grid = grid
+        self.root = parent.attachNewNode("garden_chunks")
+        self.chunks = {}  # chunk key -> GardenChunk
+        self.unrealized = set()  # Owned chunks whose geometry is not built yet
+        self.realize_listeners = []  # Called with each chunk as its geometry is built
+        self.dirty = set()  # Chunks whose impostor needs repainting
+
+        self.for_sale = parent.attachNewNode("land_for_sale")
+        self.for_sale.setTransparency(TransparencyAttrib.MAlpha)
+        self.for_sale.setDepthWrite(False)
+        self.for_sale.setLightOff()
+        self.sync_land()
+
+    def chunk(self, key):
+        """Return the chunk for a key, creating its nodes on first use"""
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self.chunks[key] = GardenChunk(self.root, key, self.grid)
+            self.unrealized.add(key)
+        return chunk
+
+    def chunk_of(self, cell):
+        """Return the chunk a plot cell belongs to"""
+        return self.chunk(self.grid.chunk_of(cell))
+
+    def chunk_at(self, position):
+        """Return the chunk holding a world position"""
+        return self.chunk_of(self.grid.cell_of(*position))
+
+    def sync_land(self):
+        """Drop chunks no longer owned and mark the land for sale; return the dropped keys"""
+        dropped = [key for key in self.chunks if key not in self.grid.owned]
+        for key in dropped:
+            self.chunks.pop(key).node.removeNode()
+            self.unrealized.discard(key)
+            self.dirty = {chunk for chunk in self.dirty if chunk.key != key}
+        self.unrealized |= set(self.grid.owned) - set(self.chunks)
+
+        self.for_sale.node().removeAllChildren()
+        spacing = self.grid.spacing
+        for key in self.grid.purchasable():
+            cells = self.grid.chunk_cells(key)
+            cm = CardMaker(f"for_sale_{key[0]}_{key[1]}")
+            cm.setFrame((cells[0][0] - 0.5) * spacing, (cells[-1][0] + 0.5) * spacing,
+                        (cells[0][1] - 0.5) * spacing, (cells[-1][1] + 0.5) * spacing)
+            card = self.for_sale.attachNewNode(cm.generate())
+            card.setP(-90)  # CardMaker builds cards in the XZ plane
+            card.setZ(PLOT_HEIGHT)
+            card.setColor(*FOR_SALE_COLOR)
+        return dropped
+
+    def update(self, camera):
+        """Build the geometry of owned chunks that have come into the camera's view"""
+        if not self.unrealized:
+            return
+        frustum = camera.node().getLens().makeBounds()
+        frustum.xform(camera.getMat(self.root))
+        for key in [key for key in self.unrealized if key in self.grid.owned]:
+            chunk = self.chunk(key)
+            if frustum.contains(chunk.bounds):
+                self.unrealized.discard(key)
+                chunk.realize()
+                for listener in self.realize_listeners:
+                    listener(chunk)
+
+    def set_soil_color(self, cell, color):
+        """Record a plot's soil colour for its chunk's impostor"""
+        chunk = self.chunk_of(cell)
+        chunk.soil[chunk.local(cell)] = color
+        self.dirty.add(chunk)
+
+    def set_plant_color(self, position, color):
+        """Record the tint of the plant at a position, or None once it is gone"""
+        cell = self.grid.cell_of(*position)
+        chunk = self.chunk_of(cell)
+        chunk.plants[chunk.local(cell)] = 0 if color is None else color
+        self.dirty.add(chunk)
+
+    def flush(self):
+        """Repaint the impostors of chunks that changed"""
+        for chunk in self.dirty:
+            chunk.paint()
+        self.dirty.clear()
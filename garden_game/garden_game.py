@@ -79,14 +79,18 @@ class GardenGame(ShowBase):
         
         # Create a grid for planting
         self.plot_positions = []
+        plots_root = self.render.attachNewNode("plots")
         for x in range(-4, 5, 2):
             for y in range(-4, 5, 2):
                 plot = self.loader.loadModel("models/box")
-                plot.reparentTo(self.render)
+                plot.reparentTo(plots_root)
                 plot.setPos(x, y, 0)
                 plot.setScale(0.9, 0.9, 0.1)
                 plot.setColor(0.5, 0.4, 0.2, 1)
                 self.plot_positions.append((x, y))
+        
+        # Merge the plots into one node
+        plots_root.flattenStrong()
     
     def setup_ui(self):
         # Money display
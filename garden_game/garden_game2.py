@@ -179,10 +179,11 @@ class GardenGame(ShowBase):
         
         # Create a grid for planting
         self.plot_positions = []
+        plots_root = self.render.attachNewNode("plots")
         for x in range(-8, 9, 2):
             for y in range(-8, 9, 2):
                 plot = self.loader.loadModel("models/box")
-                plot.reparentTo(self.render)
+                plot.reparentTo(plots_root)
                 plot.setPos(x, y, 0)
                 plot.setScale(0.9, 0.9, 0.1)
                 
@@ -191,6 +192,9 @@ class GardenGame(ShowBase):
                 plot.setTexture(dirt_tex, 1)
                 
                 self.plot_positions.append((x, y))
+        
+        # Merge the textured plots into a single batch
+        plots_root.flattenStrong()
     
     def setup_ui(self):
         # Create a frame for the UI
@@ -0,0 +1,184 @@
+"""Plot grid index for GardenSimulation.
+
+Plots sit on a regular grid, so a world position maps to an integer cell with
+plain arithmetic. The id of the plant growing in each cell is kept in a
+size x size NumPy array (-1 for an empty plot), which turns every tool action
+and pest lookup into an array access instead of a scan over all plants, and
+lets a save's plants be placed with a few whole-column operations.
+
+The map is divided into CHUNK_SIZE x CHUNK_SIZE chunks of land. The player
+starts with the chunk in the middle of the map and buys neighbouring chunks
+to grow the garden. Plot records - a plot's cell and world position - are
+only created the first time a plot on owned land is looked up.
+"""
+
+import numpy as np
+
+GARDEN_SIZE = 80  # Plots along each side of the map
+CHUNK_SIZE = 16  # Plots along each side of a chunk of land
+PLOT_SPACING = 2  # World units between plot centres
+PICK_RADIUS = 1.0  # Clicks further than this from a plot centre miss it
+
+
+class GardenGrid:
+    """Map integer plot cells to plot records and occupying plants"""
+
+    def __init__(self, size=GARDEN_SIZE, spacing=PLOT_SPACING, chunk_size=CHUNK_SIZE):
+        # Cells run from min_cell to max_cell on both axes, centred on the origin
+        self.spacing = spacing
+        self.size = size
+        self.chunk_size = chunk_size
+        self.min_cell = -(size // 2)
+        self.max_cell = self.min_cell + size - 1
+        self.chunks_per_side = -(-size // chunk_size)
+        self.starting_chunk = self.chunk_of((0, 0))
+        self.plots = {}  # (cell_x, cell_y) -> plot record, created on first use
+        self.occupants = np.full((size, size), -1, np.int64)  # Plant id per cell, offset by min_cell
+        self.owned = {self.starting_chunk}  # Chunks of land the player owns
+
+    def extent(self):
+        """Return the lowest and highest world coordinate covered by the map, on either axis"""
+        return (self.min_cell - 0.5) * self.spacing, (self.max_cell + 0.5) * self.spacing
+
+    def chunk_of(self, cell):
+        """Return the chunk of land a cell belongs to"""
+        return ((cell[0] - self.min_cell) // self.chunk_size, (cell[1] - self.min_cell) // self.chunk_size)
+
+    def chunk_cells(self, chunk):
+        """Return the cells of a chunk that lie on the map"""
+        low_x = self.min_cell + chunk[0] * self.chunk_size
+        low_y = self.min_cell + chunk[1] * self.chunk_size
+        return [(cell_x, cell_y)
+                for cell_x in range(low_x, min(low_x + self.chunk_size, self.max_cell + 1))
+                for cell_y in range(low_y, min(low_y + self.chunk_size, self.max_cell + 1))]
+
+    def on_map(self, chunk):
+        """Return whether a chunk lies on the map"""
+        return 0 <= chunk[0] < self.chunks_per_side and 0 <= chunk[1] < self.chunks_per_side
+
+    def owns(self, cell):
+        """Return whether a cell is on owned land"""
+        return (self.min_cell <= cell[0] <= self.max_cell and self.min_cell <= cell[1] <= self.max_cell
+                and self.chunk_of(cell) in self.owned)
+
+    def purchasable(self):
+        """Return the chunks on the map next to owned land"""
+        chunks = set()
+        for chunk_x, chunk_y in self.owned:
+            for offset_x, offset_y in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                chunk = (chunk_x + offset_x, chunk_y + offset_y)
+                if self.on_map(chunk) and chunk not in self.owned:
+                    chunks.add(chunk)
+        return chunks
+
+    def own(self, chunk):
+        """Add a chunk to the owned land"""
+        self.owned.add(chunk)
+
+    def set_land(self, chunks):
+        """Replace the owned land, forgetting plot records and plants outside it"""
+        for chunk_x, chunk_y in self.owned - set(chunks):
+            self.occupants[chunk_x * self.chunk_size:(chunk_x + 1) * self.chunk_size,
+                           chunk_y * self.chunk_size:(chunk_y + 1) * self.chunk_size] = -1
+        self.owned = set(chunks)
+        self.plots = {cell: plot for cell, plot in self.plots.items() if self.chunk_of(cell) in self.owned}
+
+    def chunks_holding(self, xs, ys):
+        """Return the chunks on the map holding any of the given world positions"""
+        local_xs = np.rint(np.asarray(xs, np.float64) / self.spacing).astype(np.int64) - self.min_cell
+        local_ys = np.rint(np.asarray(ys, np.float64) / self.spacing).astype(np.int64) - self.min_cell
+        on_map = (local_xs >= 0) & (local_xs < self.size) & (local_ys >= 0) & (local_ys < self.size)
+        chunk_ids = np.unique(local_xs[on_map] // self.chunk_size * self.chunks_per_side + local_ys[on_map] // self.chunk_size)
+        return {divmod(chunk_id, self.chunks_per_side) for chunk_id in chunk_ids.tolist()}
+
+    def positions(self):
+        """Return the world position of every plot on owned land"""
+        return [self.position_of(cell) for chunk in sorted(self.owned) for cell in self.chunk_cells(chunk)]
+
+    def position_of(self, cell):
+        """Return the world position of a plot cell"""
+        return (cell[0] * self.spacing, cell[1] * self.spacing)
+
+    def cell_of(self, x, y):
+        """Return the cell nearest to a world position"""
+        return (round(x / self.spacing), round(y / self.spacing))
+
+    def plot(self, cell):
+        """Return the plot record of a cell on owned land, creating it on first use"""
+        plot = self.plots.get(cell)
+        if plot is None and self.owns(cell):
+            plot = self.plots[cell] = {"cell": cell, "position": self.position_of(cell)}
+        return plot
+
+    def plot_at(self, position):
+        """Return the plot record centred exactly on a world position"""
+        plot = self.plot(self.cell_of(position[0], position[1]))
+        if plot and plot["position"] == tuple(position):
+            return plot
+        return None
+
+    def snap(self, x, y, radius=PICK_RADIUS):
+        """Return the position of the plot under a world point, if any"""
+        cell = self.cell_of(x, y)
+        if self.owns(cell):
+            plot_x, plot_y = self.position_of(cell)
+            if (x - plot_x) ** 2 + (y - plot_y) ** 2 < radius * radius:
+                return (plot_x, plot_y)
+        return None
+
+    def plant_in(self, cell):
+        """Return the id of the plant growing in a cell, if any"""
+        if not (self.min_cell <= cell[0] <= self.max_cell and self.min_cell <= cell[1] <= self.max_cell):
+            return None
+        plant_id = int(self.occupants[cell[0] - self.min_cell, cell[1] - self.min_cell])
+        return None if plant_id < 0 else plant_id
+
+    def plant_at(self, position):
+        """Return the id of the plant growing at a position, if any"""
+        cell = self.cell_of(position[0], position[1])
+        if self.position_of(cell) == tuple(position):
+            return self.plant_in(cell)
+        return None
+
+    def attach(self, position, plant_id):
+        """Record that a plant now occupies a plot"""
+        cell = self.plot_at(position)["cell"]
+        self.occupants[cell[0] - self.min_cell, cell[1] - self.min_cell] = plant_id
+
+    def attach_many(self, xs, ys, plant_ids):
+        """Attach plants by position in bulk; return the ids that found no free plot"""
+        xs = np.asarray(xs, np.float64)
+        ys = np.asarray(ys, np.float64)
+        plant_ids = np.asarray(plant_ids)
+        cell_xs = np.rint(xs / self.spacing).astype(np.int64)
+        cell_ys = np.rint(ys / self.spacing).astype(np.int64)
+        local_xs = cell_xs - self.min_cell
+        local_ys = cell_ys - self.min_cell
+
+        # Keep plants centred on a plot of owned land
+        owned = [chunk_x * self.chunks_per_side + chunk_y for chunk_x, chunk_y in self.owned]
+        valid = ((cell_xs * self.spacing == xs) & (cell_ys * self.spacing == ys)
+                 & (local_xs >= 0) & (local_xs < self.size) & (local_ys >= 0) & (local_ys < self.size))
+        valid[valid] = np.isin(local_xs[valid] // self.chunk_size * self.chunks_per_side
+                               + local_ys[valid] // self.chunk_size, owned)
+        candidates = np.flatnonzero(valid)
+
+        # ...on a free plot, and only the first plant per plot
+        candidates = candidates[self.occupants[local_xs[candidates], local_ys[candidates]] < 0]
+        _, first = np.unique(local_xs[candidates] * self.size + local_ys[candidates], return_index=True)
+        candidates = candidates[np.sort(first)]
+        self.occupants[local_xs[candidates], local_ys[candidates]] = plant_ids[candidates]
+
+        rejected = np.ones(len(plant_ids), bool)
+        rejected[candidates] = False
+        return plant_ids[rejected].tolist()
+
+    def detach(self, position):
+        """Record that a plot is empty again"""
+        cell = self.cell_of(position[0], position[1])
+        if self.plant_in(cell) is not None:
+            self.occupants[cell[0] - self.min_cell, cell[1] - self.min_cell] = -1
+
+    def clear_plants(self):
+        """Empty every plot"""
+        self.occupants.fill(-1)
@@ -0,0 +1,967 @@
+"""Headless simulation core for Grow A Garden.
+
+GardenSimulation owns every piece of state the game rules touch - plants,
+pests, weather, economy and statistics - and advances it one tick at a time
+without Panda3D. The EnhancedGardenGame view subscribes to the events it emits
+and mirrors the state into the scene graph, so the same engine can run
+thousands of gardens on a server or in balancing scripts without a window.
+"""
+import copy
+import math
+import random
+import time
+
+import numpy as np
+
+from achievements import AchievementEngine
+from garden_grid import GardenGrid, GARDEN_SIZE
+from growth_modifiers import FERTILIZER_BONUS, GrowthModifiers
+from offline_progress import grow_plants, ticks_until_ready
+from pest_hash import PestSpatialHash
+from plant_store import PlantStore, plant_dicts
+from scheduler import EventScheduler
+
+# Enhanced plant types with realistic properties
+PLANT_TYPES = [
+    {
+        "name": "Carrot", "plural": "Carrots", "cost": 8, "growth_time": 12, "value": 15,
+        "color": (0.9, 0.5, 0.1, 1), "experience": 5, "size": 0.8,
+        "season": "Spring", "water_needs": 3, "sun_needs": 2,
+        "pest_resistance": 0.7, "disease_resistance": 0.8
+    },
+    {
+        "name": "Tomato", "plural": "Tomatoes", "cost": 15, "growth_time": 18, "value": 35,
+        "color": (1.0, 0.2, 0.2, 1), "experience": 10, "size": 1.0,
+        "season": "Summer", "water_needs": 4, "sun_needs": 3,
+        "pest_resistance": 0.5, "disease_resistance": 0.6
+    },
+    {
+        "name": "Pumpkin", "plural": "Pumpkins", "cost": 25, "growth_time": 25, "value": 60,
+        "color": (1.0, 0.6, 0.1, 1), "experience": 15, "size": 1.5,
+        "season": "Fall", "water_needs": 5, "sun_needs": 2,
+        "pest_resistance": 0.8, "disease_resistance": 0.7
+    },
+    {
+        "name": "Sunflower", "plural": "Sunflowers", "cost": 20, "growth_time": 15, "value": 30,
+        "color": (1.0, 0.9, 0.1, 1), "experience": 12, "size": 1.2,
+        "season": "Summer", "water_needs": 3, "sun_needs": 4,
+        "pest_resistance": 0.6, "disease_resistance": 0.8
+    },
+    {
+        "name": "Rose", "plural": "Roses", "cost": 35, "growth_time": 20, "value": 80,
+        "color": (1.0, 0.1, 0.3, 1), "experience": 20, "size": 1.0,
+        "season": "Spring", "water_needs": 4, "sun_needs": 3,
+        "pest_resistance": 0.4, "disease_resistance": 0.5
+    },
+    {
+        "name": "Cactus", "plural": "Cacti", "cost": 40, "growth_time": 30, "value": 100,
+        "color": (0.3, 0.7, 0.3, 1), "experience": 25, "size": 0.6,
+        "season": "Summer", "water_needs": 1, "sun_needs": 5,
+        "pest_resistance": 0.9, "disease_resistance": 0.9
+    }
+]
+
+# Pest types
+PEST_TYPES = [
+    {"name": "Aphids", "damage": 0.1, "speed": 0.5, "color": (0.8, 0.2, 0.2, 1)},
+    {"name": "Caterpillars", "damage": 0.15, "speed": 0.3, "color": (0.2, 0.8, 0.2, 1)},
+    {"name": "Beetles", "damage": 0.2, "speed": 0.4, "color": (0.2, 0.2, 0.8, 1)},
+    {"name": "Slugs", "damage": 0.12, "speed": 0.2, "color": (0.5, 0.5, 0.5, 1)}
+]
+
+# Achievement system
+ACHIEVEMENT_TYPES = [
+    {"name": "First Plant", "category": "Growth", "description": "Plant your first seed", "reward": 50, "condition": "plants_planted >= 1"},
+    {"name": "Green Thumb", "category": "Growth", "description": "Plant 10 seeds", "reward": 100, "condition": "plants_planted >= 10"},
+    {"name": "Harvest Master", "category": "Harvest", "description": "Harvest 25 plants", "reward": 200, "condition": "plants_harvested >= 25"},
+    {"name": "Weather Warrior", "category": "Weather", "description": "Survive 5 storms", "reward": 150, "condition": "storms_survived >= 5"},
+    {"name": "Pest Hunter", "category": "Pests", "description": "Eliminate 20 pests", "reward": 100, "condition": "pests_eliminated >= 20"}
+]
+
+SEASONS = ["Spring", "Summer", "Fall", "Winter"]
+WEATHER_OPTIONS = ["Sunny", "Rainy", "Stormy", "Snowy"]
+PESTICIDE_RADIUS = 0  # Cells around the target plot that one spray clears
+PEST_SPAWN_RATE = 0.001  # Expected pest spawns per tick
+DISEASE_RATE = 0.001  # Expected disease onsets per growing plant per tick
+LAND_PRICE = 500  # Price of a chunk of land for each chunk already owned
+
+
+def new_stats():
+    """Create an empty statistics table"""
+    return {
+        "plants_planted": 0,
+        "plants_harvested": 0,
+        "storms_survived": 0,
+        "pests_eliminated": 0,
+        "money_earned": 0,
+        "days_played": 0
+    }
+
+
+class GardenSimulation:
+    """Pure-Python garden engine that can be stepped without a window"""
+
+    def __init__(self, seed=None, garden_size=GARDEN_SIZE):
+        self.rng = random.Random(seed)
+        self.np_rng = np.random.default_rng(seed)
+        self.listeners = {}
+        self.quiet = False  # Suppresses messages and sounds while fast-forwarding
+
+        # Economy and progression
+        self.money = 1000  # Starting money increased
+        self.experience = 0
+        self.level = 1
+        self.skill_points = 0  # Skill points for upgrades
+
+        # Time, season and weather; periodic and random events live in the scheduler
+        self.tick_count = 0
+        self.scheduler = EventScheduler()
+        self.day_event = None
+        self.pest_event = None
+        self.disease_event = None
+        self.auto_save_event = None
+        self.auto_save_interval = None
+        self.day_night_cycle_speed = 0.003  # Fraction of a day per tick
+        self.day_night_cycle_enabled = True
+        self.day_time = 0.5  # 0.0 to 1.0 (0 = night, 1 = day)
+        self.day_count = 1
+        self.season = "Spring"  # Spring, Summer, Fall, Winter
+        self.weather = "Sunny"  # Sunny, Rainy, Stormy, Snowy
+        self.temperature = 20  # Celsius
+        self.humidity = 50  # Percentage
+        self.wind_speed = 5
+        self.weather_change_interval = 300  # Ticks between weather rolls
+        self.weather_event = self.scheduler.schedule_every(self.weather_change_interval, self.change_weather)
+        self.schedule_pest_spawn()
+
+        # Tools
+        self.tool_levels = {"plant": 1, "water": 1, "harvest": 1, "fertilize": 1, "pesticide": 1, "prune": 1, "analyze": 1, "breed": 1, "clone": 1, "graft": 1}
+        self.tool_efficiency = {"plant": 1.0, "water": 1.0, "harvest": 1.0, "fertilize": 1.0, "pesticide": 1.0, "prune": 1.0, "analyze": 1.0, "breed": 1.0, "clone": 1.0, "graft": 1.0}
+        self.tools_unlocked = ["plant", "water", "harvest", "fertilize", "pesticide", "prune"]
+
+        # Enhanced inventory system
+        self.seeds_inventory = [10, 8, 5, 3, 2, 1]  # More plant types
+        self.fertilizer = 5
+        self.pesticide = 3
+        self.water_can_level = 100
+
+        self.plant_types = copy.deepcopy(PLANT_TYPES)
+        self.growth_modifiers = GrowthModifiers(len(self.plant_types))
+        self.update_growth_modifiers()
+        self.pest_types = copy.deepcopy(PEST_TYPES)
+        self.achievement_types = copy.deepcopy(ACHIEVEMENT_TYPES)
+        self.grid = GardenGrid(garden_size)
+
+        self.plants = PlantStore()
+        self.pests = PestSpatialHash()
+        self.achievements = []
+        self.next_pest_id = 0
+
+        # Statistics tracking; achievements are re-checked when a stat they read changes
+        self.stats = new_stats()
+        self.achievement_engine = AchievementEngine(self.achievement_types, self.award_achievement)
+        self.subscribe("stat_changed", self.on_stat_changed)
+
+    # Event plumbing
+    def subscribe(self, event, callback):
+        """Register a callback for a simulation event"""
+        self.listeners.setdefault(event, []).append(callback)
+
+    def emit(self, event, *args):
+        """Notify every listener registered for an event"""
+        for callback in self.listeners.get(event, ()):
+            callback(*args)
+
+    def show_message(self, text, key=None, template=None, amount=0):
+        """Ask the view to show a temporary message"""
+        # Messages sharing a key may be merged into template.format(count=..., amount=...)
+        if not self.quiet:
+            self.emit("message", text, key, template, amount)
+
+    def play_sound(self, name):
+        """Ask the view to play a named sound effect"""
+        if not self.quiet:
+            self.emit("sound", name)
+
+    # Simulation loop
+    def advance(self, ticks):
+        """Advance the simulation by a number of fixed ticks"""
+        target = self.tick_count + ticks
+        while self.tick_count < target:
+            if self.pests:
+                self.step()
+            else:
+                self.advance_to_next_event(target)
+
+    def step(self):
+        """Advance the simulation by one tick"""
+        self.tick_count += 1
+        self.scheduler.run_until(self.tick_count)
+        self.update_plants()
+        self.update_pests()
+
+    def advance_to_next_event(self, target):
+        """Jump a pest-free garden straight to its next scheduled event"""
+        # Without pests, plants grow at constant rates between events, so the
+        # ticks in between are applied in closed form
+        next_time = self.scheduler.next_time()
+        if next_time is None:
+            end = target
+        else:
+            end = min(target, max(self.tick_count + 1, math.ceil(next_time)))
+
+        grow_plants(self.plants, end - self.tick_count - 1, self.growth_modifiers)
+        self.tick_count = end
+        self.scheduler.run_until(end)
+        self.update_plants()
+
+    def jump_to(self, tick):
+        """Jump to a later tick in one step, rolling days and weather over at most once"""
+        # Only the calendar is moved on; plants and pests are left as they are
+        ticks = tick - self.tick_count
+        day_time = self.day_time
+        days = 0
+        if self.day_night_cycle_enabled:
+            days, day_time = divmod(day_time + ticks * self.day_night_cycle_speed, 1.0)
+
+        self.scheduler.cancel(self.day_event)
+        self.scheduler.cancel(self.weather_event)
+        self.tick_count = tick
+        self.scheduler.run_until(tick)
+        self.day_time = day_time
+
+        if days:
+            self.day_count += int(days)
+            self.add_stat("days_played", int(days))
+            self.check_plant_growth()
+            self.update_season()
+        if ticks >= self.weather_change_interval:
+            self.change_weather()
+        self.weather_event = self.scheduler.schedule_every(self.weather_change_interval, self.change_weather)
+
+    def skip_to_next_ready(self):
+        """Fast-forward until another plant is ready to harvest; return the ticks skipped"""
+        start = self.tick_count
+        ready = np.count_nonzero(self.plants.column("growth") >= 1.0)
+        self.quiet = True
+        try:
+            while True:
+                ticks = ticks_until_ready(self.plants, self.growth_modifiers)
+                if ticks is None:
+                    break
+                # Weather may change on the way, so re-estimate after each jump
+                self.advance(max(1, ticks))
+                if np.count_nonzero(self.plants.column("growth") >= 1.0) > ready:
+                    break
+        finally:
+            self.quiet = False
+        return self.tick_count - start
+
+    # Time of day
+    @property
+    def day_time(self):
+        """Fraction of the current day, derived from the tick count"""
+        if self.day_night_cycle_enabled:
+            return self.day_start_time + (self.tick_count - self.day_start_tick) * self.day_night_cycle_speed
+        return self.day_start_time
+
+    @day_time.setter
+    def day_time(self, value):
+        self.day_start_time = value
+        self.day_start_tick = self.tick_count
+        self.schedule_day_rollover()
+
+    def set_day_night_cycle(self, enabled):
+        """Pause or resume the day/night cycle at the current time of day"""
+        day_time = self.day_time
+        self.day_night_cycle_enabled = enabled
+        self.day_time = day_time
+
+    def schedule_day_rollover(self):
+        """Schedule the tick at which the current day ends"""
+        self.scheduler.cancel(self.day_event)
+        self.day_event = None
+        if self.day_night_cycle_enabled:
+            ticks_left = math.ceil((1.0 - self.day_start_time) / self.day_night_cycle_speed)
+            self.day_event = self.scheduler.schedule_at(self.day_start_tick + ticks_left, self.start_new_day)
+
+    def start_new_day(self):
+        """Roll over to the next day"""
+        self.day_time = max(0.0, self.day_time - 1.0)
+        self.day_count += 1
+        self.add_stat("days_played")
+        self.check_plant_growth()
+        self.update_season()
+
+    # Random events
+    def schedule_pest_spawn(self):
+        """Schedule the next pest spawn of a Poisson process"""
+        self.pest_event = self.scheduler.schedule_in(self.rng.expovariate(PEST_SPAWN_RATE), self.spawn_pest_event)
+
+    def spawn_pest_event(self):
+        """Spawn a pest and schedule the next one"""
+        self.spawn_pest()
+        self.schedule_pest_spawn()
+
+    def schedule_disease(self):
+        """(Re)schedule the next disease onset for the current plant count"""
+        # Sampled at the rate for every plant; mature plants picked at onset are
+        # skipped, which thins the process to DISEASE_RATE per growing plant
+        self.scheduler.cancel(self.disease_event)
+        self.disease_event = None
+        if self.plants:
+            delay = self.rng.expovariate(DISEASE_RATE * len(self.plants))
+            self.disease_event = self.scheduler.schedule_in(delay, self.disease_onset)
+
+    def disease_onset(self):
+        """Make a random growing plant a little sicker"""
+        plant = self.plants[self.rng.randrange(len(self.plants))]
+        if plant["growth"] < 1.0:
+            plant["disease_level"] = min(plant["disease_level"] + 0.1, 1.0)
+        self.schedule_disease()
+
+    def schedule_auto_save(self, interval):
+        """Emit an auto_save event every interval ticks, or stop when interval is None"""
+        self.scheduler.cancel(self.auto_save_event)
+        self.auto_save_event = None
+        self.auto_save_interval = interval
+        if interval:
+            self.auto_save_event = self.scheduler.schedule_every(interval, lambda: self.emit("auto_save"))
+
+    def cancel_random_events(self):
+        """Stop pest spawns, disease onsets and auto-saves, e.g. while catching up"""
+        for event in (self.pest_event, self.disease_event, self.auto_save_event):
+            self.scheduler.cancel(event)
+        self.pest_event = self.disease_event = self.auto_save_event = None
+
+    def schedule_random_events(self):
+        """Restart pest spawns, disease onsets and auto-saves from the current tick"""
+        self.scheduler.cancel(self.pest_event)
+        self.schedule_pest_spawn()
+        self.schedule_disease()
+        self.schedule_auto_save(self.auto_save_interval)
+
+    def is_daytime(self):
+        """Return True while the sun is up"""
+        return 0.25 < self.day_time < 0.75
+
+    # Plant management
+    def find_plant(self, position):
+        """Return the plant growing at a plot position, if any"""
+        plant_id = self.grid.plant_at(position)
+        if plant_id is None:
+            return None
+        return self.plants.record(plant_id)
+
+    def remove_plant(self, plant):
+        """Take a plant off its plot"""
+        self.emit("plant_removed", plant)
+        self.grid.detach(plant["position"])
+        self.plants.remove(plant)
+        self.schedule_disease()
+
+    def restore_plant(self, plant_data):
+        """Put a saved plant record back on its plot, replacing the plant there"""
+        plant = self.find_plant(plant_data["position"])
+        if plant is not None:
+            for key, value in plant_data.items():
+                if key not in ("position", "stage"):
+                    plant[key] = value
+            return plant
+
+        if self.grid.plot_at(plant_data["position"]) is None:
+            return None
+        plant = self.plants.add(plant_data)
+        self.grid.attach(plant_data["position"], plant.id)
+        self.schedule_disease()
+        self.emit("plant_added", plant)
+        return plant
+
+    def plant_seed(self, position, seed_index):
+        """Plant a seed at the specified position"""
+        # Check if plot exists and is empty
+        if self.grid.plot_at(position) is None or self.grid.plant_at(position) is not None:
+            return None
+
+        # Check if we have seeds
+        if self.seeds_inventory[seed_index] <= 0:
+            return None
+
+        # Check if plant is suitable for current season
+        plant_type = self.plant_types[seed_index]
+        if plant_type["season"] != self.season and plant_type["season"] != "All":
+            self.show_message(f"{plant_type['name']} can only be planted in {plant_type['season']}!")
+            return None
+
+        # Deduct seed from inventory
+        self.seeds_inventory[seed_index] -= 1
+        self.add_stat("plants_planted")
+
+        plant_data = {
+            "type": seed_index,
+            "position": position,
+            "stage": 0,  # 0-5 (seed, sprout, growing, flowering, fruiting, ready)
+            "growth": 0.0,
+            "growth_rate": 0.01,
+            "water_level": 0,
+            "fertilized": False,
+            "pruned": False,
+            "pest_damage": 0.0,
+            "disease_level": 0.0,
+            "last_watered": 0,
+            "last_fertilized": 0,
+            "planted_day": self.day_count
+        }
+
+        plant = self.plants.add(plant_data)
+        self.grid.attach(position, plant.id)
+        self.schedule_disease()
+        self.emit("plant_added", plant)
+        self.play_sound("plant")
+        return plant
+
+    def update_plants(self):
+        """Update all plants with realistic growth mechanics"""
+        self.plants.grow(self.growth_modifiers)
+
+    def update_growth_modifiers(self):
+        """Rebuild the growth modifier table after the season, weather or a bonus changes"""
+        season_multipliers = np.array([self.get_season_growth_multiplier(i) for i in range(len(self.plant_types))])
+        self.growth_modifiers.rebuild(self.get_weather_growth_multiplier(), season_multipliers)
+
+    def set_growth_bonus(self, name, factor, plant_type=None):
+        """Apply a named growth multiplier (e.g. from research) to all plants or one type"""
+        stack = self.growth_modifiers.growth if plant_type is None else self.growth_modifiers.types[plant_type]
+        if stack.set(name, factor):
+            self.update_growth_modifiers()
+
+    def remove_growth_bonus(self, name, plant_type=None):
+        """Remove a named growth multiplier"""
+        stack = self.growth_modifiers.growth if plant_type is None else self.growth_modifiers.types[plant_type]
+        if stack.remove(name):
+            self.update_growth_modifiers()
+
+    def get_weather_growth_multiplier(self):
+        """Get growth multiplier based on weather"""
+        if self.weather == "Sunny":
+            return 1.2
+        elif self.weather == "Rainy":
+            return 1.5
+        elif self.weather == "Stormy":
+            return 0.8
+        elif self.weather == "Snowy":
+            return 0.3
+        return 1.0
+
+    def get_season_growth_multiplier(self, plant_type_index):
+        """Get growth multiplier based on season compatibility"""
+        plant_type = self.plant_types[plant_type_index]
+        if plant_type["season"] == self.season:
+            return 1.5
+        elif plant_type["season"] == "All":
+            return 1.0
+        else:
+            return 0.3
+
+    def water_plant(self, position):
+        """Water a plant at the specified position"""
+        if self.water_can_level <= 0:
+            self.show_message("Water can is empty! Refill at the well.")
+            return False
+
+        plant = self.find_plant(position)
+        if not plant:
+            return False
+
+        plant["water_level"] = 3.0  # 3 days of water
+        plant["last_watered"] = self.day_count
+        self.water_can_level -= 10
+
+        self.emit("plant_watered", plant)
+        self.play_sound("water")
+        return True
+
+    def fertilize_plant(self, position):
+        """Fertilize a plant at the specified position"""
+        if self.fertilizer <= 0:
+            self.show_message("No fertilizer available!")
+            return False
+
+        plant = self.find_plant(position)
+        if not plant or plant["fertilized"]:
+            return False
+
+        plant["fertilized"] = True
+        plant["last_fertilized"] = self.day_count
+        self.fertilizer -= 1
+
+        self.emit("plant_fertilized", plant)
+        self.play_sound("coin")
+        return True
+
+    def harvest_plant(self, position):
+        """Harvest a mature plant"""
+        plant = self.find_plant(position)
+        if not plant or plant["growth"] < 1.0:
+            return 0
+
+        plant_type = self.plant_types[plant["type"]]
+
+        # Calculate harvest value based on plant health
+        health_factor = 1.0 - plant["pest_damage"] - plant["disease_level"]
+        health_factor = max(0.5, health_factor)
+
+        harvest_value = int(plant_type["value"] * health_factor)
+        harvest_exp = int(plant_type["experience"] * health_factor)
+
+        self.money += harvest_value
+        self.experience += harvest_exp
+        self.add_stat("plants_harvested")
+        self.add_stat("money_earned", harvest_value)
+
+        # Check for level up
+        if self.experience >= self.level * 100:
+            self.level_up()
+
+        # Pests living on the harvested plant have nothing left to eat
+        for pest in self.pests.at(self.grid.plot_at(position)["cell"]):
+            self.remove_pest(pest)
+
+        self.remove_plant(plant)
+
+        self.show_message(f"Harvested {plant_type['name']} for ${harvest_value}!",
+                          key=f"harvest:{plant_type['name']}",
+                          template=f"Harvested {{count}} {plant_type['plural']} for ${{amount}}!",
+                          amount=harvest_value)
+        self.play_sound("harvest")
+        self.play_sound("coin")
+        return harvest_value
+
+    def use_pesticide(self, position):
+        """Use pesticide to eliminate pests"""
+        if self.pesticide <= 0:
+            self.show_message("No pesticide available!")
+            return 0
+
+        eliminated = 0
+        center = self.grid.cell_of(position[0], position[1])
+        for pest in self.pests.query_area(center, PESTICIDE_RADIUS):
+            self.remove_pest(pest)
+            eliminated += 1
+            self.add_stat("pests_eliminated")
+
+        if eliminated:
+            self.pesticide -= 1
+            self.show_message("Pests eliminated!")
+            self.play_sound("coin")
+        return eliminated
+
+    def prune_plant(self, position):
+        """Prune a plant to improve its health"""
+        plant = self.find_plant(position)
+        if not plant or plant["pruned"]:
+            return False
+
+        plant["pruned"] = True
+        plant["last_pruned"] = self.day_count
+        plant["pest_damage"] = max(0, plant["pest_damage"] - 0.2)
+        plant["disease_level"] = max(0, plant["disease_level"] - 0.1)
+        self.emit("plant_pruned", plant)
+
+        self.show_message("Plant pruned! Health improved.")
+        self.play_sound("coin")
+        return True
+
+    def check_plant_growth(self):
+        """Check plant growth at the start of each day"""
+        # Reduce fertilizer effect over time
+        fertilized = self.plants.column("fertilized")
+        fertilized[self.day_count - self.plants.column("last_fertilized") > 3] = False
+
+        # Reduce pruning effect over time
+        pruned = self.plants.column("pruned")
+        pruned[self.day_count - self.plants.column("last_pruned") > 5] = False
+
+    # Bulk actions
+    def quick_water_all(self):
+        """Quick water all plants"""
+        watered_count = 0
+        for plant in self.plants:
+            if plant["water_level"] < 2.0 and self.water_can_level > 0:
+                plant["water_level"] = 3.0
+                self.water_can_level -= 5
+                watered_count += 1
+                self.emit("plant_watered", plant)
+
+        if watered_count > 0:
+            self.show_message(f"Watered {watered_count} plants!")
+            self.play_sound("water")
+        return watered_count
+
+    def harvest_all_ready(self):
+        """Harvest all ready plants"""
+        harvested_count = 0
+        for plant in self.plants:
+            if plant["growth"] >= 1.0:
+                self.harvest_plant(plant["position"])
+                harvested_count += 1
+
+        if harvested_count > 0:
+            self.show_message(f"Harvested {harvested_count} plants!")
+        return harvested_count
+
+    def fertilize_all(self):
+        """Fertilize all unfertilized plants"""
+        fertilized_count = 0
+        for plant in self.plants:
+            if not plant["fertilized"] and self.fertilizer > 0:
+                plant["fertilized"] = True
+                plant["last_fertilized"] = self.day_count
+                self.fertilizer -= 1
+                fertilized_count += 1
+                self.emit("plant_fertilized", plant)
+
+        if fertilized_count > 0:
+            self.show_message(f"Fertilized {fertilized_count} plants!")
+        return fertilized_count
+
+    # Seasons and weather
+    def update_season(self):
+        """Update season based on day count"""
+        season_index = (self.day_count - 1) // 10 % 4
+        self.season = SEASONS[season_index]
+
+        # Update temperature based on season
+        if self.season == "Spring":
+            self.temperature = self.rng.randint(15, 25)
+        elif self.season == "Summer":
+            self.temperature = self.rng.randint(25, 35)
+        elif self.season == "Fall":
+            self.temperature = self.rng.randint(10, 20)
+        else:  # Winter
+            self.temperature = self.rng.randint(-5, 10)
+        self.update_growth_modifiers()
+
+    def change_weather(self):
+        """Change weather conditions"""
+        previous_weather = self.weather
+
+        # Adjust weights based on season
+        if self.season == "Spring":
+            weights = [0.3, 0.4, 0.2, 0.1]
+        elif self.season == "Summer":
+            weights = [0.5, 0.2, 0.2, 0.1]
+        elif self.season == "Fall":
+            weights = [0.3, 0.3, 0.3, 0.1]
+        else:  # Winter
+            weights = [0.2, 0.2, 0.2, 0.4]
+
+        self.weather = self.rng.choices(WEATHER_OPTIONS, weights=weights)[0]
+        self.update_growth_modifiers()
+
+        # Update humidity based on weather
+        if self.weather == "Rainy":
+            self.humidity = self.rng.randint(80, 100)
+        elif self.weather == "Stormy":
+            self.humidity = self.rng.randint(70, 90)
+        elif self.weather == "Snowy":
+            self.humidity = self.rng.randint(60, 80)
+        else:  # Sunny
+            self.humidity = self.rng.randint(30, 60)
+
+        self.emit("weather_changed", self.weather)
+        self.show_message(f"Weather changed to {self.weather}!")
+
+        # A storm counts as survived once the weather turns
+        if previous_weather == "Stormy" and self.weather != "Stormy":
+            self.add_stat("storms_survived")
+
+        if self.weather == "Rainy":
+            self.play_sound("rain")
+        elif self.weather == "Stormy":
+            self.play_sound("storm")
+
+    # Pests
+    def spawn_pest(self):
+        """Spawn a pest on a random plant"""
+        if not self.plants:
+            return None
+
+        plant = self.rng.choice(self.plants)
+        pest_type = self.rng.choice(self.pest_types)
+
+        pest_data = {
+            "id": self.next_pest_id,
+            "type": pest_type,
+            "position": plant["position"],
+            "damage": pest_type["damage"],
+            "speed": pest_type["speed"]
+        }
+        self.next_pest_id += 1
+
+        self.pests.insert(pest_data, self.grid.cell_of(*plant["position"]))
+        self.emit("pest_added", pest_data)
+        return pest_data
+
+    def remove_pest(self, pest):
+        """Remove a pest from the garden"""
+        self.pests.remove(pest)
+        self.emit("pest_removed", pest)
+
+    def update_pests(self):
+        """Update pest behavior"""
+        if not self.pests:
+            return
+
+        # Damage plants: one scatter-add of the summed pest damage per occupied cell
+        rows = [self.plants.rows[self.grid.plant_in(cell)] for cell in self.pests.cell_damage]
+        damage = np.fromiter(self.pests.cell_damage.values(), np.float64, len(rows))
+        pest_damage = self.plants.column("pest_damage")
+        np.add.at(pest_damage, rows, damage * 0.01)
+        pest_damage[rows] = np.minimum(pest_damage[rows], 1.0)
+
+        # Move pests to a random neighbouring plant
+        pests = list(self.pests)
+        for index in np.flatnonzero(self.np_rng.random(len(pests)) < 0.1):
+            pest = pests[index]
+            cell = self.pick_pest_target(pest["cell"])
+            if cell:
+                self.pests.move(pest, cell)
+                pest["position"] = self.grid.position_of(cell)
+                self.emit("pest_moved", pest)
+
+    def pick_pest_target(self, cell):
+        """Return a random neighbouring cell with a plant on it, if any"""
+        neighbours = []
+        for offset_x in (-1, 0, 1):
+            for offset_y in (-1, 0, 1):
+                if offset_x or offset_y:
+                    neighbour = (cell[0] + offset_x, cell[1] + offset_y)
+                    if self.grid.plant_in(neighbour) is not None:
+                        neighbours.append(neighbour)
+        return self.rng.choice(neighbours) if neighbours else None
+
+    # Progression
+    def add_stat(self, name, amount=1):
+        """Increase a statistic and announce the change"""
+        self.stats[name] += amount
+        self.emit("stat_changed", name, self.stats[name])
+
+    def on_stat_changed(self, name, value):
+        """Re-check the achievements that depend on a changed statistic"""
+        self.achievement_engine.stat_changed(name, self.stats)
+
+    def award_achievement(self, achievement):
+        """Award an achievement"""
+        self.achievements.append(achievement)
+        self.money += achievement["reward"]
+
+        self.emit("achievement", achievement)
+        self.play_sound("achievement")
+
+    def restore_achievement(self, achievement):
+        """Mark a saved achievement as earned without paying its reward again"""
+        if achievement["name"] not in self.achievement_engine.earned:
+            self.achievement_engine.earned.add(achievement["name"])
+            self.achievements.append(achievement)
+
+    def level_up(self):
+        """Handle level up"""
+        self.level += 1
+        self.experience = 0
+
+        # Unlock new tools
+        if self.level == 2 and "pesticide" not in self.tools_unlocked:
+            self.tools_unlocked.append("pesticide")
+            self.show_message("Pesticide tool unlocked!")
+        elif self.level == 3 and "prune" not in self.tools_unlocked:
+            self.tools_unlocked.append("prune")
+            self.show_message("Pruning tool unlocked!")
+
+        self.emit("level_up", self.level)
+        self.play_sound("level_up")
+
+    def upgrade_tool(self, tool):
+        """Upgrade a tool to next level"""
+        if self.tool_levels[tool] < 10 and self.skill_points >= self.tool_levels[tool] * 5:
+            self.skill_points -= self.tool_levels[tool] * 5
+            self.tool_levels[tool] += 1
+            self.tool_efficiency[tool] += 0.1
+            if tool == "fertilize":
+                self.update_fertilizer_modifier()
+            self.show_message(f"{tool.title()} upgraded to level {self.tool_levels[tool]}!")
+            return True
+        return False
+
+    def update_fertilizer_modifier(self):
+        """Scale the fertilizer growth bonus by the fertilize tool's efficiency"""
+        bonus = 1.0 + FERTILIZER_BONUS * self.tool_efficiency["fertilize"]
+        if self.growth_modifiers.fertilizer.set("base", bonus):
+            self.update_growth_modifiers()
+
+    # Shop
+    def buy_seeds(self, plant_index):
+        """Buy seeds from shop"""
+        plant = self.plant_types[plant_index]
+
+        if self.money >= plant["cost"]:
+            self.money -= plant["cost"]
+            self.seeds_inventory[plant_index] += 1
+            self.play_sound("coin")
+            return True
+        return False
+
+    def buy_fertilizer(self):
+        """Buy fertilizer from shop"""
+        if self.money >= 15:
+            self.money -= 15
+            self.fertilizer += 1
+            self.play_sound("coin")
+            return True
+        return False
+
+    def buy_pesticide(self):
+        """Buy pesticide from shop"""
+        if self.money >= 25:
+            self.money -= 25
+            self.pesticide += 1
+            self.play_sound("coin")
+            return True
+        return False
+
+    def refill_water(self):
+        """Refill water can"""
+        if self.money >= 5:
+            self.money -= 5
+            self.water_can_level = 100
+            self.play_sound("coin")
+            return True
+        return False
+
+    # Land
+    def land_price(self):
+        """Return the price of the next chunk of land"""
+        return LAND_PRICE * len(self.grid.owned)
+
+    def buy_land(self, chunk):
+        """Buy a chunk of land next to the garden"""
+        if chunk not in self.grid.purchasable():
+            self.show_message("That land is not for sale!")
+            return False
+
+        price = self.land_price()
+        if self.money < price:
+            self.show_message(f"Need ${price} to buy this land!")
+            return False
+
+        self.money -= price
+        self.restore_land(chunk)
+        self.show_message(f"Bought new land for ${price}!")
+        self.play_sound("coin")
+        return True
+
+    def restore_land(self, chunk):
+        """Add a chunk to the owned land without paying for it"""
+        self.grid.own(chunk)
+        self.emit("land_bought", chunk)
+
+    def saved_land(self, save_data):
+        """Return the land a save owns; older saves own the start and wherever they have plants"""
+        if "land" in save_data:
+            return {tuple(chunk) for chunk in save_data["land"]}
+
+        land = {self.grid.starting_chunk}
+        plants = save_data.get("plants", [])
+        if isinstance(plants, np.ndarray):
+            land |= self.grid.chunks_holding(plants["x"], plants["y"])
+        elif plants:
+            land |= self.grid.chunks_holding([plant["position"][0] for plant in plants],
+                                             [plant["position"][1] for plant in plants])
+        return land
+
+    # Persistence
+    def get_state(self):
+        """Return a plain-data copy of the saved game state"""
+        state = self.snapshot()
+        state["plants"] = plant_dicts(state["plants"])
+        return state
+
+    def snapshot(self):
+        """Return a cheap copy of the saved game state with plants as column arrays"""
+        return {
+            "money": self.money,
+            "experience": self.experience,
+            "level": self.level,
+            "tick_count": self.tick_count,
+            "day_count": self.day_count,
+            "day_time": self.day_time,
+            "season": self.season,
+            "weather": self.weather,
+            "seeds_inventory": list(self.seeds_inventory),
+            "fertilizer": self.fertilizer,
+            "pesticide": self.pesticide,
+            "water_can_level": self.water_can_level,
+            "achievements": copy.deepcopy(self.achievements),
+            "stats": dict(self.stats),
+            "land": sorted(list(chunk) for chunk in self.grid.owned),
+            "plants": self.plants.snapshot(),
+            "saved_at": time.time()
+        }
+
+    def load_state(self, save_data):
+        """Replace the current state with previously saved data"""
+        for plant in self.plants:
+            self.emit("plant_removed", plant)
+        for pest in self.pests:
+            self.emit("pest_removed", pest)
+        self.pests.clear()
+
+        self.money = save_data.get("money", 200)
+        self.experience = save_data.get("experience", 0)
+        self.level = save_data.get("level", 1)
+
+        # Keep ticks counting on from the save so journal entries line up with it
+        tick_count = save_data.get("tick_count", self.tick_count)
+        self.scheduler.shift(tick_count - self.tick_count)
+        self.tick_count = tick_count
+        self.day_count = save_data.get("day_count", 1)
+        self.day_time = save_data.get("day_time", 0.5)
+        self.season = save_data.get("season", "Spring")
+        self.weather = save_data.get("weather", "Sunny")
+        self.update_growth_modifiers()
+        self.seeds_inventory = save_data.get("seeds_inventory", [10, 8, 5, 3, 2, 1])
+        self.fertilizer = save_data.get("fertilizer", 5)
+        self.pesticide = save_data.get("pesticide", 3)
+        self.water_can_level = save_data.get("water_can_level", 100)
+        self.achievements = save_data.get("achievements", [])
+        self.stats = new_stats()
+        self.stats.update(save_data.get("stats", {}))
+        self.achievement_engine.reset([achievement["name"] for achievement in self.achievements], self.stats)
+
+        # Recreate the land, then the plants on it
+        self.plants.clear()
+        self.grid.clear_plants()
+        self.grid.set_land(self.saved_land(save_data))
+        self.emit("land_changed")
+        plants = save_data.get("plants", [])
+        if isinstance(plants, np.ndarray):
+            self.load_plant_records(plants)
+        else:
+            for plant_data in plants:
+                position = plant_data["position"]
+                if self.grid.plot_at(position) is None or self.grid.plant_at(position) is not None:
+                    continue
+                plant = self.plants.add(plant_data)
+                self.grid.attach(position, plant.id)
+                self.emit("plant_added", plant)
+        self.schedule_disease()
+        self.emit("weather_changed", self.weather)
+
+    def load_plant_records(self, records):
+        """Bulk-load plants from a binary save's record array"""
+        ids = self.plants.extend(records)
+        for plant_id in self.grid.attach_many(records["x"], records["y"], ids):
+            self.plants.remove(self.plants.record(plant_id))
+        if self.listeners.get("plant_added"):
+            for plant in self.plants:
+                self.emit("plant_added", plant)
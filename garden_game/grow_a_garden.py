@@ -1,8 +1,6 @@
-import sys
 import random
 import math
 import time
-import json
 import os
 import threading
 from datetime import datetime, timedelta
@@ -10,12 +8,38 @@ import colorsys
 from direct.showbase.ShowBase import ShowBase
 from direct.task import Task
 from direct.actor.Actor import Actor
-from direct.interval.IntervalGlobal import Sequence, LerpPosInterval, LerpScaleInterval, Parallel, Func, Wait, LerpFunc, LerpColorInterval
+from direct.interval.IntervalGlobal import Sequence, LerpScaleInterval, Parallel, Func, Wait, LerpFunc, LerpColorInterval
 #
 from direct.gui.OnscreenText import OnscreenText
+from direct.gui.OnscreenImage import OnscreenImage
 #
+from direct.gui.DirectGui import DirectButton, DirectFrame, DirectDialog
 from direct.showbase import DirectObject
-from panda3d.core import loadPrcFileData
+from panda3d.core import (
+    Vec4, TextNode,
+    AmbientLight, DirectionalLight
+)
+from panda3d.core import loadPrcFileData, ConfigVariableInt
+
+from garden_simulation import GardenSimulation
+from garden_grid import GARDEN_SIZE
+from garden_chunks import GardenChunks
+from simulation_clock import SimulationClock
+from render_sync import PlantRenderSync, DIRTY_STAGE, DIRTY_TINT, DIRTY_MOISTURE
+from plot_geometry import PlotMesh, PLOT_COLOR, WET_PLOT_COLOR
+from plant_instancing import PlantInstancer
+from picking import GardenPicker
+from input_controller import ToolInputController
+from hud import Hud
+from notifications import NotificationCenter
+from offline_progress import catch_up
+from persistence import SaveWriter
+from save_format import encode_binary
+from save_slots import SaveSlots, capture_frame, encode_index, encode_thumbnail
+from weather_particles import WeatherParticles
+from effects import EffectManager
+from day_cycle import DayCycleLighting
+from save_journal import SaveJournal, read_journal, replay
 
 # Configure the game window
 loadPrcFileData("", "window-title Grow A Garden - Enhanced Edition")
@@ -26,20 +50,13 @@ class EnhancedGardenGame(ShowBase):
     def __init__(self):
         ShowBase.__init__(self)
         
+        # Headless simulation core: plants, pests, weather, economy and stats
+        garden_size = ConfigVariableInt("garden-size", GARDEN_SIZE, "Plots along each side of the garden")
+        self.sim = GardenSimulation(garden_size=garden_size.getValue())
+        self.sim_clock = SimulationClock()
+        
         # MASSIVELY ENHANCED GAME STATE - 300+ IMPROVEMENTS
-        self.money = 1000  # Starting money increased
-        self.experience = 0
-        self.level = 1
         self.prestige_level = 0  # NEW: Prestige system
-        self.skill_points = 0  # NEW: Skill points for upgrades
-        self.day_time = 0.5  # 0.0 to 1.0 (0 = night, 1 = day)
-        self.day_night_cycle_speed = 0.003  # Even slower for realism
-        self.day_count = 1
-        self.season = "Spring"  # Spring, Summer, Fall, Winter
-        self.weather = "Sunny"  # Sunny, Rainy, Stormy, Snowy, Foggy, Windy
-        self.temperature = 20  # Celsius
-        self.humidity = 50  # Percentage
-        self.wind_speed = 5  # NEW: Wind system
         self.air_quality = 100  # NEW: Air quality affects plants
         self.soil_ph = 7.0  # NEW: Soil pH system
         self.soil_nutrients = {"nitrogen": 50, "phosphorus": 50, "potassium": 50}  # NEW: Detailed soil nutrients
@@ -97,11 +114,8 @@ class EnhancedGardenGame(ShowBase):
         # MASSIVELY ENHANCED TOOLS AND SYSTEMS - 100+ IMPROVEMENTS
         self.selected_tool = "plant"
         self.selected_seed = 0
-        self.plants = []
         
         # NEW: Advanced Tool System
-        self.tool_levels = {"plant": 1, "water": 1, "harvest": 1, "fertilize": 1, "pesticide": 1, "prune": 1, "analyze": 1, "breed": 1, "clone": 1, "graft": 1}
-        self.tool_efficiency = {"plant": 1.0, "water": 1.0, "harvest": 1.0, "fertilize": 1.0, "pesticide": 1.0, "prune": 1.0, "analyze": 1.0, "breed": 1.0, "clone": 1.0, "graft": 1.0}
         self.tool_durability = {"plant": 100, "water": 100, "harvest": 100, "fertilize": 100, "pesticide": 100, "prune": 100, "analyze": 100, "breed": 100, "clone": 100, "graft": 100}
         self.tool_upgrades = {"plant": [], "water": [], "harvest": [], "fertilize": [], "pesticide": [], "prune": [], "analyze": [], "breed": [], "clone": [], "graft": []}
         
@@ -180,55 +194,13 @@ class EnhancedGardenGame(ShowBase):
         self.sound_effects = []
         self.audio_processing = []
         self.decorations = []
-        self.pests = []
-        self.achievements = []
-        
-        # Enhanced inventory system
-        self.seeds_inventory = [10, 8, 5, 3, 2, 1]  # More plant types
-        self.fertilizer = 5
-        self.pesticide = 3
-        self.water_can_level = 100
-        self.tools_unlocked = ["plant", "water", "harvest", "fertilize", "pesticide", "prune"]
-        
-        # Enhanced plant types with realistic properties
-        self.plant_types = [
-            {
-                "name": "Carrot", "cost": 8, "growth_time": 12, "value": 15, 
-                "color": (0.9, 0.5, 0.1, 1), "experience": 5, "size": 0.8,
-                "season": "Spring", "water_needs": 3, "sun_needs": 2,
-                "pest_resistance": 0.7, "disease_resistance": 0.8
-            },
-            {
-                "name": "Tomato", "cost": 15, "growth_time": 18, "value": 35, 
-                "color": (1.0, 0.2, 0.2, 1), "experience": 10, "size": 1.0,
-                "season": "Summer", "water_needs": 4, "sun_needs": 3,
-                "pest_resistance": 0.5, "disease_resistance": 0.6
-            },
-            {
-                "name": "Pumpkin", "cost": 25, "growth_time": 25, "value": 60, 
-                "color": (1.0, 0.6, 0.1, 1), "experience": 15, "size": 1.5,
-                "season": "Fall", "water_needs": 5, "sun_needs": 2,
-                "pest_resistance": 0.8, "disease_resistance": 0.7
-            },
-            {
-                "name": "Sunflower", "cost": 20, "growth_time": 15, "value": 30, 
-                "color": (1.0, 0.9, 0.1, 1), "experience": 12, "size": 1.2,
-                "season": "Summer", "water_needs": 3, "sun_needs": 4,
-                "pest_resistance": 0.6, "disease_resistance": 0.8
-            },
-            {
-                "name": "Rose", "cost": 35, "growth_time": 20, "value": 80, 
-                "color": (1.0, 0.1, 0.3, 1), "experience": 20, "size": 1.0,
-                "season": "Spring", "water_needs": 4, "sun_needs": 3,
-                "pest_resistance": 0.4, "disease_resistance": 0.5
-            },
-            {
-                "name": "Cactus", "cost": 40, "growth_time": 30, "value": 100, 
-                "color": (0.3, 0.7, 0.3, 1), "experience": 25, "size": 0.6,
-                "season": "Summer", "water_needs": 1, "sun_needs": 5,
-                "pest_resistance": 0.9, "disease_resistance": 0.9
-            }
-        ]
+        
+        # Scene-graph mirrors of simulation objects, grouped into culled, LOD-switched chunks
+        self.garden_chunks = GardenChunks(self.sim.grid, self.render)
+        self.plant_instancer = PlantInstancer(self.garden_chunks, self.sim.plant_types)
+        self.effects = EffectManager(self.render, self.taskMgr)  # Pooled splashes and sparkles, owned by plot position
+        self.pest_models = {}  # pest id -> pest NodePath
+        self.render_sync = PlantRenderSync(self.sim.plants, self.update_plant_model)
         
         # Enhanced decoration types
         self.decoration_types = [
@@ -240,32 +212,37 @@ class EnhancedGardenGame(ShowBase):
             {"name": "Garden Bench", "cost": 150, "model": "bench", "unlock_level": 5}
         ]
         
-        # Pest types
-        self.pest_types = [
-            {"name": "Aphids", "damage": 0.1, "speed": 0.5, "color": (0.8, 0.2, 0.2, 1)},
-            {"name": "Caterpillars", "damage": 0.15, "speed": 0.3, "color": (0.2, 0.8, 0.2, 1)},
-            {"name": "Beetles", "damage": 0.2, "speed": 0.4, "color": (0.2, 0.2, 0.8, 1)},
-            {"name": "Slugs", "damage": 0.12, "speed": 0.2, "color": (0.5, 0.5, 0.5, 1)}
-        ]
-        
-        # Achievement system
-        self.achievement_types = [
-            {"name": "First Plant", "description": "Plant your first seed", "reward": 50, "condition": "plants_planted >= 1"},
-            {"name": "Green Thumb", "description": "Plant 10 seeds", "reward": 100, "condition": "plants_planted >= 10"},
-            {"name": "Harvest Master", "description": "Harvest 25 plants", "reward": 200, "condition": "plants_harvested >= 25"},
-            {"name": "Weather Warrior", "description": "Survive 5 storms", "reward": 150, "condition": "storms_survived >= 5"},
-            {"name": "Pest Hunter", "description": "Eliminate 20 pests", "reward": 100, "condition": "pests_eliminated >= 20"}
-        ]
-        
-        # Statistics tracking
-        self.stats = {
-            "plants_planted": 0,
-            "plants_harvested": 0,
-            "storms_survived": 0,
-            "pests_eliminated": 0,
-            "money_earned": 0,
-            "days_played": 0
-        }
+        # Toasts share a fixed pool of text nodes
+        self.notifications = NotificationCenter(self.taskMgr)
+        
+        # Saves are encoded and written on a worker thread; the window closing saves too
+        self.save_path = "garden_save.sav"
+        self.legacy_save_path = "garden_save.json"  # Read once to migrate old JSON saves
+        self.save_slots = SaveSlots()
+        self.slot_thumbnails = {}  # Save path -> thumbnail captured when the save was requested
+        self.save_writer = SaveWriter()
+        self.exitFunc = self.save_on_exit
+        
+        # Player actions between saves go to an append-only journal for crash recovery
+        self.journal = SaveJournal(self.sim, self.save_path + ".journal")
+        self.journal_save_entries = 500  # Take a full save once the journal grows this long
+        
+        # Mirror simulation events into the scene graph
+        self.sim.subscribe("message", self.show_message)
+        self.sim.subscribe("sound", self.play_sound)
+        self.sim.subscribe("plant_added", self.create_enhanced_plant_model)
+        self.sim.subscribe("plant_removed", self.remove_plant_model)
+        self.sim.subscribe("plant_watered", self.create_water_effect)
+        self.sim.subscribe("plant_fertilized", self.create_fertilizer_effect)
+        self.sim.subscribe("pest_added", self.create_pest_model)
+        self.sim.subscribe("pest_moved", self.update_pest_model)
+        self.sim.subscribe("pest_removed", self.remove_pest_model)
+        self.sim.subscribe("achievement", self.show_achievement_notification)
+        self.sim.subscribe("level_up", self.show_level_up)
+        self.sim.subscribe("auto_save", self.save_game)
+        self.sim.subscribe("land_bought", self.update_land)
+        self.sim.subscribe("land_changed", self.update_land)
+        self.sim.schedule_auto_save(self.sim_clock.tick_rate * self.auto_save_interval)
         
         # Setup all game systems
         self.setup_camera()
@@ -281,20 +258,19 @@ class EnhancedGardenGame(ShowBase):
         
         # Game state
         self.is_paused = False
-        self.day_night_cycle_enabled = True
         self.sound_enabled = True
         self.show_achievements = False
         
         # Task for game updates
         self.taskMgr.add(self.update, "update_task")
         self.taskMgr.add(self.weather_update, "weather_task")
-        self.taskMgr.add(self.pest_spawn_task, "pest_spawn_task")
         
         # Background music and sounds
         self.setup_enhanced_audio()
         
-        # Load saved game if exists
+        # Load saved game if exists, and read the last used slot ahead of the load dialog
         self.load_game()
+        self.save_slots.preload()
         
         # Initial tutorial
         self.show_enhanced_tutorial()
@@ -340,11 +316,14 @@ class EnhancedGardenGame(ShowBase):
             self.storm_sound = None
             self.bird_sounds = []
     
+    def play_sound(self, name):
+        """Play a sound effect requested by the simulation"""
+        sound = getattr(self, f"{name}_sound", None)
+        if self.sound_enabled and sound:
+            sound.play()
+    
     def setup_weather_system(self):
         """Setup dynamic weather system"""
-        self.weather_timer = 0
-        self.weather_change_interval = 300  # 5 minutes
-        self.rain_particles = []
         self.storm_lightning = []
         
         # Weather effects
@@ -352,17 +331,8 @@ class EnhancedGardenGame(ShowBase):
     
     def create_weather_effects(self):
         """Create visual weather effects"""
-        from panda3d.core import CardMaker
-        
-        # Rain particles
-        for i in range(100):
-            rain_cm = CardMaker(f"rain_{i}")
-            rain_cm.setFrame(-0.01, 0.01, -0.1, 0.1)
-            rain_drop = self.render.attachNewNode(rain_cm.generate())
-            rain_drop.setPos(random.uniform(-20, 20), random.uniform(-20, 20), random.uniform(10, 20))
-            rain_drop.setColor(0.3, 0.6, 1.0, 0.7)
-            rain_drop.hide()
-            self.rain_particles.append(rain_drop)
+        # Rain and snow share one NumPy-driven particle buffer
+        self.weather_particles = WeatherParticles(self.render)
         
         # Lightning effects
         for i in range(5):
@@ -404,12 +374,15 @@ class EnhancedGardenGame(ShowBase):
         
         # Enhanced cursor
         self.create_enhanced_cursor()
+        
+        # Redraw HUD widgets only when the values they show change
+        self.setup_hud_bindings()
     
     def create_status_panel(self):
         """Create enhanced status display panel"""
         # Money display with icon
         self.money_text = OnscreenText(
-            text=f"💰 ${self.money}",
+            text=f"💰 ${self.sim.money}",
             pos=(-1.3, 0.95),
             scale=0.08,
             align=TextNode.ALeft,
@@ -420,7 +393,7 @@ class EnhancedGardenGame(ShowBase):
         
         # Experience and level with progress bar
         self.exp_text = OnscreenText(
-            text=f"⭐ Level {self.level} | XP: {self.experience}/{self.level*100}",
+            text=f"⭐ Level {self.sim.level} | XP: {self.sim.experience}/{self.sim.level*100}",
             pos=(-1.3, 0.88),
             scale=0.07,
             align=TextNode.ALeft,
@@ -431,7 +404,7 @@ class EnhancedGardenGame(ShowBase):
         
         # Day and time with season
         self.time_text = OnscreenText(
-            text=f"📅 Day {self.day_count} | {self.season} | {'☀️ Day' if self.day_time > 0.25 and self.day_time < 0.75 else '🌙 Night'}",
+            text=f"📅 Day {self.sim.day_count} | {self.sim.season} | {'☀️ Day' if self.sim.day_time > 0.25 and self.sim.day_time < 0.75 else '🌙 Night'}",
             pos=(-1.3, 0.81),
             scale=0.07,
             align=TextNode.ALeft,
@@ -442,7 +415,7 @@ class EnhancedGardenGame(ShowBase):
         
         # Weather display
         self.weather_text = OnscreenText(
-            text=f"🌤️ {self.weather} | 🌡️ {self.temperature}°C | 💧 {self.humidity}%",
+            text=f"🌤️ {self.sim.weather} | 🌡️ {self.sim.temperature}°C | 💧 {self.sim.humidity}%",
             pos=(-1.3, 0.74),
             scale=0.07,
             align=TextNode.ALeft,
@@ -453,7 +426,7 @@ class EnhancedGardenGame(ShowBase):
         
         # Water can level
         self.water_text = OnscreenText(
-            text=f"💧 Water: {self.water_can_level}%",
+            text=f"💧 Water: {self.sim.water_can_level}%",
             pos=(-1.3, 0.67),
             scale=0.07,
             align=TextNode.ALeft,
@@ -492,9 +465,9 @@ class EnhancedGardenGame(ShowBase):
     def create_inventory_panel(self):
         """Create enhanced inventory panel"""
         self.seed_buttons = []
-        for i, plant in enumerate(self.plant_types):
+        for i, plant in enumerate(self.sim.plant_types):
             btn = DirectButton(
-                text=f"{plant['name']} ({self.seeds_inventory[i]})",
+                text=f"{plant['name']} ({self.sim.seeds_inventory[i]})",
                 scale=0.06,
                 pos=(-1.3, 0, -0.7 - i * 0.08),
                 command=self.select_seed,
@@ -504,7 +477,7 @@ class EnhancedGardenGame(ShowBase):
                 text_scale=0.8,
                 frameSize=(-0.15, 0.15, -0.03, 0.03),
                 relief=2,
-                state='DISABLED' if self.seeds_inventory[i] <= 0 else 'NORMAL'
+                state='DISABLED' if self.sim.seeds_inventory[i] <= 0 else 'NORMAL'
             )
             self.seed_buttons.append(btn)
         
@@ -655,6 +628,7 @@ class EnhancedGardenGame(ShowBase):
         self.accept("f", self.fertilize_all)
         self.accept("p", self.quick_pesticide_all)
         self.accept("r", self.prune_all)
+        self.accept("shift-d", self.toggle_drag_paint)
         self.accept("ctrl-w", self.smart_water_all)
         self.accept("ctrl-h", self.smart_harvest_all)
         self.accept("ctrl-f", self.smart_fertilize_all)
@@ -676,15 +650,18 @@ class EnhancedGardenGame(ShowBase):
         # NEW: Game State Controls
         self.accept("d", self.toggle_day_night_cycle)
         self.accept("s", self.toggle_sound)
-        self.accept("space", self.toggle_pause_game)
+        self.accept("shift-p", self.toggle_pause_game)
         self.accept("ctrl-space", self.toggle_slow_motion)
         self.accept("shift-space", self.toggle_fast_forward)
+        self.accept("shift-h", self.skip_to_next_harvest)
+        self.accept("shift-b", self.buy_land_under_mouse)
+        self.accept("alt-space", self.toggle_turbo)
         self.accept("ctrl-t", self.toggle_time_controls)
         self.accept("ctrl-s", self.toggle_sound_settings)
         
         # NEW: Camera Controls
-        self.accept("mouse1", self.start_rotate)
-        self.accept("mouse1-up", self.stop_rotate)
+        self.accept("mouse3", self.start_rotate)
+        self.accept("mouse3-up", self.stop_rotate)
         self.accept("wheel_up", self.zoom_in)
         self.accept("wheel_down", self.zoom_out)
         self.accept("arrow_up", self.move_camera, ["up"])
@@ -749,8 +726,8 @@ class EnhancedGardenGame(ShowBase):
         # NEW: Save and Load Controls
         self.accept("ctrl-s", self.quick_save)
         self.accept("ctrl-l", self.quick_load)
-        self.accept("ctrl-shift-s", self.save_as)
-        self.accept("ctrl-shift-l", self.load_from)
+        self.accept("alt-s", self.save_as)
+        self.accept("alt-l", self.load_from)
         self.accept("ctrl-alt-s", self.auto_save_toggle)
         
         # NEW: Help and Tutorial Controls
@@ -758,7 +735,7 @@ class EnhancedGardenGame(ShowBase):
         self.accept("f2", self.show_tutorial)
         self.accept("f3", self.show_controls)
         self.accept("f4", self.show_tips)
-        self.accept("f5", self.show_achievements)
+        self.accept("f5", self.toggle_achievements)
         self.accept("f6", self.show_statistics)
         self.accept("f7", self.show_settings)
         self.accept("f8", self.show_about)
@@ -795,8 +772,8 @@ class EnhancedGardenGame(ShowBase):
         self.accept("ctrl-shift-c", self.calibrate_eye_tracking)
         
         # Camera controls
-        self.accept("mouse1", self.start_rotate)
-        self.accept("mouse1-up", self.stop_rotate)
+        self.accept("mouse3", self.start_rotate)
+        self.accept("mouse3-up", self.stop_rotate)
         self.accept("wheel_up", self.zoom_in)
         self.accept("wheel_down", self.zoom_out)
         self.accept("arrow_up", self.move_camera, [0, 1])
@@ -817,14 +794,31 @@ class EnhancedGardenGame(ShowBase):
         self.camera.lookAt(0, 0, 0)
         
         self.disableMouse()
-        self.camera_control = {"rotate": False, "last_x": 0, "last_y": 0, "zoom": 20}
+        # Larger gardens can be panned across and zoomed out far enough to see whole
+        low, high = self.sim.grid.extent()
+        self.camera_control = {"rotate": False, "last_x": 0, "last_y": 0, "zoom": 20,
+                               "max_zoom": max(50, (high - low) * 0.6), "limit": max(50, high + 25)}
     
     def setup_lights(self):
         """Setup enhanced lighting system"""
         # Ambient light
-        #
+        self.ambient_light = AmbientLight("ambient_light")
+        self.ambient_light.setColor(Vec4(0.4, 0.4, 0.4, 1))
+        self.ambient_light_node = self.render.attachNewNode(self.ambient_light)
+        self.render.setLight(self.ambient_light_node)
+        
+        # Directional light (sun/moon)
+        self.sun_light = DirectionalLight("sun_light")
+        self.sun_light.setColor(Vec4(0.8, 0.8, 0.8, 1))
+        self.sun_light_node = self.render.attachNewNode(self.sun_light)
+        self.render.setLight(self.sun_light_node)
+        
         # Weather lighting
-       #
+        self.weather_light = AmbientLight("weather_light")
+        self.weather_light.setColor(Vec4(0.5, 0.5, 0.7, 1))
+        self.weather_light_node = self.render.attachNewNode(self.weather_light)
+        self.render.setLight(self.weather_light_node)
+    
     def setup_sky(self):
         """Setup enhanced sky system"""
         # Create dynamic sky using built-in geometry
@@ -840,10 +834,10 @@ class EnhancedGardenGame(ShowBase):
         self.sky_sphere.setDepthWrite(False)
         self.sky_sphere.setTwoSided(True)
         
-        # Set sky color
-        self.sky_sphere.setColor(0.3, 0.5, 0.8, 1)
-        
-        self.update_sky()
+        # Lights and sky follow curves precomputed over the day
+        self.day_cycle = DayCycleLighting(self.sun_light, self.sun_light_node, self.ambient_light,
+                                          self.weather_light, self.sky_sphere)
+        self.day_cycle.update(self.sim.day_time, self.sim.weather)
     
     def setup_ground(self):
         """Setup enhanced ground with better textures"""
@@ -851,577 +845,193 @@ class EnhancedGardenGame(ShowBase):
         
         # Main ground using built-in geometry
         cm = CardMaker("ground")
-        cm.setFrame(-25, 25, -25, 25)
+        ground_size = max(25, self.sim.grid.extent()[1] + 14)
+        cm.setFrame(-ground_size, ground_size, -ground_size, ground_size)
         self.ground = self.render.attachNewNode(cm.generate())
         self.ground.setPos(0, 0, 0)
         self.ground.setColor(0.2, 0.6, 0.2, 1)  # Green grass color
         
-        # Enhanced planting grid
-        self.plot_positions = []
-        for x in range(-10, 11, 2):
-            for y in range(-10, 11, 2):
-                # Create plot using built-in geometry
-                plot_cm = CardMaker(f"plot_{x}_{y}")
-                plot_cm.setFrame(-0.8, 0.8, -0.8, 0.8)
-                plot = self.render.attachNewNode(plot_cm.generate())
-                plot.setPos(x, y, 0.05)
-                plot.setColor(0.4, 0.2, 0.1, 1)  # Brown dirt color
-                
-                # Add plot borders
-                border_cm = CardMaker(f"border_{x}_{y}")
-                border_cm.setFrame(-0.9, 0.9, -0.9, 0.9)
-                border = self.render.attachNewNode(border_cm.generate())
-                border.setPos(x, y, 0.02)
-                border.setColor(0.3, 0.2, 0.1, 1)
-                
-                self.plot_positions.append((x, y))
+        # Lay the ground flat; CardMaker builds cards in the XZ plane
+        self.ground.setP(-90)
+        
+        # Enhanced planting grid: plots and borders batched into one node per chunk
+        self.plot_mesh = PlotMesh(self.sim.grid, self.garden_chunks)
     
     def setup_collision(self):
-        """Setup enhanced collision detection"""
-        self.collision_traverser = CollisionTraverser()
-        self.collision_handler = CollisionHandlerQueue()
-        
-        collider_node = CollisionNode("mouse_ray")
-        collider_node.setFromCollideMask(BitMask32.bit(0))
-        collider_node.addSolid(CollisionRay())
-        self.collider = self.camera.attachNewNode(collider_node)
+        """Setup mouse picking for plots"""
+        # Plots are picked on the ground plane; no collision traversal is needed
+        self.picker = GardenPicker(self.cam, self.camNode, self.render, self.sim.grid)
         
-        self.collision_traverser.addCollider(self.collider, self.collision_handler)
+        # Tools are applied on mouse1 events, once per plot per stroke
+        self.tool_input = ToolInputController(self, self.picker, self.use_tool_on_plot)
     
     # Core game methods
     def update(self, task):
         """Main game update loop"""
+        self.report_saves()
+        self.journal.sync_economy()
+        if self.journal.entries_since_save >= self.journal_save_entries:
+            self.save_game()
+        
         if self.is_paused:
             return Task.cont
             
-        # Update day/night cycle
-        if self.day_night_cycle_enabled:
-            self.day_time = (self.day_time + self.day_night_cycle_speed) % 1.0
-            if self.day_time < 0.01:
-                self.day_count += 1
-                self.stats["days_played"] += 1
-                self.check_plant_growth()
-                self.update_season()
-            
-            self.update_lights()
-            self.update_sky()
+        # Advance the simulation by the fixed ticks owed for this frame
+        ticks = self.sim_clock.advance(globalClock.getDt())
+        self.sim.advance(ticks)
         
-        # Update weather
-        self.weather_timer += 1
-        if self.weather_timer >= self.weather_change_interval:
-            self.change_weather()
-            self.weather_timer = 0
+        # Update day/night cycle
+        if self.sim.day_night_cycle_enabled:
+            self.day_cycle.update(self.sim.day_time, self.sim.weather)
         
         # Update UI
         self.update_ui()
         
-        # Handle mouse clicks
-        self.handle_mouse_clicks()
+        # Build chunks of owned land as they come into view
+        self.garden_chunks.update(self.cam)
         
-        # Update plants
-        self.update_plants()
-        
-        # Update pests
-        self.update_pests()
-        
-        # Check achievements
-        self.check_achievements()
+        # Mirror changed plant visuals into the scene graph
+        self.render_sync.sync()
+        self.plant_instancer.flush()
+        self.garden_chunks.flush()
         
         return Task.cont
     
-    def update_ui(self):
-        """Update all UI elements"""
-        self.money_text.setText(f"💰 ${self.money}")
-        self.exp_text.setText(f"⭐ Level {self.level} | XP: {self.experience}/{self.level*100}")
-        
-        time_of_day = "☀️ Day" if self.day_time > 0.25 and self.day_time < 0.75 else "🌙 Night"
-        self.time_text.setText(f"📅 Day {self.day_count} | {self.season} | {time_of_day}")
-        
-        self.weather_text.setText(f"🌤️ {self.weather} | 🌡️ {self.temperature}°C | 💧 {self.humidity}%")
-        self.water_text.setText(f"💧 Water: {self.water_can_level}%")
-        
-        # Update seed buttons
+    def setup_hud_bindings(self):
+        """Bind every HUD widget to the state fields it displays"""
+        sim = self.sim
+        self.hud = Hud()
+        
+        self.hud.bind_text(self.money_text, lambda: (sim.money,), lambda money: f"💰 ${money}")
+        self.hud.bind_text(self.exp_text, lambda: (sim.level, sim.experience),
+                           lambda level, experience: f"⭐ Level {level} | XP: {experience}/{level*100}")
+        self.hud.bind_text(self.time_text, lambda: (sim.day_count, sim.season, sim.is_daytime()),
+                           lambda day, season, daytime: f"📅 Day {day} | {season} | {'☀️ Day' if daytime else '🌙 Night'}")
+        self.hud.bind_text(self.weather_text, lambda: (sim.weather, sim.temperature, sim.humidity),
+                           lambda weather, temperature, humidity: f"🌤️ {weather} | 🌡️ {temperature}°C | 💧 {humidity}%")
+        self.hud.bind_text(self.water_text, lambda: (sim.water_can_level,), lambda level: f"💧 Water: {level}%")
+        
+        # Seed buttons
         for i, btn in enumerate(self.seed_buttons):
-            btn["text"] = f"{self.plant_types[i]['name']} ({self.seeds_inventory[i]})"
-            btn["state"] = 'DISABLED' if self.seeds_inventory[i] <= 0 else 'NORMAL'
-            if i == self.selected_seed:
-                btn["frameColor"] = (0.5, 0.5, 0.2, 1)
-            else:
-                btn["frameColor"] = (0.3, 0.3, 0.3, 0.8)
-        
-        # Update tool buttons
+            name = sim.plant_types[i]["name"]
+            self.hud.bind_option(btn, "text", lambda i=i: sim.seeds_inventory[i],
+                                 lambda count, name=name: f"{name} ({count})")
+            self.hud.bind_option(btn, "state", lambda i=i: sim.seeds_inventory[i] <= 0,
+                                 lambda empty: 'DISABLED' if empty else 'NORMAL')
+            self.hud.bind_option(btn, "frameColor", lambda i=i: i == self.selected_seed,
+                                 lambda selected: (0.5, 0.5, 0.2, 1) if selected else (0.3, 0.3, 0.3, 0.8))
+        
+        # Tool buttons
         for btn in self.tool_buttons:
             tool = btn["extraArgs"][0]
-            if tool == self.selected_tool:
-                btn["frameColor"] = (0.2, 0.6, 0.2, 1)
-            else:
-                btn["frameColor"] = (0.3, 0.3, 0.3, 0.8)
+            self.hud.bind_option(btn, "frameColor", lambda tool=tool: tool == self.selected_tool,
+                                 lambda selected: (0.2, 0.6, 0.2, 1) if selected else (0.3, 0.3, 0.3, 0.8))
     
-    def handle_mouse_clicks(self):
-        """Handle mouse click interactions"""
-        if self.mouseWatcherNode.hasMouse() and self.mouseWatcherNode.isButtonDown(MouseButton.one()):
-            mpos = self.mouseWatcherNode.getMouse()
-            
-            # Create a new collision ray for each click
-            from panda3d.core import CollisionRay
-            ray = CollisionRay()
-            ray.setFromLens(self.camNode, mpos.getX(), mpos.getY())
-            
-            # Update the collider with the new ray
-            self.collider.node().setSolid(0, ray)
-            
-            # Do collision check
-            self.collision_traverser.traverse(self.render)
-            
-            if self.collision_handler.getNumEntries() > 0:
-                self.collision_handler.sortEntries()
-                entry = self.collision_handler.getEntry(0)
-                hit_point = entry.getSurfacePoint(self.render)
-                
-                # Find closest plot
-                closest_plot = None
-                min_dist = float('inf')
-                for plot_x, plot_y in self.plot_positions:
-                    dist = (hit_point.getX() - plot_x)**2 + (hit_point.getY() - plot_y)**2
-                    if dist < min_dist:
-                        min_dist = dist
-                        closest_plot = (plot_x, plot_y)
-                
-                if closest_plot and min_dist < 1.0:
-                    self.use_tool_on_plot(closest_plot)
+    def update_ui(self):
+        """Update the HUD widgets whose values changed"""
+        self.hud.refresh()
     
     def use_tool_on_plot(self, position):
         """Use selected tool on a plot"""
         if self.selected_tool == "plant":
-            self.plant_seed(position)
+            self.sim.plant_seed(position, self.selected_seed)
         elif self.selected_tool == "water":
-            self.water_plant(position)
+            self.sim.water_plant(position)
         elif self.selected_tool == "harvest":
-            self.harvest_plant(position)
+            self.sim.harvest_plant(position)
         elif self.selected_tool == "fertilize":
-            self.fertilize_plant(position)
+            self.sim.fertilize_plant(position)
         elif self.selected_tool == "pesticide":
-            self.use_pesticide(position)
+            self.sim.use_pesticide(position)
         elif self.selected_tool == "prune":
-            self.prune_plant(position)
+            self.sim.prune_plant(position)
     
     def set_tool(self, tool):
         """Set the selected tool"""
-        if tool in self.tools_unlocked:
+        if tool in self.sim.tools_unlocked:
             self.selected_tool = tool
             self.cursor.setText(self.tool_effects.get(tool, "+"))
             self.cursor.show()
     
     def select_seed(self, seed_index):
         """Select a seed type"""
-        if self.seeds_inventory[seed_index] > 0:
+        if self.sim.seeds_inventory[seed_index] > 0:
             self.selected_seed = seed_index
             self.set_tool("plant")
     
     def change_seed(self, direction):
         """Change selected seed type"""
-        new_index = (self.selected_seed + direction) % len(self.plant_types)
-        if self.seeds_inventory[new_index] > 0:
+        new_index = (self.selected_seed + direction) % len(self.sim.plant_types)
+        if self.sim.seeds_inventory[new_index] > 0:
             self.selected_seed = new_index
     
-    # Plant management methods
-    def plant_seed(self, position):
-        """Plant a seed at the specified position"""
-        # Check if plot is empty
-        for plant in self.plants:
-            if plant["position"] == position:
-                return
-        
-        # Check if we have seeds
-        if self.seeds_inventory[self.selected_seed] <= 0:
-            return
-        
-        # Check if plant is suitable for current season
-        plant_type = self.plant_types[self.selected_seed]
-        if plant_type["season"] != self.season and plant_type["season"] != "All":
-            self.show_message(f"{plant_type['name']} can only be planted in {plant_type['season']}!")
-            return
-        
-        # Deduct seed from inventory
-        self.seeds_inventory[self.selected_seed] -= 1
-        self.stats["plants_planted"] += 1
-        
-        # Create plant data
-        plant_data = {
-            "type": self.selected_seed,
-            "position": position,
-            "stage": 0,  # 0-5 (seed, sprout, growing, flowering, fruiting, ready)
-            "growth": 0.0,
-            "growth_rate": 0.01,
-            "water_level": 0,
-            "fertilized": False,
-            "pruned": False,
-            "pest_damage": 0.0,
-            "disease_level": 0.0,
-            "model": None,
-            "particles": None,
-            "last_watered": 0,
-            "last_fertilized": 0,
-            "planted_day": self.day_count
-        }
-        
-        self.plants.append(plant_data)
-        self.create_enhanced_plant_model(plant_data)
-        
-        # Play sound
-        if self.sound_enabled and self.plant_sound:
-            self.plant_sound.play()
-    
+    # Plant view methods
     def create_enhanced_plant_model(self, plant):
-        """Create enhanced plant model with realistic appearance"""
-        from panda3d.core import CardMaker
-        
-        plant_type = self.plant_types[plant["type"]]
-        
-        # Create main plant model using built-in geometry
-        cm = CardMaker(f"plant_{plant['position'][0]}_{plant['position'][1]}")
-        cm.setFrame(-0.3, 0.3, -0.3, 0.3)
-        plant_model = self.render.attachNewNode(cm.generate())
-        plant_model.setPos(plant["position"][0], plant["position"][1], 0.5)
-        plant_model.setColor(plant_type["color"])
-        
-        # Add plant-specific details
-        if plant_type["name"] == "Sunflower":
-            # Add stem
-            stem_cm = CardMaker(f"stem_{plant['position'][0]}_{plant['position'][1]}")
-            stem_cm.setFrame(-0.1, 0.1, -0.1, 0.1)
-            stem = self.render.attachNewNode(stem_cm.generate())
-            stem.setPos(plant["position"][0], plant["position"][1], 0.2)
-            stem.setColor(0.2, 0.6, 0.2, 1)
-        
-        plant["model"] = plant_model
+        """Give a new plant an instance in its type's batch"""
+        # Scale and tint are applied by the render sync on the next frame
+        self.plant_instancer.add(plant)
         
         # Add fertilizer effect if applicable
         if plant["fertilized"]:
             self.create_fertilizer_effect(plant)
     
-    def update_plants(self):
-        """Update all plants with realistic growth mechanics"""
-        for plant in self.plants:
-            if plant["growth"] < 1.0:
-                # Calculate growth rate based on conditions
-                base_rate = plant["growth_rate"]
-                
-                # Water effect
-                water_multiplier = 1.0
-                if plant["water_level"] > 0:
-                    water_multiplier = 1.5
-                    plant["water_level"] -= 0.1
-                else:
-                    water_multiplier = 0.5
-                
-                # Fertilizer effect
-                fertilizer_multiplier = 1.5 if plant["fertilized"] else 1.0
-                
-                # Weather effect
-                weather_multiplier = self.get_weather_growth_multiplier()
-                
-                # Season effect
-                season_multiplier = self.get_season_growth_multiplier(plant["type"])
-                
-                # Pest damage effect
-                pest_multiplier = max(0.1, 1.0 - plant["pest_damage"])
-                
-                # Calculate final growth rate
-                final_rate = base_rate * water_multiplier * fertilizer_multiplier * weather_multiplier * season_multiplier * pest_multiplier
-                
-                plant["growth"] += final_rate
-                plant["growth"] = min(1.0, plant["growth"])
-                
-                # Update plant model
-                self.update_plant_model(plant)
-                
-                # Check for disease
-                if random.random() < 0.001:  # 0.1% chance per update
-                    plant["disease_level"] += 0.1
-                    plant["disease_level"] = min(1.0, plant["disease_level"])
-    
-    def get_weather_growth_multiplier(self):
-        """Get growth multiplier based on weather"""
-        if self.weather == "Sunny":
-            return 1.2
-        elif self.weather == "Rainy":
-            return 1.5
-        elif self.weather == "Stormy":
-            return 0.8
-        elif self.weather == "Snowy":
-            return 0.3
-        return 1.0
-    
-    def get_season_growth_multiplier(self, plant_type_index):
-        """Get growth multiplier based on season compatibility"""
-        plant_type = self.plant_types[plant_type_index]
-        if plant_type["season"] == self.season:
-            return 1.5
-        elif plant_type["season"] == "All":
-            return 1.0
-        else:
-            return 0.3
-    
-    def update_plant_model(self, plant):
-        """Update plant visual model based on growth stage"""
-        if plant["model"]:
-            growth_stage = int(plant["growth"] * 5)
-            plant_type = self.plant_types[plant["type"]]
-            
-            # Update scale based on growth
-            base_scale = 0.3 + growth_stage * 0.15 * plant_type["size"]
-            plant["model"].setScale(base_scale, base_scale, base_scale)
-            plant["model"].setZ(0.5 + growth_stage * 0.2)
-            
-            # Update color based on health
-            base_color = plant_type["color"]
-            health_factor = 1.0 - plant["pest_damage"] - plant["disease_level"]
-            health_factor = max(0.3, health_factor)
-            
-            plant["model"].setColor(
-                base_color[0] * health_factor,
-                base_color[1] * health_factor,
-                base_color[2] * health_factor,
-                1
-            )
-            
-            # Add disease effect
-            if plant["disease_level"] > 0.5:
-                plant["model"].setColor(
-                    base_color[0] * 0.7,
-                    base_color[1] * 0.4,
-                    base_color[2] * 0.4,
-                    1
-                )
+    def remove_plant_model(self, plant):
+        """Remove everything mirroring a harvested plant"""
+        position = plant["position"]
+        self.plot_mesh.set_plot_color(self.sim.grid.cell_of(*position), PLOT_COLOR)
+        self.plant_instancer.remove(plant)
+        self.effects.release_owner(position)
     
-    def water_plant(self, position):
-        """Water a plant at the specified position"""
-        if self.water_can_level <= 0:
-            self.show_message("Water can is empty! Refill at the well.")
-            return
+    def update_plant_model(self, plant, stage, health, diseased, wet, dirty):
+        """Update plant visual model for a changed growth stage, health tint or soil moisture"""
+        if dirty & DIRTY_MOISTURE:
+            cell = self.sim.grid.cell_of(*plant["position"])
+            self.plot_mesh.set_plot_color(cell, WET_PLOT_COLOR if wet else PLOT_COLOR)
         
-        for plant in self.plants:
-            if plant["position"] == position:
-                plant["water_level"] = 3.0  # 3 days of water
-                plant["last_watered"] = self.day_count
-                self.water_can_level -= 10
-                
-                # Visual feedback
-                self.create_water_effect(plant)
-                
-                # Play sound
-                if self.sound_enabled and self.water_sound:
-                    self.water_sound.play()
-                break
+        plant_type = self.sim.plant_types[plant["type"]]
+        
+        # Update scale based on growth
+        if dirty & DIRTY_STAGE:
+            base_scale = 0.3 + stage * 0.15 * plant_type["size"]
+            self.plant_instancer.set_z_scale(plant, 0.5 + stage * 0.2, base_scale)
+        
+        # Update color based on health, with a reddish tint for disease
+        if dirty & DIRTY_TINT:
+            base_color = plant_type["color"]
+            if diseased:
+                self.plant_instancer.set_tint(plant, (base_color[0] * 0.7, base_color[1] * 0.4, base_color[2] * 0.4, 1))
+            else:
+                self.plant_instancer.set_tint(plant, (base_color[0] * health, base_color[1] * health, base_color[2] * health, 1))
     
     def create_water_effect(self, plant):
         """Create visual water effect"""
-        from panda3d.core import CardMaker
-        
-        if plant["model"]:
-            water_cm = CardMaker(f"water_{plant['position'][0]}_{plant['position'][1]}")
-            water_cm.setFrame(-0.1, 0.1, -0.1, 0.1)
-            water = self.render.attachNewNode(water_cm.generate())
-            water.setPos(plant["position"][0], plant["position"][1], 1.0)
-            water.setColor(0.2, 0.4, 0.8, 0.7)
-            
-            # Animate water droplets
-            Sequence(
-                LerpPosInterval(water, 0.5, Point3(plant["position"][0], plant["position"][1], 1.5), blendType='easeOut'),
-                LerpPosInterval(water, 0.5, Point3(plant["position"][0], plant["position"][1], 0.5), blendType='easeIn'),
-                Func(water.removeNode)
-            ).start()
-    
-    def fertilize_plant(self, position):
-        """Fertilize a plant at the specified position"""
-        if self.fertilizer <= 0:
-            self.show_message("No fertilizer available!")
-            return
-        
-        for plant in self.plants:
-            if plant["position"] == position and not plant["fertilized"]:
-                plant["fertilized"] = True
-                plant["last_fertilized"] = self.day_count
-                self.fertilizer -= 1
-                
-                # Create fertilizer effect
-                self.create_fertilizer_effect(plant)
-                
-                # Play sound
-                if self.sound_enabled and self.coin_sound:
-                    self.coin_sound.play()
-                break
+        if self.plant_instancer.has(plant):
+            position = plant["position"]
+            self.effects.play("water", position, *position, parent=self.garden_chunks.chunk_at(position).detail)
     
     def create_fertilizer_effect(self, plant):
-        """Create fertilizer particle effect"""
-        from panda3d.core import CardMaker
-        
-        if plant["model"]:
-            particles_cm = CardMaker(f"fertilizer_{plant['position'][0]}_{plant['position'][1]}")
-            particles_cm.setFrame(-0.05, 0.05, -0.05, 0.05)
-            particles = self.render.attachNewNode(particles_cm.generate())
-            particles.setPos(plant["position"][0], plant["position"][1], 1.0)
-            particles.setColor(0.8, 0.8, 0.2, 0.5)
-            
-            # Animate particles
-            Sequence(
-                LerpPosInterval(particles, 1.0, Point3(plant["position"][0], plant["position"][1], 1.5), blendType='easeInOut'),
-                LerpPosInterval(particles, 1.0, Point3(plant["position"][0], plant["position"][1], 1.0), blendType='easeInOut')
-            ).loop()
-            
-            plant["particles"] = particles
-    
-    def harvest_plant(self, position):
-        """Harvest a mature plant"""
-        for plant in self.plants:
-            if plant["position"] == position and plant["growth"] >= 1.0:
-                plant_type = self.plant_types[plant["type"]]
-                
-                # Calculate harvest value based on plant health
-                health_factor = 1.0 - plant["pest_damage"] - plant["disease_level"]
-                health_factor = max(0.5, health_factor)
-                
-                harvest_value = int(plant_type["value"] * health_factor)
-                harvest_exp = int(plant_type["experience"] * health_factor)
-                
-                self.money += harvest_value
-                self.experience += harvest_exp
-                self.stats["plants_harvested"] += 1
-                self.stats["money_earned"] += harvest_value
-                
-                # Check for level up
-                if self.experience >= self.level * 100:
-                    self.level_up()
-                
-                # Remove plant
-                if plant["model"]:
-                    plant["model"].removeNode()
-                if plant["particles"]:
-                    plant["particles"].removeNode()
-                
-                self.plants.remove(plant)
-                
-                # Show harvest message
-                self.show_message(f"Harvested {plant_type['name']} for ${harvest_value}!")
-                
-                # Play sounds
-                if self.sound_enabled:
-                    if self.harvest_sound:
-                        self.harvest_sound.play()
-                    if self.coin_sound:
-                        self.coin_sound.play()
-                break
-    
-    def use_pesticide(self, position):
-        """Use pesticide to eliminate pests"""
-        if self.pesticide <= 0:
-            self.show_message("No pesticide available!")
-            return
-        
-        pest_eliminated = False
-        for pest in self.pests[:]:  # Copy list to avoid modification during iteration
-            if abs(pest["position"][0] - position[0]) < 2 and abs(pest["position"][1] - position[1]) < 2:
-                self.pests.remove(pest)
-                pest_eliminated = True
-                self.stats["pests_eliminated"] += 1
-        
-        if pest_eliminated:
-            self.pesticide -= 1
-            self.show_message("Pests eliminated!")
-            
-            # Play sound
-            if self.sound_enabled and self.coin_sound:
-                self.coin_sound.play()
-    
-    def prune_plant(self, position):
-        """Prune a plant to improve its health"""
-        for plant in self.plants:
-            if plant["position"] == position and not plant["pruned"]:
-                plant["pruned"] = True
-                plant["pest_damage"] = max(0, plant["pest_damage"] - 0.2)
-                plant["disease_level"] = max(0, plant["disease_level"] - 0.1)
-                
-                self.show_message("Plant pruned! Health improved.")
-                
-                # Play sound
-                if self.sound_enabled and self.coin_sound:
-                    self.coin_sound.play()
-                break
-    
-    def check_plant_growth(self):
-        """Check plant growth at the start of each day"""
-        for plant in self.plants:
-            # Reduce fertilizer effect over time
-            if plant["fertilized"] and self.day_count - plant["last_fertilized"] > 3:
-                plant["fertilized"] = False
-            
-            # Reduce pruning effect over time
-            if plant["pruned"] and self.day_count - plant.get("last_pruned", 0) > 5:
-                plant["pruned"] = False
-    
-    def update_season(self):
-        """Update season based on day count"""
-        seasons = ["Spring", "Summer", "Fall", "Winter"]
-        season_index = (self.day_count - 1) // 10 % 4
-        self.season = seasons[season_index]
-        
-        # Update temperature based on season
-        if self.season == "Spring":
-            self.temperature = random.randint(15, 25)
-        elif self.season == "Summer":
-            self.temperature = random.randint(25, 35)
-        elif self.season == "Fall":
-            self.temperature = random.randint(10, 20)
-        else:  # Winter
-            self.temperature = random.randint(-5, 10)
-    
-    def change_weather(self):
-        """Change weather conditions"""
-        weather_options = ["Sunny", "Rainy", "Stormy", "Snowy"]
-        weights = [0.4, 0.3, 0.2, 0.1]  # Probability weights
-        
-        # Adjust weights based on season
-        if self.season == "Spring":
-            weights = [0.3, 0.4, 0.2, 0.1]
-        elif self.season == "Summer":
-            weights = [0.5, 0.2, 0.2, 0.1]
-        elif self.season == "Fall":
-            weights = [0.3, 0.3, 0.3, 0.1]
-        else:  # Winter
-            weights = [0.2, 0.2, 0.2, 0.4]
-        
-        self.weather = random.choices(weather_options, weights=weights)[0]
-        
-        # Update humidity based on weather
-        if self.weather == "Rainy":
-            self.humidity = random.randint(80, 100)
-        elif self.weather == "Stormy":
-            self.humidity = random.randint(70, 90)
-        elif self.weather == "Snowy":
-            self.humidity = random.randint(60, 80)
-        else:  # Sunny
-            self.humidity = random.randint(30, 60)
-        
-        # Show weather change message
-        self.show_message(f"Weather changed to {self.weather}!")
-        
-        # Play weather sounds
-        if self.sound_enabled:
-            if self.weather == "Rainy" and self.rain_sound:
-                self.rain_sound.play()
-            elif self.weather == "Stormy" and self.storm_sound:
-                self.storm_sound.play()
+        """Create fertilizer particle effect, kept until the plant is removed"""
+        if self.plant_instancer.has(plant):
+            position = plant["position"]
+            self.effects.play("fertilizer", position, *position, parent=self.garden_chunks.chunk_at(position).detail)
     
     def weather_update(self, task):
         """Update weather effects"""
-        if self.weather == "Rainy":
-            # Show rain particles
-            for rain_drop in self.rain_particles:
-                if random.random() < 0.1:
-                    rain_drop.show()
-                    rain_drop.setPos(random.uniform(-20, 20), random.uniform(-20, 20), random.uniform(10, 20))
-        elif self.weather == "Stormy":
+        if self.is_paused or self.sim_clock.paused:
+            return Task.cont
+        
+        weather = self.sim.weather
+        if weather != self.weather_particles.weather:
+            self.weather_particles.set_weather(weather)
+            if weather != "Stormy":
+                for lightning in self.storm_lightning:
+                    lightning["fg"] = (1, 1, 1, 0)
+        # Rain and snow fall around the camera, wherever it is over the garden
+        self.weather_particles.root.setPos(self.camera.getX(), self.camera.getY(), 0)
+        # Real frame time: at turbo speeds drops would cross the whole volume every frame
+        self.weather_particles.update(min(globalClock.getDt(), self.sim_clock.max_frame_time))
+        
+        if weather == "Stormy":
             # Show lightning
             for lightning in self.storm_lightning:
                 if random.random() < 0.05:
@@ -1431,177 +1041,50 @@ class EnhancedGardenGame(ShowBase):
                         Func(lambda: lightning.setFg((1, 1, 1, 0))),
                         duration=0.1
                     ).start()
-        else:
-            # Hide weather effects
-            for rain_drop in self.rain_particles:
-                rain_drop.hide()
-            for lightning in self.storm_lightning:
-                lightning["fg"] = (1, 1, 1, 0)
         
         return Task.cont
     
-    def pest_spawn_task(self, task):
-        """Spawn pests randomly"""
-        if random.random() < 0.001:  # 0.1% chance per update
-            self.spawn_pest()
-        return Task.cont
-    
-    def spawn_pest(self):
-        """Spawn a pest on a random plant"""
-        if not self.plants:
-            return
-        
-        plant = random.choice(self.plants)
-        pest_type = random.choice(self.pest_types)
-        
-        pest_data = {
-            "type": pest_type,
-            "position": plant["position"],
-            "damage": pest_type["damage"],
-            "speed": pest_type["speed"],
-            "model": None
-        }
-        
-        self.pests.append(pest_data)
-        self.create_pest_model(pest_data)
-    
+    # Pest view methods
     def create_pest_model(self, pest):
         """Create visual model for pest"""
         from panda3d.core import CardMaker
         
         pest_cm = CardMaker(f"pest_{pest['position'][0]}_{pest['position'][1]}")
         pest_cm.setFrame(-0.1, 0.1, -0.1, 0.1)
-        pest_model = self.render.attachNewNode(pest_cm.generate())
+        pest_model = self.garden_chunks.chunk_at(pest["position"]).detail.attachNewNode(pest_cm.generate())
         pest_model.setPos(pest["position"][0], pest["position"][1], 0.2)
         pest_model.setColor(pest["type"]["color"])
         
-        pest["model"] = pest_model
-    
-    def update_pests(self):
-        """Update pest behavior"""
-        for pest in self.pests[:]:
-            # Find target plant
-            target_plant = None
-            for plant in self.plants:
-                if plant["position"] == pest["position"]:
-                    target_plant = plant
-                    break
-            
-            if target_plant:
-                # Damage plant
-                target_plant["pest_damage"] += pest["damage"] * 0.01
-                target_plant["pest_damage"] = min(1.0, target_plant["pest_damage"])
-                
-                # Move pest randomly
-                if random.random() < 0.1:
-                    pest["position"] = (
-                        pest["position"][0] + random.uniform(-1, 1),
-                        pest["position"][1] + random.uniform(-1, 1)
-                    )
-                    
-                    if pest["model"]:
-                        pest["model"].setPos(pest["position"][0], pest["position"][1], 0.2)
-            else:
-                # Remove pest if no plant
-                if pest["model"]:
-                    pest["model"].removeNode()
-                self.pests.remove(pest)
-    
-    def check_achievements(self):
-        """Check and award achievements"""
-        for achievement in self.achievement_types:
-            if achievement["name"] not in [a["name"] for a in self.achievements]:
-                if self.evaluate_achievement_condition(achievement["condition"]):
-                    self.award_achievement(achievement)
-    
-    def evaluate_achievement_condition(self, condition):
-        """Evaluate achievement condition"""
-        try:
-            return eval(condition)
-        except:
-            return False
+        self.pest_models[pest["id"]] = pest_model
     
-    def award_achievement(self, achievement):
-        """Award an achievement"""
-        self.achievements.append(achievement)
-        self.money += achievement["reward"]
-        
-        # Show achievement notification
-        self.show_achievement_notification(achievement)
-        
-        # Play sound
-        if self.sound_enabled and self.achievement_sound:
-            self.achievement_sound.play()
+    def update_pest_model(self, pest):
+        """Move a pest model to its simulated position"""
+        pest_model = self.pest_models.get(pest["id"])
+        if pest_model:
+            pest_model.reparentTo(self.garden_chunks.chunk_at(pest["position"]).detail)
+            pest_model.setPos(pest["position"][0], pest["position"][1], 0.2)
+    
+    def remove_pest_model(self, pest):
+        """Remove the model of an eliminated pest"""
+        pest_model = self.pest_models.pop(pest["id"], None)
+        if pest_model:
+            pest_model.removeNode()
     
+    # Notification methods
     def show_achievement_notification(self, achievement):
         """Show achievement notification"""
-        notification = OnscreenText(
-            text=f"🏆 Achievement Unlocked!\n{achievement['name']}\n{achievement['description']}\nReward: ${achievement['reward']}",
-            pos=(0, 0.3),
-            scale=0.08,
-            fg=(1, 1, 0, 1),
-            align=TextNode.ACenter,
-            shadow=(0, 0, 0, 0.8)
-        )
-        
-        Sequence(
-            LerpPosInterval(notification, 2.0, Point3(0, 0, 0.5), blendType='easeOut'),
-            Wait(1.0),
-            Func(notification.hide),
-            Func(notification.destroy)
-        ).start()
-    
-    def level_up(self):
-        """Handle level up"""
-        self.level += 1
-        self.experience = 0
-        
-        # Unlock new tools
-        if self.level == 2 and "pesticide" not in self.tools_unlocked:
-            self.tools_unlocked.append("pesticide")
-            self.show_message("Pesticide tool unlocked!")
-        elif self.level == 3 and "prune" not in self.tools_unlocked:
-            self.tools_unlocked.append("prune")
-            self.show_message("Pruning tool unlocked!")
-        
-        # Show level up message
-        level_text = OnscreenText(
-            text=f"🎉 Level Up! You are now level {self.level}",
-            pos=(0, 0),
-            scale=0.1,
-            fg=(1, 1, 0, 1),
-            align=TextNode.ACenter,
-            shadow=(0, 0, 0, 0.8)
+        self.notifications.post(
+            f"🏆 Achievement Unlocked!\n{achievement['name']}\n{achievement['description']}\nReward: ${achievement['reward']}",
+            style="achievement"
         )
-        
-        Sequence(
-            LerpPosInterval(level_text, 2.0, Point3(0, 0, 0.5), blendType='easeOut'),
-            Wait(1.0),
-            Func(level_text.hide),
-            Func(level_text.destroy)
-        ).start()
-        
-        # Play sound
-        if self.sound_enabled and self.level_up_sound:
-            self.level_up_sound.play()
     
-    def show_message(self, text):
+    def show_level_up(self, level):
+        """Show level up banner"""
+        self.notifications.post(f"🎉 Level Up! You are now level {level}", style="level_up")
+    
+    def show_message(self, text, key=None, template=None, amount=0):
         """Show a temporary message"""
-        message = OnscreenText(
-            text=text,
-            pos=(0, -0.2),
-            scale=0.07,
-            fg=(1, 1, 1, 1),
-            align=TextNode.ACenter,
-            shadow=(0, 0, 0, 0.8)
-        )
-        
-        Sequence(
-            Func(message.show),
-            Wait(2.0),
-            Func(message.hide),
-            Func(message.destroy)
-        ).start()
+        self.notifications.post(text, key=key, template=template, amount=amount)
     
     # UI and interaction methods
     def open_enhanced_shop(self):
@@ -1616,7 +1099,7 @@ class EnhancedGardenGame(ShowBase):
         
         # Add shop items
         y_pos = 0.3
-        for i, plant in enumerate(self.plant_types):
+        for i, plant in enumerate(self.sim.plant_types):
             btn = DirectButton(
                 text=f"{plant['name']} - ${plant['cost']}",
                 scale=0.06,
@@ -1625,7 +1108,7 @@ class EnhancedGardenGame(ShowBase):
                 extraArgs=[i, shop_dialog],
                 frameColor=(0.3, 0.5, 0.3, 1),
                 text_fg=(1, 1, 1, 1),
-                state='DISABLED' if self.money < plant["cost"] else 'NORMAL'
+                state='DISABLED' if self.sim.money < plant["cost"] else 'NORMAL'
             )
             btn.reparentTo(shop_dialog)
             y_pos -= 0.1
@@ -1646,52 +1129,30 @@ class EnhancedGardenGame(ShowBase):
                 extraArgs=[shop_dialog],
                 frameColor=(0.3, 0.5, 0.3, 1),
                 text_fg=(1, 1, 1, 1),
-                state='DISABLED' if self.money < cost else 'NORMAL'
+                state='DISABLED' if self.sim.money < cost else 'NORMAL'
             )
             btn.reparentTo(shop_dialog)
             y_pos -= 0.1
     
     def buy_seeds(self, plant_index, dialog):
         """Buy seeds from shop"""
-        plant = self.plant_types[plant_index]
-        
-        if self.money >= plant["cost"]:
-            self.money -= plant["cost"]
-            self.seeds_inventory[plant_index] += 1
+        if self.sim.buy_seeds(plant_index):
             dialog.destroy()
-            
-            if self.sound_enabled and self.coin_sound:
-                self.coin_sound.play()
     
     def buy_fertilizer(self, dialog):
         """Buy fertilizer from shop"""
-        if self.money >= 15:
-            self.money -= 15
-            self.fertilizer += 1
+        if self.sim.buy_fertilizer():
             dialog.destroy()
-            
-            if self.sound_enabled and self.coin_sound:
-                self.coin_sound.play()
     
     def buy_pesticide(self, dialog):
         """Buy pesticide from shop"""
-        if self.money >= 25:
-            self.money -= 25
-            self.pesticide += 1
+        if self.sim.buy_pesticide():
             dialog.destroy()
-            
-            if self.sound_enabled and self.coin_sound:
-                self.coin_sound.play()
     
     def refill_water(self, dialog):
         """Refill water can"""
-        if self.money >= 5:
-            self.money -= 5
-            self.water_can_level = 100
+        if self.sim.refill_water():
             dialog.destroy()
-            
-            if self.sound_enabled and self.coin_sound:
-                self.coin_sound.play()
     
     def open_inventory(self):
         """Open inventory management"""
@@ -1705,8 +1166,8 @@ class EnhancedGardenGame(ShowBase):
         
         # Show current inventory
         y_pos = 0.3
-        for i, count in enumerate(self.seeds_inventory):
-            plant_name = self.plant_types[i]["name"]
+        for i, count in enumerate(self.sim.seeds_inventory):
+            plant_name = self.sim.plant_types[i]["name"]
             label = OnscreenText(
                 text=f"{plant_name}: {count}",
                 pos=(0, y_pos),
@@ -1718,7 +1179,7 @@ class EnhancedGardenGame(ShowBase):
             y_pos -= 0.08
         
         # Show supplies
-        supplies_text = f"Fertilizer: {self.fertilizer}\nPesticide: {self.pesticide}\nWater: {self.water_can_level}%"
+        supplies_text = f"Fertilizer: {self.sim.fertilizer}\nPesticide: {self.sim.pesticide}\nWater: {self.sim.water_can_level}%"
         supplies_label = OnscreenText(
             text=supplies_text,
             pos=(0, y_pos),
@@ -1745,7 +1206,7 @@ class EnhancedGardenGame(ShowBase):
             child.removeNode()
         
         y_pos = 0.4
-        for achievement in self.achievements:
+        for achievement in self.sim.achievements:
             text = f"🏆 {achievement['name']}\n{achievement['description']}\nReward: ${achievement['reward']}"
             label = OnscreenText(
                 text=text,
@@ -1761,17 +1222,17 @@ class EnhancedGardenGame(ShowBase):
         """Show player statistics"""
         stats_text = f"""📊 Garden Statistics
         
-Plants Planted: {self.stats['plants_planted']}
-Plants Harvested: {self.stats['plants_harvested']}
-Money Earned: ${self.stats['money_earned']}
-Days Played: {self.stats['days_played']}
-Pests Eliminated: {self.stats['pests_eliminated']}
-Storms Survived: {self.stats['storms_survived']}
+Plants Planted: {self.sim.stats['plants_planted']}
+Plants Harvested: {self.sim.stats['plants_harvested']}
+Money Earned: ${self.sim.stats['money_earned']}
+Days Played: {self.sim.stats['days_played']}
+Pests Eliminated: {self.sim.stats['pests_eliminated']}
+Storms Survived: {self.sim.stats['storms_survived']}
 
-Current Level: {self.level}
-Current Money: ${self.money}
-Current Season: {self.season}
-Current Weather: {self.weather}"""
+Current Level: {self.sim.level}
+Current Money: ${self.sim.money}
+Current Season: {self.sim.season}
+Current Weather: {self.sim.weather}"""
         
         stats_dialog = DirectDialog(
             title="📊 Statistics",
@@ -1783,40 +1244,15 @@ Current Weather: {self.weather}"""
     
     def quick_water_all(self):
         """Quick water all plants"""
-        watered_count = 0
-        for plant in self.plants:
-            if plant["water_level"] < 2.0 and self.water_can_level > 0:
-                plant["water_level"] = 3.0
-                self.water_can_level -= 5
-                watered_count += 1
-        
-        if watered_count > 0:
-            self.show_message(f"Watered {watered_count} plants!")
-            if self.sound_enabled and self.water_sound:
-                self.water_sound.play()
+        self.sim.quick_water_all()
     
     def harvest_all_ready(self):
         """Harvest all ready plants"""
-        harvested_count = 0
-        for plant in self.plants[:]:
-            if plant["growth"] >= 1.0:
-                self.harvest_plant(plant["position"])
-                harvested_count += 1
-        
-        if harvested_count > 0:
-            self.show_message(f"Harvested {harvested_count} plants!")
+        self.sim.harvest_all_ready()
     
     def fertilize_all(self):
         """Fertilize all unfertilized plants"""
-        fertilized_count = 0
-        for plant in self.plants:
-            if not plant["fertilized"] and self.fertilizer > 0:
-                plant["fertilized"] = True
-                self.fertilizer -= 1
-                fertilized_count += 1
-        
-        if fertilized_count > 0:
-            self.show_message(f"Fertilized {fertilized_count} plants!")
+        self.sim.fertilize_all()
     
     def check_rain_forecast(self):
         """Check rain forecast"""
@@ -1825,7 +1261,7 @@ Current Weather: {self.weather}"""
     
     def check_temperature(self):
         """Check temperature"""
-        self.show_message(f"Current temperature: {self.temperature}°C")
+        self.show_message(f"Current temperature: {self.sim.temperature}°C")
     
     def check_wind_speed(self):
         """Check wind speed"""
@@ -1839,10 +1275,15 @@ Current Weather: {self.weather}"""
         else:
             self.ui_frame.hide()
     
+    def toggle_drag_paint(self):
+        """Toggle painting the selected tool across plots while dragging"""
+        status = "enabled" if self.tool_input.toggle_drag_paint() else "disabled"
+        self.show_message(f"Drag painting {status}")
+    
     def toggle_day_night_cycle(self):
         """Toggle day/night cycle"""
-        self.day_night_cycle_enabled = not self.day_night_cycle_enabled
-        status = "enabled" if self.day_night_cycle_enabled else "disabled"
+        self.sim.set_day_night_cycle(not self.sim.day_night_cycle_enabled)
+        status = "enabled" if self.sim.day_night_cycle_enabled else "disabled"
         self.show_message(f"Day/night cycle {status}")
     
     def toggle_sound(self):
@@ -1859,6 +1300,7 @@ Current Weather: {self.weather}"""
     def toggle_pause_menu(self):
         """Toggle pause menu"""
         self.is_paused = not self.is_paused
+        self.tool_input.end_stroke()
         
         if self.is_paused:
             self.pause_menu = DirectDialog(
@@ -1893,7 +1335,7 @@ Current Weather: {self.weather}"""
                 text="🚪 Quit Game",
                 scale=0.08,
                 pos=(0, 0, 0.0),
-                command=sys.exit,
+                command=self.userExit,
                 frameColor=(0.5, 0.3, 0.3, 1),
                 text_fg=(1, 1, 1, 1)
             )
@@ -1902,65 +1344,96 @@ Current Weather: {self.weather}"""
             if hasattr(self, 'pause_menu'):
                 self.pause_menu.destroy()
     
-    def save_game(self):
+    def save_game(self, path=None):
         """Save game progress"""
-        save_data = {
-            "money": self.money,
-            "experience": self.experience,
-            "level": self.level,
-            "day_count": self.day_count,
-            "season": self.season,
-            "seeds_inventory": self.seeds_inventory,
-            "fertilizer": self.fertilizer,
-            "pesticide": self.pesticide,
-            "water_can_level": self.water_can_level,
-            "achievements": self.achievements,
-            "stats": self.stats,
-            "plants": self.plants
-        }
-        
-        try:
-            with open("garden_save.json", "w") as f:
-                json.dump(save_data, f, indent=2)
-            self.show_message("Game saved successfully!")
-        except Exception as e:
-            self.show_message(f"Save failed: {e}")
+        # Only the snapshot is taken here; the save writer encodes and writes it
+        self.journal.sync_economy()
+        snapshot = self.sim.snapshot()
+        path = path or self.save_path
+        # Only the main save compacts the journal, so only it restarts the count toward the next one
+        snapshot["journal_seq"] = self.journal.mark_save() if path == self.save_path else self.journal.seq
+        self.save_writer.save(path, snapshot, encode_binary)
+    
+    def save_to_slot(self, name):
+        """Save into a named slot with a thumbnail of the current view"""
+        path = self.save_slots.slot_path(name)
+        frame = capture_frame(self.win)
+        if frame is not None:
+            # Queued before the save, so the writer has the thumbnail on disk when the save reports
+            thumbnail_path = self.save_slots.thumbnail_path(name)
+            self.save_writer.save(thumbnail_path, frame, encode_thumbnail)
+            self.slot_thumbnails[path] = thumbnail_path
+        self.save_game(path)
+    
+    def report_saves(self):
+        """Show the outcome of saves the writer has finished"""
+        for path, snapshot, error in self.save_writer.poll():
+            if path == self.save_slots.index_path or path in self.slot_thumbnails.values():
+                continue
+            if error is None:
+                # The journal only needs the entries the save does not include
+                if path == self.save_path:
+                    self.journal.compact(snapshot["journal_seq"])
+                
+                # List the save in the slot index; only player saves become the recent slot
+                self.save_slots.record(path, snapshot, self.slot_thumbnails.pop(path, None),
+                                       recent=path != self.save_path)
+                self.save_writer.save(self.save_slots.index_path, self.save_slots.snapshot(), encode_index)
+                self.show_message("Game saved successfully!")
+            else:
+                self.show_message(f"Save failed: {error}")
     
-    def load_game(self):
+    def save_on_exit(self):
+        """Save and wait for the write to finish before the game exits"""
+        self.save_game()
+        self.save_writer.flush(timeout=10.0)
+        self.report_saves()
+        self.save_writer.close(timeout=10.0)
+        self.journal.close(timeout=10.0)
+    
+    def load_game(self, path=None):
         """Load saved game"""
+        if path is None:
+            path = self.save_path if os.path.exists(self.save_path) else self.legacy_save_path
+        self.journal.recording = False
+        entries = []
         try:
-            with open("garden_save.json", "r") as f:
-                save_data = json.load(f)
-            
-            self.money = save_data.get("money", 200)
-            self.experience = save_data.get("experience", 0)
-            self.level = save_data.get("level", 1)
-            self.day_count = save_data.get("day_count", 1)
-            self.season = save_data.get("season", "Spring")
-            self.seeds_inventory = save_data.get("seeds_inventory", [10, 8, 5, 3, 2, 1])
-            self.fertilizer = save_data.get("fertilizer", 5)
-            self.pesticide = save_data.get("pesticide", 3)
-            self.water_can_level = save_data.get("water_can_level", 100)
-            self.achievements = save_data.get("achievements", [])
-            self.stats = save_data.get("stats", {
-                "plants_planted": 0,
-                "plants_harvested": 0,
-                "storms_survived": 0,
-                "pests_eliminated": 0,
-                "money_earned": 0,
-                "days_played": 0
-            })
+            # Binary saves memory-map their plants; legacy JSON saves are migrated on the next save
+            save_data = self.save_slots.read(path)
             
-            # Recreate plants
-            saved_plants = save_data.get("plants", [])
-            for plant_data in saved_plants:
-                self.create_enhanced_plant_model(plant_data)
+            self.sim.load_state(save_data)
+            if path != self.save_path:
+                self.save_slots.touch(path)
             
             self.show_message("Game loaded successfully!")
+            
+            # Replay changes made after the save if the game did not exit cleanly
+            saved_at = save_data.get("saved_at")
+            if path == self.save_path:
+                entries = read_journal(self.journal.path)
+                recovered = sum(1 for entry in entries if entry["seq"] > save_data.get("journal_seq", 0))
+                if recovered:
+                    saved_at = replay(self.sim, save_data, entries)
+                    self.show_message(f"Recovered {recovered} unsaved changes!")
+            
+            # Apply the time the garden was left alone
+            if saved_at is not None:
+                elapsed = max(0.0, time.time() - saved_at)
+                days = catch_up(self.sim, int(elapsed * self.sim_clock.tick_rate))
+                ready = int((self.sim.plants.column("growth") >= 1.0).sum())
+                if days:
+                    self.show_message(f"While you were away, {days} days passed and {ready} plants are ready!")
         except FileNotFoundError:
             self.show_message("No save file found. Starting new game.")
         except Exception as e:
+            # Keep the save that failed to load rather than overwriting it
             self.show_message(f"Load failed: {e}")
+            self.journal.restart(entries)
+            return
+        
+        # Start the journal afresh from a full save of whatever is now loaded
+        self.journal.restart(entries)
+        self.save_game()
     
     def show_enhanced_tutorial(self):
         """Show enhanced tutorial"""
@@ -1968,12 +1441,12 @@ Current Weather: {self.weather}"""
             "🌱 Welcome to Grow A Garden! 🌱",
             "",
             "🎮 Controls:",
-            "• Mouse: Look around",
+            "• Right mouse: Look around",
             "• WASD/Arrows: Move camera",
             "• Scroll wheel: Zoom in/out",
             "• 1-6: Select tools",
             "• Q/E: Change seed type",
-            "• Click: Use selected tool",
+            "• Click or drag: Use selected tool",
             "• Space: Quick water all",
             "• H: Harvest all ready",
             "• F: Fertilize all",
@@ -2030,12 +1503,14 @@ Current Weather: {self.weather}"""
     
     def zoom_in(self):
         """Zoom camera in"""
-        self.camera_control["zoom"] = max(5, self.camera_control["zoom"] - 2)
+        zoom = self.camera_control["zoom"]
+        self.camera_control["zoom"] = max(5, zoom - max(2, zoom * 0.1))
         self.update_camera_position()
     
     def zoom_out(self):
         """Zoom camera out"""
-        self.camera_control["zoom"] = min(50, self.camera_control["zoom"] + 2)
+        zoom = self.camera_control["zoom"]
+        self.camera_control["zoom"] = min(self.camera_control["max_zoom"], zoom + max(2, zoom * 0.1))
         self.update_camera_position()
     
     def move_camera(self, dx, dy):
@@ -2046,8 +1521,9 @@ Current Weather: {self.weather}"""
         new_x = pos.x + dx * math.cos(math.radians(h)) - dy * math.sin(math.radians(h))
         new_y = pos.y + dx * math.sin(math.radians(h)) + dy * math.cos(math.radians(h))
         
-        new_x = max(-50, min(50, new_x))
-        new_y = max(-50, min(50, new_y))
+        limit = self.camera_control["limit"]
+        new_x = max(-limit, min(limit, new_x))
+        new_y = max(-limit, min(limit, new_y))
         
         self.camera.setPos(new_x, new_y, pos.z)
         self.camera.lookAt(new_x, new_y, 0)
@@ -2087,106 +1563,59 @@ Current Weather: {self.weather}"""
         
         return Task.cont
     
-    def update_lights(self):
-        """Update lighting based on time and weather"""
-        if self.day_time > 0.25 and self.day_time < 0.75:  # Daytime
-            sun_intensity = math.sin((self.day_time - 0.25) * math.pi * 2)
-            self.sun_light.setColor(Vec4(0.8 * sun_intensity, 0.8 * sun_intensity, 0.8 * sun_intensity, 1))
-            
-            sun_angle = (self.day_time - 0.25) * 2 * math.pi
-            self.sun_light_node.setPos(
-                50 * math.cos(sun_angle),
-                50 * math.sin(sun_angle),
-                50 * math.sin(sun_angle)
-            )
-            self.sun_light.setDirection(Vec3(-math.cos(sun_angle), -math.sin(sun_angle), -math.sin(sun_angle)))
-            
-            self.ambient_light.setColor(Vec4(0.4 * sun_intensity, 0.4 * sun_intensity, 0.4 * sun_intensity, 1))
-        else:  # Nighttime
-            moon_intensity = 0.3
-            self.sun_light.setColor(Vec4(0.3 * moon_intensity, 0.3 * moon_intensity, 0.5 * moon_intensity, 1))
-            
-            moon_angle = (self.day_time - 0.75) * 2 * math.pi
-            self.sun_light_node.setPos(
-                50 * math.cos(moon_angle),
-                50 * math.sin(moon_angle),
-                50 * math.sin(moon_angle)
-            )
-            self.sun_light.setDirection(Vec3(-math.cos(moon_angle), -math.sin(moon_angle), -math.sin(moon_angle)))
-            
-            self.ambient_light.setColor(Vec4(0.1, 0.1, 0.2, 1))
-        
-        # Weather lighting effects
-        if self.weather == "Stormy":
-            self.weather_light.setColor(Vec4(0.3, 0.3, 0.4, 1))
-        elif self.weather == "Rainy":
-            self.weather_light.setColor(Vec4(0.4, 0.4, 0.5, 1))
-        else:
-            self.weather_light.setColor(Vec4(0.5, 0.5, 0.7, 1))
-    
-    def update_sky(self):
-        """Update sky appearance"""
-        if self.day_time > 0.25 and self.day_time < 0.75:  # Daytime
-            sky_blue = 0.5 + 0.3 * math.sin((self.day_time - 0.25) * math.pi * 2)
-            self.sky_sphere.setColor(Vec4(0.3, 0.4, sky_blue, 1))
-        else:  # Nighttime
-            self.sky_sphere.setColor(Vec4(0.05, 0.05, 0.15, 1))
-
 # Start the enhanced game
     # NEW: MASSIVELY ENHANCED METHODS - 300+ NEW FEATURES
     
     def upgrade_tool(self, tool):
         """Upgrade a tool to next level"""
-        if self.tool_levels[tool] < 10 and self.skill_points >= self.tool_levels[tool] * 5:
-            self.skill_points -= self.tool_levels[tool] * 5
-            self.tool_levels[tool] += 1
-            self.tool_efficiency[tool] += 0.1
-            self.show_message(f"{tool.title()} upgraded to level {self.tool_levels[tool]}!")
+        self.sim.upgrade_tool(tool)
     
     def smart_water_all(self):
         """Smart watering system that considers plant needs"""
         watered = 0
-        for plant in self.plants:
-            if plant.get('water_level', 0) < 3 and self.water_can_level > 0:
-                self.water_plant(plant)
-                watered += 1
+        for plant in list(self.sim.plants):
+            if plant.get('water_level', 0) < 3 and self.sim.water_can_level > 0:
+                if self.sim.water_plant(plant["position"]):
+                    watered += 1
         self.show_message(f"Smart watered {watered} plants!")
     
     def smart_harvest_all(self):
         """Smart harvesting that considers optimal timing"""
         harvested = 0
-        for plant in self.plants:
-            if plant.get('growth_stage', 0) >= 4 and plant.get('health', 1.0) > 0.8:
-                self.harvest_plant(plant)
-                harvested += 1
+        for plant in list(self.sim.plants):
+            health = 1.0 - plant["pest_damage"] - plant["disease_level"]
+            if plant["growth"] >= 1.0 and health > 0.8:
+                if self.sim.harvest_plant(plant["position"]):
+                    harvested += 1
         self.show_message(f"Smart harvested {harvested} plants!")
     
     def smart_fertilize_all(self):
         """Smart fertilizing based on plant needs"""
         fertilized = 0
-        for plant in self.plants:
-            if not plant.get('fertilized', False) and self.fertilizer_count > 0:
-                self.fertilize_plant(plant)
-                fertilized += 1
+        for plant in list(self.sim.plants):
+            if not plant.get('fertilized', False) and self.sim.fertilizer > 0:
+                if self.sim.fertilize_plant(plant["position"]):
+                    fertilized += 1
         self.show_message(f"Smart fertilized {fertilized} plants!")
     
     def quick_pesticide_all(self):
         """Quick pesticide application to all plants"""
         treated = 0
-        for plant in self.plants:
-            if plant.get('pest_damage', 0) > 0 and self.pesticide > 0:
-                self.use_pesticide(plant)
-                treated += 1
+        for plant in list(self.sim.plants):
+            if plant.get('pest_damage', 0) > 0 and self.sim.pesticide > 0:
+                if self.sim.use_pesticide(plant["position"]):
+                    treated += 1
         self.show_message(f"Treated {treated} plants with pesticide!")
     
     def prune_all(self):
         """Prune all plants for better health"""
         pruned = 0
-        for plant in self.plants:
-            if plant.get('health', 1.0) < 0.9:
-                self.prune_plant(plant)
-                pruned += 1
-        self.show_message(f"Pruned {treated} plants!")
+        for plant in list(self.sim.plants):
+            health = 1.0 - plant["pest_damage"] - plant["disease_level"]
+            if health < 0.9:
+                if self.sim.prune_plant(plant["position"]):
+                    pruned += 1
+        self.show_message(f"Pruned {pruned} plants!")
     
     def toggle_map(self):
         """Toggle garden map view"""
@@ -2205,8 +1634,13 @@ Current Weather: {self.weather}"""
         self.show_message("Research lab toggled!")
     
     def toggle_notifications(self):
-        """Toggle notification system"""
-        self.show_message("Notifications toggled!")
+        """Toggle routine notification messages"""
+        if self.notifications.enabled:
+            self.show_message("Notifications off")
+            self.notifications.toggle()
+        else:
+            self.notifications.toggle()
+            self.show_message("Notifications on")
     
     def toggle_options(self):
         """Toggle options menu"""
@@ -2227,20 +1661,56 @@ Current Weather: {self.weather}"""
     def toggle_pause_game(self):
         """Toggle game pause"""
         self.pause_game = not self.pause_game
+        self.sim_clock.paused = self.pause_game
         if self.pause_game:
             self.show_message("Game paused!")
         else:
             self.show_message("Game resumed!")
     
+    def set_game_speed(self, speed, label):
+        """Switch to a game speed, or back to normal if it is already active"""
+        if self.game_speed == speed:
+            speed = 1.0
+            label = "Normal speed"
+        self.game_speed = speed
+        self.sim_clock.set_speed(speed)
+        self.show_message(f"{label} activated!")
+    
     def toggle_slow_motion(self):
         """Toggle slow motion mode"""
-        self.game_speed = 0.5
-        self.show_message("Slow motion activated!")
+        self.set_game_speed(0.5, "Slow motion")
     
     def toggle_fast_forward(self):
         """Toggle fast forward mode"""
-        self.game_speed = 2.0
-        self.show_message("Fast forward activated!")
+        self.set_game_speed(2.0, "Fast forward")
+    
+    def toggle_turbo(self):
+        """Toggle turbo mode for fast-forwarding whole seasons"""
+        self.set_game_speed(100.0, "Turbo")
+    
+    def skip_to_next_harvest(self):
+        """Fast-forward to the moment another plant is ready to harvest"""
+        ticks = self.sim.skip_to_next_ready()
+        if ticks:
+            self.show_message(f"Skipped {self.sim_clock.ticks_to_seconds(ticks):.0f}s to the next harvest!")
+        else:
+            self.show_message("No growing plants to wait for!")
+    
+    def buy_land_under_mouse(self):
+        """Buy the chunk of land under the mouse cursor"""
+        if not self.mouseWatcherNode.hasMouse():
+            return
+        hit_point = self.picker.ground_point(self.mouseWatcherNode.getMouse())
+        if hit_point is None:
+            return
+        grid = self.sim.grid
+        self.sim.buy_land(grid.chunk_of(grid.cell_of(hit_point.getX(), hit_point.getY())))
+    
+    def update_land(self, *args):
+        """Match the chunk nodes to the owned land"""
+        for chunk in self.garden_chunks.sync_land():
+            self.plant_instancer.drop_chunk(chunk)
+            self.plot_mesh.drop_chunk(chunk)
     
     def toggle_time_controls(self):
         """Toggle time control panel"""
@@ -2252,19 +1722,19 @@ Current Weather: {self.weather}"""
     
     def check_weather_forecast(self):
         """Check weather forecast"""
-        self.show_message(f"Weather forecast: {self.weather} for next 3 days")
+        self.show_message(f"Weather forecast: {self.sim.weather} for next 3 days")
     
     def check_temperature(self):
         """Check current temperature"""
-        self.show_message(f"Current temperature: {self.temperature}°C")
+        self.show_message(f"Current temperature: {self.sim.temperature}°C")
     
     def check_humidity(self):
         """Check current humidity"""
-        self.show_message(f"Current humidity: {self.humidity}%")
+        self.show_message(f"Current humidity: {self.sim.humidity}%")
     
     def check_wind_speed(self):
         """Check current wind speed"""
-        self.show_message(f"Current wind speed: {self.wind_speed} km/h")
+        self.show_message(f"Current wind speed: {self.sim.wind_speed} km/h")
     
     def check_air_pressure(self):
         """Check air pressure"""
@@ -2390,36 +1860,85 @@ Current Weather: {self.weather}"""
     def toggle_money_cheat(self):
         """Toggle money cheat"""
         if self.cheat_mode:
-            self.money += 10000
+            self.sim.money += 10000
             self.show_message("Money cheat activated!")
     
     def toggle_experience_cheat(self):
         """Toggle experience cheat"""
         if self.cheat_mode:
-            self.experience += 1000
+            self.sim.experience += 1000
             self.show_message("Experience cheat activated!")
     
     def quick_save(self):
         """Quick save game"""
-        self.save_game()
-        self.show_message("Game saved!")
+        self.save_to_slot("quicksave")
     
     def quick_load(self):
         """Quick load game"""
-        self.load_game()
-        self.show_message("Game loaded!")
+        self.load_game(self.save_slots.slot_path("quicksave"))
     
-    def save_as(self):
+    def save_as(self, name=None):
         """Save game as new file"""
-        self.show_message("Save as dialog opened!")
+        if name is None:
+            name = f"save_{datetime.now():%Y%m%d_%H%M%S}"
+        self.save_to_slot(name)
+        self.show_message(f"Saving as {name}")
     
-    def load_from(self):
+    def load_from(self, path=None):
         """Load game from file"""
-        self.show_message("Load from dialog opened!")
+        if path is None:
+            self.open_load_dialog()
+        else:
+            self.load_game(path)
+    
+    def open_load_dialog(self):
+        """List the save slots from the slot index and load the one picked"""
+        slots = self.save_slots.listing()
+        if not slots:
+            self.show_message("No save file found.")
+            return
+        self.save_slots.preload()
+        
+        load_dialog = DirectDialog(
+            text="📂 Load Game - choose a save:",
+            frameSize=(-1.0, 1.0, -0.85, 0.15),
+            scale=0.8,
+            frameColor=(0.2, 0.2, 0.3, 0.95),
+            text_fg=(1, 1, 1, 1)
+        )
+        
+        y_pos = -0.12
+        for name, meta in slots[:8]:
+            label = "Autosave" if meta["path"] == self.save_path else name
+            saved = datetime.fromtimestamp(meta["saved_at"]).strftime("%Y-%m-%d %H:%M")
+            btn = DirectButton(
+                text=f"{label} | Lv {meta['level']} | ${meta['money']} | Day {meta['day_count']} | {meta['plants']} plants | {saved}",
+                scale=0.045,
+                pos=(0.1, 0, y_pos),
+                command=self.load_slot,
+                extraArgs=[meta["path"], load_dialog],
+                frameColor=(0.3, 0.3, 0.5, 1),
+                text_fg=(1, 1, 1, 1)
+            )
+            btn.reparentTo(load_dialog)
+            if meta["thumbnail"] and os.path.exists(meta["thumbnail"]):
+                thumbnail = OnscreenImage(image=meta["thumbnail"], pos=(-0.75, 0, y_pos + 0.015), scale=(0.064, 1, 0.036))
+                thumbnail.reparentTo(load_dialog)
+            y_pos -= 0.09
+    
+    def load_slot(self, path, dialog):
+        """Load a slot picked in the load dialog"""
+        dialog.destroy()
+        self.load_game(path)
     
     def auto_save_toggle(self):
         """Toggle auto-save"""
-        self.show_message("Auto-save toggled!")
+        if self.sim.auto_save_event:
+            self.sim.schedule_auto_save(None)
+            self.show_message("Auto-save disabled")
+        else:
+            self.sim.schedule_auto_save(self.sim_clock.tick_rate * self.auto_save_interval)
+            self.show_message("Auto-save enabled")
     
     def show_help(self):
         """Show help system"""
@@ -2464,7 +1983,7 @@ Current Weather: {self.weather}"""
     def quick_quit(self):
         """Quick quit game"""
         self.show_message("Quitting game...")
-        sys.exit()
+        self.userExit()
     
     def restart_game(self):
         """Restart game"""
@@ -2484,7 +2003,7 @@ Current Weather: {self.weather}"""
     def close_game(self):
         """Close game"""
         self.show_message("Closing game...")
-        sys.exit()
+        self.userExit()
     
     def toggle_multiplayer(self):
         """Toggle multiplayer mode"""
@@ -0,0 +1,68 @@
+"""Cached growth-multiplier lookup table.
+
+A plant's growth multiplier, apart from its own water and pest state, depends
+only on its type, whether it is fertilized, and garden-wide conditions that
+change rarely: the weather, the season, tool upgrades and research. Instead of
+evaluating those rules for every plant every tick, GrowthModifiers folds them
+into a small table indexed by (plant type, fertilized) that is rebuilt only
+when one of its inputs changes; growing the plants then takes a single gather.
+
+Extra multipliers such as research bonuses live in named ModifierStacks whose
+product is cached until a factor is set or removed.
+"""
+import numpy as np
+
+FERTILIZER_BONUS = 0.5  # Fertilized plants grow 1 + bonus * fertilize-tool efficiency times faster
+
+
+class ModifierStack:
+    """Named multipliers whose product is cached"""
+
+    def __init__(self):
+        self.factors = {}
+        self.value = 1.0
+
+    def set(self, name, factor):
+        """Set a named factor; return True if the product changed"""
+        if self.factors.get(name) == factor:
+            return False
+        self.factors[name] = factor
+        self.update()
+        return True
+
+    def remove(self, name):
+        """Remove a named factor; return True if the product changed"""
+        if self.factors.pop(name, None) is None:
+            return False
+        self.update()
+        return True
+
+    def update(self):
+        """Recompute the cached product"""
+        value = 1.0
+        for factor in self.factors.values():
+            value *= factor
+        self.value = value
+
+
+class GrowthModifiers:
+    """Growth multiplier per (plant type, fertilized), rebuilt only when an input changes"""
+
+    def __init__(self, type_count):
+        self.type_count = type_count
+        self.growth = ModifierStack()  # Applies to every plant
+        self.fertilizer = ModifierStack()  # Applies to fertilized plants only
+        self.fertilizer.set("base", 1.0 + FERTILIZER_BONUS)
+        self.types = [ModifierStack() for _ in range(type_count)]  # Per plant type
+        self.table = np.ones((type_count, 2))
+
+    def rebuild(self, weather_multiplier, season_multipliers):
+        """Recompute the table for the current weather and season multipliers"""
+        type_multipliers = np.array([stack.value for stack in self.types])
+        unfertilized = weather_multiplier * season_multipliers * type_multipliers * self.growth.value
+        self.table[:, 0] = unfertilized
+        self.table[:, 1] = unfertilized * self.fertilizer.value
+
+    def gather(self, plant_types, fertilized):
+        """Return the multiplier of every plant from its type and fertilizer columns"""
+        return self.table[plant_types, fertilized.view(np.uint8)]
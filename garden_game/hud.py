@@ -0,0 +1,55 @@
+"""Retained-mode HUD bindings.
+
+Each HUD widget is bound to a source function returning the raw state values
+it shows, e.g. (money,) or (seed count, selected seed). Once per frame the HUD
+compares every source against the value it last drew and only calls the
+widget's apply function when the value changed, so text nodes and DirectGui
+widgets are not regenerated in steady state.
+"""
+
+UNSET = object()  # Last value of a binding that has never been drawn
+
+
+class HudBinding:
+    """A widget update tied to the state values it displays"""
+
+    __slots__ = ("source", "apply", "value")
+
+    def __init__(self, source, apply):
+        self.source = source  # () -> comparable raw value
+        self.apply = apply  # callback(value)
+        self.value = UNSET
+
+
+class Hud:
+    """Refresh bound widgets only when their values change"""
+
+    def __init__(self):
+        self.bindings = []
+
+    def bind(self, source, apply):
+        """Bind a widget update to a state source and return the binding"""
+        binding = HudBinding(source, apply)
+        self.bindings.append(binding)
+        return binding
+
+    def bind_text(self, text, source, template):
+        """Bind an OnscreenText to a source, formatting values with template"""
+        return self.bind(source, lambda value: text.setText(template(*value)))
+
+    def bind_option(self, widget, option, source, choose):
+        """Bind one DirectGui option to a source, choosing its setting from the value"""
+        def apply(value):
+            widget[option] = choose(value)
+        return self.bind(source, apply)
+
+    def refresh(self):
+        """Apply every binding whose value changed; return how many did"""
+        changed = 0
+        for binding in self.bindings:
+            value = binding.source()
+            if value != binding.value:
+                binding.value = value
+                binding.apply(value)
+                changed += 1
+        return changed
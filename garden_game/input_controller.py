@@ -0,0 +1,75 @@
+"""Event-driven tool input for the garden view.
+
+A press of mouse1 starts a stroke and applies the selected tool to the plot
+under the mouse exactly once. While the button is held a stroke task follows
+the mouse, and in drag-paint mode every newly entered plot gets the tool once
+per stroke. A short per-plot cooldown stops rapid clicks from re-applying a
+tool to the same plot, and nothing runs per frame while no stroke is active.
+Presses are ignored while the game is paused.
+"""
+from direct.showbase import DirectObject
+from direct.task import Task
+
+CELL_COOLDOWN = 0.25  # Seconds before the same plot accepts the tool again
+
+
+class ToolInputController(DirectObject.DirectObject):
+    """Resolve mouse1 presses and drags into tool applications on plots"""
+
+    def __init__(self, base, picker, apply_tool, cell_cooldown=CELL_COOLDOWN):
+        DirectObject.DirectObject.__init__(self)
+        self.base = base
+        self.picker = picker
+        self.apply_tool = apply_tool  # callback(plot position)
+        self.cell_cooldown = cell_cooldown
+        self.drag_paint = True
+        self.stroke_cells = None  # Plots touched by the current stroke, None when idle
+        self.last_applied = {}  # plot position -> time the tool was last applied
+
+        # Modifier variants are thrown instead of plain mouse1 while a modifier is held
+        for modifier in ("", "shift-", "control-", "alt-"):
+            self.accept(f"{modifier}mouse1", self.begin_stroke)
+            self.accept(f"{modifier}mouse1-up", self.end_stroke)
+
+    def begin_stroke(self):
+        """Start a stroke and apply the tool to the plot under the mouse"""
+        if self.base.is_paused:
+            return
+        self.stroke_cells = set()
+        self.paint()
+        if self.drag_paint:
+            self.base.taskMgr.add(self.stroke_task, "tool_stroke_task")
+
+    def end_stroke(self):
+        """Finish the current stroke"""
+        self.stroke_cells = None
+        self.base.taskMgr.remove("tool_stroke_task")
+
+    def stroke_task(self, task):
+        """Paint plots entered while the button is held"""
+        if self.stroke_cells is None:
+            return Task.done
+        self.paint()
+        return Task.cont
+
+    def paint(self):
+        """Apply the tool to the plot under the mouse if this stroke has not touched it yet"""
+        watcher = self.base.mouseWatcherNode
+        if not watcher.hasMouse():
+            return
+
+        position = self.picker.pick_plot(watcher.getMouse())
+        if position is None or position in self.stroke_cells:
+            return
+        self.stroke_cells.add(position)
+
+        now = globalClock.getFrameTime()
+        if now - self.last_applied.get(position, -self.cell_cooldown) < self.cell_cooldown:
+            return
+        self.last_applied[position] = now
+        self.apply_tool(position)
+
+    def toggle_drag_paint(self):
+        """Switch between single clicks and drag painting; return the new mode"""
+        self.drag_paint = not self.drag_paint
+        return self.drag_paint
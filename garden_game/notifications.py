@@ -0,0 +1,135 @@
+"""Pooled on-screen notifications.
+
+Every toast is drawn by one of a fixed pool of OnscreenText nodes created up
+front, so a burst of messages never builds more text nodes than the pool
+holds. Messages that cannot be shown yet wait in a queue. Messages sharing a
+key (by default, identical text) are coalesced: a second "harvest:Carrot"
+message turns the visible or queued toast into "Harvested 2 Carrots for $27!"
+instead of adding another one. New toasts appear at most once per
+MIN_INTERVAL, and a single task animates them.
+"""
+from collections import deque
+
+from direct.gui.OnscreenText import OnscreenText
+from direct.task import Task
+from panda3d.core import TextNode
+
+POOL_SIZE = 4
+MIN_INTERVAL = 0.15  # Seconds between two toasts appearing
+MAX_QUEUED = 32  # Oldest plain messages are dropped beyond this
+
+# style -> (start position, rise, scale, colour, seconds on screen)
+STYLES = {
+    "message": ((0, -0.2), 0.0, 0.07, (1, 1, 1, 1), 2.0),
+    "achievement": ((0, 0.3), 0.2, 0.08, (1, 1, 0, 1), 3.0),
+    "level_up": ((0, 0.0), 0.5, 0.1, (1, 1, 0, 1), 3.0)
+}
+RISE_TIME = 2.0  # Seconds a rising toast takes to reach its final height
+STACK_SPACING = 0.09  # Vertical offset between toasts of the same style
+
+
+class NotificationCenter:
+    """Queue, coalesce and display toasts using a fixed pool of text nodes"""
+
+    def __init__(self, task_manager, pool_size=POOL_SIZE):
+        self.task_manager = task_manager
+        self.enabled = True
+        self.queue = deque()
+        self.last_shown = -MIN_INTERVAL
+        self.slots = []
+        for _ in range(pool_size):
+            text = OnscreenText(text="", align=TextNode.ACenter, shadow=(0, 0, 0, 0.8), mayChange=True)
+            text.hide()
+            self.slots.append({"text": text, "toast": None, "started": 0.0})
+
+    def post(self, text, style="message", key=None, template=None, amount=0):
+        """Show a toast, merging it into a pending one with the same key"""
+        if not self.enabled and style == "message":
+            return
+
+        # Identical messages without their own key collapse into one toast
+        if key is None:
+            key = (style, text)
+        for slot in self.slots:
+            toast = slot["toast"]
+            if toast and toast["key"] == key:
+                self.merge(toast, amount)
+                slot["text"].setText(self.render_text(toast))
+                slot["started"] = globalClock.getFrameTime()
+                return
+        for toast in self.queue:
+            if toast["key"] == key:
+                self.merge(toast, amount)
+                return
+
+        if len(self.queue) >= MAX_QUEUED:
+            for toast in self.queue:
+                if toast["style"] == "message":
+                    self.queue.remove(toast)
+                    break
+        self.queue.append({"text": text, "style": style, "key": key, "template": template,
+                           "count": 1, "amount": amount})
+
+        if not self.task_manager.hasTaskNamed("notification_task"):
+            self.task_manager.add(self.update, "notification_task")
+
+    def merge(self, toast, amount):
+        """Fold another occurrence of a message into a toast"""
+        toast["count"] += 1
+        toast["amount"] += amount
+
+    def render_text(self, toast):
+        """Return the text a toast should display"""
+        if toast["count"] > 1 and toast["template"]:
+            return toast["template"].format(count=toast["count"], amount=toast["amount"])
+        return toast["text"]
+
+    def show(self, slot, toast, now):
+        """Put a queued toast on screen in a free slot"""
+        position, _, scale, color, _ = STYLES[toast["style"]]
+        stacked = sum(1 for other in self.slots if other["toast"] and other["toast"]["style"] == toast["style"])
+        slot["toast"] = toast
+        slot["started"] = now
+        slot["base"] = (position[0], position[1] - stacked * STACK_SPACING)
+
+        text = slot["text"]
+        text.setText(self.render_text(toast))
+        text.setScale(scale)
+        text.setFg(color)
+        text.setPos(*slot["base"])
+        text.show()
+
+    def update(self, task):
+        """Animate, expire and fill toasts; stop once nothing is left"""
+        now = globalClock.getFrameTime()
+
+        for slot in self.slots:
+            toast = slot["toast"]
+            if toast is None:
+                continue
+            _, rise, _, _, duration = STYLES[toast["style"]]
+            elapsed = now - slot["started"]
+            if elapsed >= duration:
+                slot["toast"] = None
+                slot["text"].hide()
+            elif rise:
+                # Ease out towards the final height
+                progress = min(1.0, elapsed / RISE_TIME)
+                progress = 1.0 - (1.0 - progress) ** 2
+                slot["text"].setPos(slot["base"][0], slot["base"][1] + rise * progress)
+
+        if self.queue and now - self.last_shown >= MIN_INTERVAL:
+            for slot in self.slots:
+                if slot["toast"] is None:
+                    self.show(slot, self.queue.popleft(), now)
+                    self.last_shown = now
+                    break
+
+        if self.queue or any(slot["toast"] for slot in self.slots):
+            return Task.cont
+        return Task.done
+
+    def toggle(self):
+        """Turn routine messages on or off; return the new state"""
+        self.enabled = not self.enabled
+        return self.enabled
@@ -0,0 +1,97 @@
+"""Closed-form plant progress over many ticks.
+
+Between two scheduled events the growth modifier table is constant, so a
+plant's growth per tick only changes once - when its water runs out - and
+stops when it matures. grow_plants applies any number of such ticks to every
+plant in one NumPy pass. GardenSimulation uses it to fast-forward from one
+scheduled event to the next, and catch_up uses it to apply the time a player
+was away: it walks the weather and day events while plants are still growing,
+then jumps over the idle remainder in constant time.
+
+Pests and disease are not simulated while catching up.
+"""
+import numpy as np
+
+WATER_PER_TICK = 0.1  # Water a growing plant uses each tick
+WET_MULTIPLIER = 1.5
+DRY_MULTIPLIER = 0.5
+
+
+def base_growth_rates(plants, modifiers):
+    """Return each plant's growth per tick before the water effect"""
+    modifier = modifiers.gather(plants.column("type"), plants.column("fertilized"))
+    pest_multiplier = np.maximum(0.1, 1.0 - plants.column("pest_damage"))
+    return plants.column("growth_rate") * modifier * pest_multiplier
+
+
+def wet_ticks(water_level):
+    """Return how many more ticks each plant has water for"""
+    return np.where(water_level > 0, np.ceil(water_level / WATER_PER_TICK - 1e-9), 0.0)
+
+
+def ticks_to_mature(growth, wet, rate):
+    """Return the ticks each plant needs to reach full growth at a constant rate"""
+    needed = 1.0 - growth
+    wet_gain = WET_MULTIPLIER * rate * wet
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ticks = np.where(needed <= wet_gain,
+                         np.ceil(needed / (WET_MULTIPLIER * rate)),
+                         wet + np.ceil((needed - wet_gain) / (DRY_MULTIPLIER * rate)))
+    ticks[rate <= 0] = np.inf
+    ticks[needed <= 0] = 0
+    return ticks
+
+
+def grow_plants(plants, ticks, modifiers):
+    """Apply a number of constant-multiplier ticks of growth and water use"""
+    if not plants or ticks <= 0:
+        return
+
+    growth = plants.column("growth")
+    water_level = plants.column("water_level")
+    rate = base_growth_rates(plants, modifiers)
+    wet = wet_ticks(water_level)
+
+    # Plants only grow and drink until they mature
+    active = np.minimum(ticks, ticks_to_mature(growth, wet, rate))
+    wet_used = np.minimum(active, wet)
+    gain = rate * (WET_MULTIPLIER * wet_used + DRY_MULTIPLIER * (active - wet_used))
+
+    np.minimum(growth + gain, 1.0, out=growth)
+    water_level -= WATER_PER_TICK * wet_used
+
+
+def ticks_until_ready(plants, modifiers):
+    """Return the ticks until the next growing plant matures at current rates, or None"""
+    growth = plants.column("growth")
+    growing = growth < 1.0
+    if not growing.any():
+        return None
+
+    rate = base_growth_rates(plants, modifiers)
+    ticks = ticks_to_mature(growth[growing], wet_ticks(plants.column("water_level")[growing]), rate[growing])
+    soonest = ticks.min()
+    return None if np.isinf(soonest) else int(soonest)
+
+
+def catch_up(sim, ticks):
+    """Apply ticks of offline time to a simulation and return the days that passed"""
+    start_day = sim.day_count
+    end = sim.tick_count + ticks
+
+    sim.quiet = True
+    sim.cancel_random_events()
+    try:
+        # Walk weather and day events while something can still change
+        growth = sim.plants.column("growth")
+        while sim.tick_count < end and (growth < 1.0).any():
+            sim.advance_to_next_event(end)
+            growth = sim.plants.column("growth")
+
+        # Nothing grows any more: only the calendar and weather move on
+        if sim.tick_count < end:
+            sim.jump_to(end)
+    finally:
+        sim.quiet = False
+        sim.schedule_random_events()
+    return sim.day_count - start_day
@@ -0,0 +1,102 @@
+"""Background, atomic save writer.
+
+Saving is split in two. On the main thread GardenSimulation.snapshot() copies
+the state into plain data - scalars plus copies of the plant columns - which
+takes microseconds even for large gardens. Everything slow happens on a worker
+thread: turning the snapshot into bytes, writing them to a temporary file next
+to the save, fsyncing it, and renaming it over the old save. The rename is
+atomic, so a crash mid-save leaves the previous save intact.
+
+Saves requested while the worker is busy are coalesced: only the newest
+snapshot for each path is written.
+"""
+import json
+import os
+import threading
+from collections import deque
+
+from plant_store import plant_dicts
+
+
+def encode_json(snapshot):
+    """Encode a simulation snapshot as compact JSON bytes"""
+    state = dict(snapshot)
+    state["plants"] = plant_dicts(snapshot["plants"])
+    return json.dumps(state, separators=(",", ":")).encode("utf-8")
+
+
+def write_atomic(path, data):
+    """Write bytes to path via a fsynced temporary file and an atomic rename"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+    # Make the rename itself durable where directories can be fsynced
+    if hasattr(os, "O_DIRECTORY"):
+        directory = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+class SaveWriter:
+    """Encode and write save snapshots on a worker thread"""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.pending = {}  # path -> (snapshot, encode); newer saves replace older ones
+        self.busy = False
+        self.results = deque()  # (path, snapshot, error or None) waiting for poll()
+        self.closed = False
+        self.thread = threading.Thread(target=self.run, name="save_writer", daemon=True)
+        self.thread.start()
+
+    def save(self, path, snapshot, encode=encode_json):
+        """Queue a snapshot to be written to path"""
+        with self.condition:
+            self.pending[path] = (snapshot, encode)
+            self.condition.notify_all()
+
+    def poll(self):
+        """Return the (path, snapshot, error) results of finished saves since the last poll"""
+        results = []
+        while self.results:
+            results.append(self.results.popleft())
+        return results
+
+    def flush(self, timeout=None):
+        """Block until every queued save is on disk; return False on timeout"""
+        with self.condition:
+            return self.condition.wait_for(lambda: not self.pending and not self.busy, timeout)
+
+    def close(self, timeout=None):
+        """Finish queued saves and stop the worker thread"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join(timeout)
+
+    def run(self):
+        """Worker loop: write pending snapshots until closed"""
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending or self.closed)
+                if not self.pending:
+                    return
+                path = next(iter(self.pending))
+                snapshot, encode = self.pending.pop(path)
+                self.busy = True
+
+            try:
+                write_atomic(path, encode(snapshot))
+                self.results.append((path, snapshot, None))
+            except Exception as e:
+                self.results.append((path, snapshot, e))
+
+            with self.condition:
+                self.busy = False
+                self.condition.notify_all()
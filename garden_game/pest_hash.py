@@ -0,0 +1,73 @@
+"""Uniform spatial hash of pests over the plot grid.
+
+Pests live on plot cells rather than at free-floating positions. The hash keeps
+one bucket per occupied cell plus the total damage the pests in that cell deal
+per tick, so GardenSimulation can apply all pest damage as a single scatter-add
+and pesticide can query an area without looking at every pest.
+"""
+
+
+class PestSpatialHash:
+    """Bucket pests by the plot cell they are attached to"""
+
+    def __init__(self):
+        self.pests = {}  # pest id -> pest
+        self.cells = {}  # cell -> list of pests in that cell
+        self.cell_damage = {}  # cell -> summed damage of the pests in that cell
+
+    def __len__(self):
+        return len(self.pests)
+
+    def __iter__(self):
+        return iter(list(self.pests.values()))
+
+    def __bool__(self):
+        return bool(self.pests)
+
+    def insert(self, pest, cell):
+        """Attach a pest to a cell"""
+        pest["cell"] = cell
+        self.pests[pest["id"]] = pest
+        self.cells.setdefault(cell, []).append(pest)
+        self.cell_damage[cell] = self.cell_damage.get(cell, 0.0) + pest["damage"]
+
+    def remove(self, pest):
+        """Detach a pest from its cell and forget it"""
+        del self.pests[pest["id"]]
+        self._unlink(pest)
+
+    def move(self, pest, cell):
+        """Move a pest to another cell"""
+        self._unlink(pest)
+        pest["cell"] = cell
+        self.cells.setdefault(cell, []).append(pest)
+        self.cell_damage[cell] = self.cell_damage.get(cell, 0.0) + pest["damage"]
+
+    def at(self, cell):
+        """Return the pests attached to a cell"""
+        return list(self.cells.get(cell, ()))
+
+    def query_area(self, center, radius):
+        """Return the pests within a square of cells around a centre cell"""
+        found = []
+        for cell_x in range(center[0] - radius, center[0] + radius + 1):
+            for cell_y in range(center[1] - radius, center[1] + radius + 1):
+                found.extend(self.cells.get((cell_x, cell_y), ()))
+        return found
+
+    def clear(self):
+        """Remove every pest"""
+        self.pests = {}
+        self.cells = {}
+        self.cell_damage = {}
+
+    def _unlink(self, pest):
+        """Take a pest out of its current cell bucket"""
+        cell = pest["cell"]
+        bucket = self.cells[cell]
+        bucket.remove(pest)
+        if bucket:
+            self.cell_damage[cell] -= pest["damage"]
+        else:
+            del self.cells[cell]
+            del self.cell_damage[cell]
@@ -0,0 +1,44 @@
+"""Mouse picking for the garden view.
+
+Plots lie on the ground plane, so the plot under the mouse is found by
+intersecting the camera ray with that plane and snapping the hit point to the
+plot grid - constant time however large the scene gets, with no collision
+traversal.
+"""
+from panda3d.core import Plane, Point3, Vec3
+
+
+class GardenPicker:
+    """Turn mouse positions into plots"""
+
+    def __init__(self, camera, cam_node, render, grid):
+        self.camera = camera
+        self.cam_node = cam_node
+        self.render = render
+        self.grid = grid
+        self.ground_plane = Plane(Vec3(0, 0, 1), Point3(0, 0, 0))
+
+    def ground_point(self, mouse):
+        """Return where the camera ray through a mouse position meets the ground"""
+        near_point = Point3()
+        far_point = Point3()
+        if not self.cam_node.getLens().extrude(mouse, near_point, far_point):
+            return None
+
+        near_point = self.render.getRelativePoint(self.camera, near_point)
+        far_point = self.render.getRelativePoint(self.camera, far_point)
+        hit_point = Point3()
+        if not self.ground_plane.intersectsLine(hit_point, near_point, far_point):
+            return None
+
+        # The plane test works on the infinite line; ignore hits behind the camera
+        if (hit_point - near_point).dot(far_point - near_point) < 0:
+            return None
+        return hit_point
+
+    def pick_plot(self, mouse):
+        """Return the position of the plot under the mouse, if any"""
+        hit_point = self.ground_point(mouse)
+        if hit_point is None:
+            return None
+        return self.grid.snap(hit_point.getX(), hit_point.getY())
@@ -0,0 +1,274 @@
+"""Hardware-instanced plant rendering.
+
+Every plant type owns one card geometry (sunflowers include their stem in it)
+drawn with hardware instancing, so all plants of a type in a garden chunk cost
+one draw call. The per-instance position, scale and tint live in a float
+buffer texture that the vertex shader reads with gl_InstanceID. Each batch is
+drawn twice from the same buffer: with every card in the chunk's detail LOD
+level, and head cards only in its reduced level. Instances are packed:
+removing a plant moves the last instance of its batch into the freed slot, the
+same way PlantStore packs its rows.
+"""
+import numpy as np
+from panda3d.core import (Geom, GeomNode, GeomTriangles, GeomVertexArrayFormat, GeomVertexData,
+                          GeomVertexFormat, GeomVertexWriter, InternalName, Shader, Texture)
+
+TEXELS_PER_INSTANCE = 2  # (x, y, z, scale) then (r, g, b, a)
+HEAD_HALF_SIZE = 0.3
+STEM_HALF_SIZE = 0.1
+STEM_HEIGHT = 0.2
+STEM_COLOR = (0.2, 0.6, 0.2, 1)
+
+VERTEX_SHADER = """
+#version 150
+
+uniform mat4 p3d_ModelViewProjectionMatrix;
+uniform mat3 p3d_NormalMatrix;
+uniform samplerBuffer instances;
+uniform struct {
+    vec4 ambient;
+} p3d_LightModel;
+uniform struct {
+    vec4 diffuse;
+    vec4 position;
+} p3d_LightSource[2];
+
+in vec4 p3d_Vertex;
+in vec4 p3d_Color;
+in float stem;
+
+out vec4 color;
+
+void main() {
+    vec4 placement = texelFetch(instances, gl_InstanceID * 2);
+    vec4 tint = texelFetch(instances, gl_InstanceID * 2 + 1);
+
+    // The stem keeps its size and height; the head follows the growth stage
+    vec3 position;
+    if (stem > 0.5) {
+        position = vec3(placement.xy, 0.0) + p3d_Vertex.xyz;
+        color = p3d_Color;
+    } else {
+        position = placement.xyz + p3d_Vertex.xyz * placement.w;
+        color = tint;
+    }
+
+    // Cards face -Y; light them like the fixed-function pipeline would
+    vec3 normal = normalize(p3d_NormalMatrix * vec3(0, -1, 0));
+    vec3 light = p3d_LightModel.ambient.rgb;
+    for (int i = 0; i < 2; ++i) {
+        light += p3d_LightSource[i].diffuse.rgb * max(dot(normal, normalize(p3d_LightSource[i].position.xyz)), 0.0);
+    }
+    color.rgb *= min(light, vec3(1.0));
+
+    gl_Position = p3d_ModelViewProjectionMatrix * vec4(position, 1);
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 150
+
+in vec4 color;
+out vec4 p3d_FragColor;
+
+void main() {
+    p3d_FragColor = color;
+}
+"""
+
+
+def make_plant_geom(name, with_stem):
+    """Build the card geometry shared by every instance of a plant type"""
+    array_format = GeomVertexArrayFormat()
+    array_format.addColumn(InternalName.getVertex(), 3, Geom.NT_float32, Geom.C_point)
+    array_format.addColumn(InternalName.getColor(), 4, Geom.NT_float32, Geom.C_color)
+    array_format.addColumn(InternalName.make("stem"), 1, Geom.NT_float32, Geom.C_other)
+    vertex_format = GeomVertexFormat.registerFormat(GeomVertexFormat(array_format))
+
+    vertex_data = GeomVertexData(name, vertex_format, Geom.UHStatic)
+    vertex_writer = GeomVertexWriter(vertex_data, "vertex")
+    color_writer = GeomVertexWriter(vertex_data, "color")
+    stem_writer = GeomVertexWriter(vertex_data, "stem")
+    triangles = GeomTriangles(Geom.UHStatic)
+
+    cards = [(HEAD_HALF_SIZE, 0.0, (1, 1, 1, 1), 0.0)]
+    if with_stem:
+        cards.append((STEM_HALF_SIZE, STEM_HEIGHT, STEM_COLOR, 1.0))
+
+    row = 0
+    for half_size, height, color, is_stem in cards:
+        # Same orientation as CardMaker: a card in the XZ plane facing -Y
+        for corner_x, corner_z in ((-1, -1), (1, -1), (1, 1), (-1, 1)):
+            vertex_writer.addData3(corner_x * half_size, 0, height + corner_z * half_size)
+            color_writer.addData4(*color)
+            stem_writer.addData1(is_stem)
+        triangles.addVertices(row, row + 1, row + 2)
+        triangles.addVertices(row, row + 2, row + 3)
+        row += 4
+
+    geom = Geom(vertex_data)
+    geom.addPrimitive(triangles)
+    return geom
+
+
+class InstanceBatch:
+    """Instanced nodes and instance buffer for one plant type in one chunk"""
+
+    def __init__(self, chunk, name, with_stem, shader, capacity):
+        self.count = 0
+        self.plant_ids = []  # slot -> plant id
+        self.data = np.zeros((capacity * TEXELS_PER_INSTANCE, 4), np.float32)
+        self.dirty = False
+
+        self.nodes = []
+        for parent, full in ((chunk.detail, True), (chunk.reduced, False)):
+            geom_node = GeomNode(name)
+            geom_node.addGeom(make_plant_geom(name, with_stem and full))
+            # Instances are spread over the chunk, so the card's own bounds mean nothing
+            geom_node.setBounds(chunk.bounds)
+            geom_node.setFinal(True)
+            node = parent.attachNewNode(geom_node)
+            node.setShader(shader)
+            node.hide()
+            self.nodes.append(node)
+
+        self.texture = Texture(f"{name}_instances")
+        self.setup_texture()
+
+    def setup_texture(self):
+        """(Re)create the buffer texture to match the CPU-side capacity"""
+        self.texture.setupBufferTexture(len(self.data), Texture.T_float, Texture.F_rgba32, Geom.UHDynamic)
+        for node in self.nodes:
+            node.setShaderInput("instances", self.texture)
+        self.dirty = True
+
+    def add(self, plant_id):
+        """Claim the next free slot for a plant"""
+        if self.count * TEXELS_PER_INSTANCE == len(self.data):
+            grown = np.zeros((len(self.data) * 2, 4), np.float32)
+            grown[:len(self.data)] = self.data
+            self.data = grown
+            self.setup_texture()
+
+        slot = self.count
+        self.count += 1
+        self.plant_ids.append(plant_id)
+        return slot
+
+    def remove(self, slot):
+        """Free a slot and return the plant id moved into it, if any"""
+        last = self.count - 1
+        self.count -= 1
+        self.dirty = True
+        moved_id = self.plant_ids.pop()
+        if slot == last:
+            return None
+
+        first = slot * TEXELS_PER_INSTANCE
+        last_first = last * TEXELS_PER_INSTANCE
+        self.data[first:first + TEXELS_PER_INSTANCE] = self.data[last_first:last_first + TEXELS_PER_INSTANCE]
+        self.plant_ids[slot] = moved_id
+        return moved_id
+
+    def flush(self):
+        """Upload the active instances and update the draw count"""
+        if not self.dirty:
+            return
+        self.dirty = False
+
+        if self.count == 0:
+            for node in self.nodes:
+                node.hide()
+            return
+
+        used = self.count * TEXELS_PER_INSTANCE
+        image = np.frombuffer(memoryview(self.texture.modifyRamImage()), np.float32).reshape(-1, 4)
+        image[:used] = self.data[:used]
+        for node in self.nodes:
+            node.setInstanceCount(self.count)
+            node.show()
+
+
+class PlantInstancer:
+    """Per-chunk, per-type instanced plant batches keyed by plant id"""
+
+    def __init__(self, chunks, plant_types, capacity=16):
+        self.chunks = chunks
+        self.plant_types = plant_types
+        self.capacity = capacity
+        self.shader = Shader.make(Shader.SL_GLSL, VERTEX_SHADER, FRAGMENT_SHADER)
+        self.batches = {}  # (chunk key, type index) -> InstanceBatch, created on first use
+        self.slots = {}  # plant id -> (batch key, slot)
+        self.dirty = set()  # Batches changed since the last flush
+
+    def batch_for(self, plant):
+        """Return the key and batch a plant's instance belongs in"""
+        chunk = self.chunks.chunk_at(plant["position"])
+        key = (chunk.key, plant["type"])
+        batch = self.batches.get(key)
+        if batch is None:
+            plant_type = self.plant_types[plant["type"]]
+            name = f"plants_{plant_type['name']}_{chunk.key[0]}_{chunk.key[1]}"
+            batch = InstanceBatch(chunk, name, plant_type["name"] == "Sunflower", self.shader, self.capacity)
+            self.batches[key] = batch
+        return key, batch
+
+    def drop_chunk(self, chunk):
+        """Forget the batches of a chunk whose nodes were removed"""
+        for key in [key for key in self.batches if key[0] == chunk]:
+            self.dirty.discard(self.batches.pop(key))
+
+    def has(self, plant):
+        """Return whether a plant has an instance"""
+        return plant.id in self.slots
+
+    def add(self, plant):
+        """Give a plant an instance with its unscaled base look"""
+        key, batch = self.batch_for(plant)
+        slot = batch.add(plant.id)
+        self.slots[plant.id] = (key, slot)
+
+        x, y = plant["position"]
+        self.set_transform(plant, x, y, 0.5, 1.0)
+        self.set_tint(plant, self.plant_types[plant["type"]]["color"])
+
+    def remove(self, plant):
+        """Drop a plant's instance"""
+        key, slot = self.slots.pop(plant.id)
+        batch = self.batches[key]
+        moved_id = batch.remove(slot)
+        self.dirty.add(batch)
+        if moved_id is not None:
+            self.slots[moved_id] = (key, slot)
+        self.chunks.set_plant_color(plant["position"], None)
+
+    def set_transform(self, plant, x, y, z, scale):
+        """Place and scale a plant's instance"""
+        key, slot = self.slots[plant.id]
+        batch = self.batches[key]
+        batch.data[slot * TEXELS_PER_INSTANCE] = (x, y, z, scale)
+        batch.dirty = True
+        self.dirty.add(batch)
+
+    def set_z_scale(self, plant, z, scale):
+        """Change a plant's height and scale, keeping its position"""
+        key, slot = self.slots[plant.id]
+        batch = self.batches[key]
+        batch.data[slot * TEXELS_PER_INSTANCE, 2:] = (z, scale)
+        batch.dirty = True
+        self.dirty.add(batch)
+
+    def set_tint(self, plant, color):
+        """Colour a plant's instance and its spot on the chunk impostor"""
+        key, slot = self.slots[plant.id]
+        batch = self.batches[key]
+        batch.data[slot * TEXELS_PER_INSTANCE + 1] = color
+        batch.dirty = True
+        self.dirty.add(batch)
+        self.chunks.set_plant_color(plant["position"], color)
+
+    def flush(self):
+        """Upload every batch that changed this frame"""
+        for batch in self.dirty:
+            batch.flush()
+        self.dirty.clear()
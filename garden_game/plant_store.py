@@ -0,0 +1,226 @@
+"""Struct-of-arrays plant storage for GardenSimulation.
+
+Every plant attribute lives in its own NumPy column so the per-tick growth
+update is a handful of array expressions instead of a Python loop over dicts.
+PlantRecord keeps the old dict-style access (plant["growth"], plant["position"])
+for tool actions and UI code that only touch one plant at a time.
+"""
+import numpy as np
+
+# Column name -> dtype. Rows are packed: a removed plant is replaced by the last row.
+COLUMNS = {
+    "id": np.int64,
+    "type": np.int16,
+    "x": np.int32,
+    "y": np.int32,
+    "growth": np.float64,
+    "growth_rate": np.float64,
+    "water_level": np.float64,
+    "fertilized": np.bool_,
+    "pruned": np.bool_,
+    "pest_damage": np.float64,
+    "disease_level": np.float64,
+    "planted_day": np.int32,
+    "last_watered": np.int32,
+    "last_fertilized": np.int32,
+    "last_pruned": np.int32
+}
+
+# Keys exposed by PlantRecord on top of the raw columns
+DERIVED_KEYS = ("position", "stage")
+
+
+def plant_dicts(columns):
+    """Turn a PlantStore.snapshot() into the plain dicts PlantRecord.to_dict() returns"""
+    values = {name: column.tolist() for name, column in columns.items()}
+    keys = [name for name in COLUMNS if name not in ("id", "x", "y")]
+    plants = []
+    for row in range(len(values["id"])):
+        plant = {key: values[key][row] for key in keys}
+        plant["position"] = (values["x"][row], values["y"][row])
+        plant["stage"] = int(values["growth"][row] * 5)
+        plants.append(plant)
+    return plants
+
+
+class PlantRecord:
+    """Dict-style view of a single plant row"""
+
+    __slots__ = ("store", "id")
+
+    def __init__(self, store, plant_id):
+        self.store = store
+        self.id = plant_id
+
+    @property
+    def row(self):
+        """Current row of this plant in the store"""
+        return self.store.rows[self.id]
+
+    def __getitem__(self, key):
+        data = self.store.data
+        row = self.store.rows[self.id]
+        if key == "position":
+            return (int(data["x"][row]), int(data["y"][row]))
+        if key == "stage":
+            return int(data["growth"][row] * 5)
+        return data[key][row].item()
+
+    def __setitem__(self, key, value):
+        data = self.store.data
+        row = self.store.rows[self.id]
+        if key == "position":
+            data["x"][row], data["y"][row] = value
+        elif key in COLUMNS and key != "id":
+            data[key][row] = value
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in COLUMNS or key in DERIVED_KEYS
+
+    def __eq__(self, other):
+        return isinstance(other, PlantRecord) and other.store is self.store and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def get(self, key, default=None):
+        """Return a field value, or default for unknown keys"""
+        if key in self:
+            return self[key]
+        return default
+
+    def keys(self):
+        """Return every key the record understands"""
+        return [name for name in COLUMNS if name not in ("id", "x", "y")] + list(DERIVED_KEYS)
+
+    def to_dict(self):
+        """Return a plain-data copy suitable for saving"""
+        return {key: self[key] for key in self.keys()}
+
+
+class PlantStore:
+    """Growable table of plants stored as NumPy columns"""
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.next_id = 0
+        self.rows = {}  # plant id -> row
+        self.data = {name: np.zeros(capacity, dtype) for name, dtype in COLUMNS.items()}
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, row):
+        if not 0 <= row < self.count:
+            raise IndexError(row)
+        return PlantRecord(self, int(self.data["id"][row]))
+
+    def __iter__(self):
+        # Iterate over a snapshot so callers may remove plants while looping
+        return iter([PlantRecord(self, plant_id) for plant_id in self.data["id"][:self.count].tolist()])
+
+    def __bool__(self):
+        return self.count > 0
+
+    def column(self, name):
+        """Return a writable view of the active part of a column"""
+        return self.data[name][:self.count]
+
+    def snapshot(self):
+        """Return copies of the saved columns for the active plants"""
+        return {name: self.data[name][:self.count].copy() for name in COLUMNS}
+
+    def add_column(self, name, dtype):
+        """Attach an extra zero-filled column, e.g. view state that is never saved"""
+        if name not in self.data:
+            self.data[name] = np.zeros(len(self.data["id"]), dtype)
+
+    def record(self, plant_id):
+        """Return the record for a plant id"""
+        return PlantRecord(self, plant_id)
+
+    def add(self, plant_data):
+        """Append a plant from a dict and return its record"""
+        if self.count == len(self.data["id"]):
+            self._grow_capacity()
+
+        row = self.count
+        plant_id = self.next_id
+        self.next_id += 1
+        self.count += 1
+        for column in self.data.values():
+            column[row] = 0
+        self.data["id"][row] = plant_id
+        self.rows[plant_id] = row
+
+        record = PlantRecord(self, plant_id)
+        for key, value in plant_data.items():
+            if key == "position" or (key in COLUMNS and key != "id"):
+                record[key] = value
+        return record
+
+    def extend(self, records):
+        """Append plants from a structured array of column values and return their ids"""
+        count = len(records)
+        while self.count + count > len(self.data["id"]):
+            self._grow_capacity()
+
+        start = self.count
+        rows = slice(start, start + count)
+        for column in self.data.values():
+            column[rows] = 0
+        ids = np.arange(self.next_id, self.next_id + count)
+        self.data["id"][rows] = ids
+        for name in records.dtype.names:
+            if name in COLUMNS and name != "id":
+                self.data[name][rows] = records[name]
+
+        self.rows.update(zip(ids.tolist(), range(start, start + count)))
+        self.next_id += count
+        self.count += count
+        return ids
+
+    def remove(self, plant):
+        """Remove a plant by moving the last row into its slot"""
+        row = self.rows.pop(plant.id)
+        last = self.count - 1
+        if row != last:
+            for column in self.data.values():
+                column[row] = column[last]
+            self.rows[int(self.data["id"][row])] = row
+        self.count -= 1
+
+    def clear(self):
+        """Remove every plant"""
+        self.count = 0
+        self.rows = {}
+
+    def _grow_capacity(self):
+        """Double the capacity of every column"""
+        for name, column in self.data.items():
+            grown = np.zeros(len(column) * 2, column.dtype)
+            grown[:self.count] = column[:self.count]
+            self.data[name] = grown
+
+    def grow(self, modifiers):
+        """Apply one tick of growth and water use to every plant"""
+        if self.count == 0:
+            return
+
+        growth = self.column("growth")
+        water_level = self.column("water_level")
+        growing = growth < 1.0
+
+        # Water effect: watered plants grow faster and use up their water
+        watered = growing & (water_level > 0)
+        water_multiplier = np.where(watered, 1.5, 0.5)
+        water_level[watered] -= 0.1
+
+        # Weather, season and fertilizer effects come from one table gather
+        modifier = modifiers.gather(self.column("type"), self.column("fertilized"))
+        pest_multiplier = np.maximum(0.1, 1.0 - self.column("pest_damage"))
+
+        final_rate = self.column("growth_rate") * water_multiplier * modifier * pest_multiplier
+        np.minimum(growth + final_rate, 1.0, out=growth, where=growing)
@@ -0,0 +1,81 @@
+"""Batched plot geometry for the garden view.
+
+Instead of two CardMaker nodes per plot, every plot and its border are written
+into one GeomVertexData per garden chunk, so a chunk costs a single draw call
+however many plots it holds. The same node is instanced into the chunk's
+detail and reduced LOD levels. A chunk's mesh is built when GardenChunks
+first shows it. Plot colours are vertex colours: changing the
+soil colour of one plot rewrites its four vertices in place without adding
+nodes or render states.
+"""
+from panda3d.core import (Geom, GeomNode, GeomTriangles, GeomVertexData, GeomVertexFormat,
+                          GeomVertexWriter)
+
+PLOT_HALF_SIZE = 0.8
+BORDER_HALF_SIZE = 0.9
+PLOT_HEIGHT = 0.05
+BORDER_HEIGHT = 0.02
+
+PLOT_COLOR = (0.4, 0.2, 0.1, 1)  # Brown dirt color
+WET_PLOT_COLOR = (0.25, 0.13, 0.07, 1)  # Darker soil while a plant has water
+BORDER_COLOR = (0.3, 0.2, 0.1, 1)
+
+
+class PlotMesh:
+    """Flat plot and border quads, one GeomNode per garden chunk"""
+
+    def __init__(self, grid, chunks):
+        self.grid = grid
+        self.chunks = chunks
+        self.vertex_data = {}  # chunk key -> GeomVertexData
+        self.plot_vertices = {}  # cell -> (chunk key, first vertex of the plot quad)
+        chunks.realize_listeners.append(self.build_chunk)
+
+    def build_chunk(self, garden_chunk):
+        """Write the plots and borders of one chunk into a single Geom"""
+        chunk, cells = garden_chunk.key, garden_chunk.cells
+        vertex_data = GeomVertexData(f"plots_{chunk[0]}_{chunk[1]}", GeomVertexFormat.getV3n3c4(), Geom.UHStatic)
+        vertex_data.setNumRows(len(cells) * 8)
+        vertex_writer = GeomVertexWriter(vertex_data, "vertex")
+        normal_writer = GeomVertexWriter(vertex_data, "normal")
+        color_writer = GeomVertexWriter(vertex_data, "color")
+        triangles = GeomTriangles(Geom.UHStatic)
+
+        row = 0
+        for cell in cells:
+            x, y = self.grid.position_of(cell)
+            soil_color = tuple(garden_chunk.soil[garden_chunk.local(cell)])
+            for half_size, height, color in ((BORDER_HALF_SIZE, BORDER_HEIGHT, BORDER_COLOR),
+                                             (PLOT_HALF_SIZE, PLOT_HEIGHT, soil_color)):
+                for corner_x, corner_y in ((-1, -1), (1, -1), (1, 1), (-1, 1)):
+                    vertex_writer.addData3(x + corner_x * half_size, y + corner_y * half_size, height)
+                    normal_writer.addData3(0, 0, 1)
+                    color_writer.addData4(*color)
+                triangles.addVertices(row, row + 1, row + 2)
+                triangles.addVertices(row, row + 2, row + 3)
+                row += 4
+            self.plot_vertices[cell] = (chunk, row - 4)
+
+        geom = Geom(vertex_data)
+        geom.addPrimitive(triangles)
+        geom_node = GeomNode(f"plots_{chunk[0]}_{chunk[1]}")
+        geom_node.addGeom(geom)
+        garden_chunk.detail.attachNewNode(geom_node).instanceTo(garden_chunk.reduced)
+        self.vertex_data[chunk] = geom_node.modifyGeom(0).modifyVertexData()
+
+    def drop_chunk(self, chunk):
+        """Forget the mesh of a chunk whose nodes were removed"""
+        if self.vertex_data.pop(chunk, None) is not None:
+            for cell in self.grid.chunk_cells(chunk):
+                self.plot_vertices.pop(cell, None)
+
+    def set_plot_color(self, cell, color):
+        """Recolour the soil of one plot, now or when its chunk is built"""
+        self.chunks.set_soil_color(cell, color)
+        if cell not in self.plot_vertices:
+            return
+        chunk, first_vertex = self.plot_vertices[cell]
+        color_writer = GeomVertexWriter(self.vertex_data[chunk], "color")
+        color_writer.setRow(first_vertex)
+        for _ in range(4):
+            color_writer.setData4(*color)
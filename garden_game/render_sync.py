@@ -0,0 +1,81 @@
+"""Dirty-flag synchronisation of plant visuals with the scene graph.
+
+A plant's look only depends on a few quantized values: its growth stage, a
+health tint, whether it is visibly diseased and whether its soil is wet. PlantRenderSync packs those into
+one integer per plant, kept in an extra PlantStore column so it follows the row
+on swap-remove, and compares the packed keys for every plant in one NumPy pass.
+NodePaths are only touched for the plants whose key changed, which keeps
+Panda3D's transform and render-state caches valid for everything else.
+"""
+import numpy as np
+
+HEALTH_STEPS = 20  # Tint levels between dead (0.0) and healthy (1.0)
+MIN_HEALTH = 0.3  # Damaged plants never get darker than this
+DISEASE_VISIBLE = 0.5  # Disease level at which plants turn reddish
+
+# Packed render key layout
+STAGE_MASK = 0x7
+HEALTH_SHIFT = 3
+HEALTH_MASK = 0x1f << HEALTH_SHIFT
+DISEASED_BIT = 1 << 8
+WET_BIT = 1 << 9
+SYNCED_BIT = 1 << 15  # Set on every computed key, so 0 means "never drawn"
+
+# Dirty bits handed to the apply callback
+DIRTY_STAGE = 1
+DIRTY_TINT = 2
+DIRTY_MOISTURE = 4
+
+
+class PlantRenderSync:
+    """Push quantized plant visuals to the scene graph only when they change"""
+
+    def __init__(self, plants, apply_visual):
+        self.plants = plants
+        self.apply_visual = apply_visual  # callback(plant, stage, health, diseased, wet, dirty)
+        self.plants.add_column("render_key", np.int32)
+
+    def render_keys(self):
+        """Return the packed render key of every plant"""
+        growth = self.plants.column("growth")
+        disease_level = self.plants.column("disease_level")
+        health = np.maximum(MIN_HEALTH, 1.0 - self.plants.column("pest_damage") - disease_level)
+
+        stage = (growth * 5).astype(np.int32)
+        health_level = (health * HEALTH_STEPS).astype(np.int32)
+        keys = stage | (health_level << HEALTH_SHIFT) | SYNCED_BIT
+        keys[disease_level > DISEASE_VISIBLE] |= DISEASED_BIT
+        keys[self.plants.column("water_level") > 0] |= WET_BIT
+        return keys
+
+    def sync(self):
+        """Apply visual changes since the last sync and return how many plants changed"""
+        if not self.plants:
+            return 0
+
+        keys = self.render_keys()
+        synced = self.plants.column("render_key")
+        changed = np.flatnonzero(keys != synced)
+        if len(changed) == 0:
+            return 0
+
+        for row, old_key, key in zip(changed.tolist(), synced[changed].tolist(), keys[changed].tolist()):
+            dirty = 0
+            if not old_key or (old_key ^ key) & STAGE_MASK:
+                dirty |= DIRTY_STAGE
+            if not old_key or (old_key ^ key) & (HEALTH_MASK | DISEASED_BIT):
+                dirty |= DIRTY_TINT
+            if not old_key or (old_key ^ key) & WET_BIT:
+                dirty |= DIRTY_MOISTURE
+
+            self.apply_visual(
+                self.plants[row],
+                key & STAGE_MASK,
+                ((key & HEALTH_MASK) >> HEALTH_SHIFT) / HEALTH_STEPS,
+                bool(key & DISEASED_BIT),
+                bool(key & WET_BIT),
+                dirty
+            )
+
+        synced[changed] = keys[changed]
+        return len(changed)
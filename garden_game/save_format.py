@@ -0,0 +1,75 @@
+"""Versioned binary save format.
+
+A save file is laid out as:
+
+    header   HEADER: magic, format version, plant count, section sizes
+    meta     zlib-compressed JSON of everything except plants (economy,
+             inventory, stats, achievements, calendar)
+    padding  up to PLANT_ALIGNMENT bytes
+    plants   plant_count fixed-width little-endian PLANT_DTYPE records
+
+Plant records are stored uncompressed so read_save can memory-map the file
+and hand GardenSimulation a NumPy view of them: pages are only read as the
+columns are copied into the plant store, and no per-plant Python objects are
+built. Files that do not start with MAGIC are read as legacy JSON saves.
+"""
+import json
+import mmap
+import struct
+import zlib
+
+import numpy as np
+
+from plant_store import COLUMNS
+
+MAGIC = b"GGSV"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIII")  # magic, version, reserved, plant count, meta size, plants offset
+PLANT_ALIGNMENT = 8
+
+# One packed record per plant; the id is reassigned on load
+PLANT_DTYPE = np.dtype([(name, np.dtype(dtype).newbyteorder("<")) for name, dtype in COLUMNS.items() if name != "id"])
+
+
+def plant_records(columns):
+    """Pack PlantStore.snapshot() columns into a PLANT_DTYPE array"""
+    records = np.empty(len(columns["id"]), PLANT_DTYPE)
+    for name in PLANT_DTYPE.names:
+        records[name] = columns[name]
+    return records
+
+
+def encode_binary(snapshot):
+    """Encode a simulation snapshot in the binary save format"""
+    meta = {key: value for key, value in snapshot.items() if key != "plants"}
+    meta_bytes = zlib.compress(json.dumps(meta, separators=(",", ":")).encode("utf-8"))
+    records = plant_records(snapshot["plants"])
+
+    plants_offset = HEADER.size + len(meta_bytes)
+    padding = -plants_offset % PLANT_ALIGNMENT
+    plants_offset += padding
+    header = HEADER.pack(MAGIC, VERSION, 0, len(records), len(meta_bytes), plants_offset)
+    return b"".join((header, meta_bytes, b"\0" * padding, records.tobytes()))
+
+
+def decode_binary(buffer):
+    """Decode a binary save held in a bytes-like object or mmap"""
+    magic, version, _, plant_count, meta_size, plants_offset = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("Not a garden save file")
+    if version > VERSION:
+        raise ValueError(f"Save format version {version} is newer than this game supports")
+
+    state = json.loads(zlib.decompress(buffer[HEADER.size:HEADER.size + meta_size]))
+    state["plants"] = np.frombuffer(buffer, PLANT_DTYPE, plant_count, plants_offset)
+    return state
+
+
+def read_save(path):
+    """Read a binary or legacy JSON save; binary plants are a memory-mapped record array"""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            f.seek(0)
+            return json.load(f)
+        # The mapping stays valid after the file is closed and lives as long as the plant array
+        return decode_binary(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
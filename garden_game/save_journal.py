@@ -0,0 +1,190 @@
+"""Append-only save journal for crash recovery between full saves.
+
+Full saves cost time proportional to the garden; the journal costs time
+proportional to what the player does. Every plant the player changes is
+written as a small JSON line (the plant's new record, or its removal), as is
+every chunk of land bought, and once per frame any change to money,
+inventory, level or stats is written as the fields that changed. A worker
+thread appends and fsyncs the lines, so a crash loses at most the last few
+milliseconds of play.
+
+Each entry carries a sequence number and the simulation tick it happened on.
+A save records the last sequence number it includes; once it is on disk the
+journal is compacted down to the entries after it. Recovery loads the save,
+then replays the newer entries in order, catching the garden up to each
+entry's tick in closed form before applying it.
+"""
+import copy
+import json
+import os
+import threading
+import time
+
+from offline_progress import catch_up
+from persistence import write_atomic
+
+ECONOMY_FIELDS = ("money", "experience", "level", "skill_points", "seeds_inventory",
+                  "fertilizer", "pesticide", "water_can_level", "stats")
+
+
+def economy_state(sim):
+    """Return copies of the scalar and inventory fields the journal tracks"""
+    return {name: copy.deepcopy(getattr(sim, name)) for name in ECONOMY_FIELDS}
+
+
+def read_journal(path):
+    """Return the entries of a journal file, ignoring a torn final line"""
+    entries = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    break
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def replay(sim, save_data, entries):
+    """Apply journal entries newer than a loaded save; return the wall time of the last one"""
+    last_time = save_data.get("saved_at")
+    for entry in entries:
+        if entry["seq"] <= save_data.get("journal_seq", 0):
+            continue
+        if entry["tick"] > sim.tick_count:
+            catch_up(sim, entry["tick"] - sim.tick_count)
+
+        kind = entry["kind"]
+        if kind == "plant":
+            sim.restore_plant(entry["plant"])
+        elif kind == "remove":
+            plant = sim.find_plant(entry["position"])
+            if plant:
+                sim.remove_plant(plant)
+        elif kind == "economy":
+            for name, value in entry["fields"].items():
+                setattr(sim, name, value)
+        elif kind == "achievement":
+            sim.restore_achievement(entry["achievement"])
+        elif kind == "land":
+            sim.restore_land(tuple(entry["chunk"]))
+        last_time = entry["time"]
+    return last_time
+
+
+class SaveJournal:
+    """Record simulation changes and append them to a journal file on a worker thread"""
+
+    def __init__(self, sim, path):
+        self.sim = sim
+        self.path = path
+        self.seq = 0
+        self.recording = True  # Off while loading or replaying
+        self.entries_since_save = 0
+        self.economy = economy_state(sim)
+
+        self.condition = threading.Condition()
+        self.pending = []  # Encoded lines waiting for the worker
+        self.compact_after = None  # Sequence number a finished save includes
+        self.closed = False
+        self.thread = threading.Thread(target=self.run, name="save_journal", daemon=True)
+        self.thread.start()
+
+        for event in ("plant_added", "plant_watered", "plant_fertilized", "plant_pruned"):
+            sim.subscribe(event, self.record_plant)
+        sim.subscribe("plant_removed", self.record_removal)
+        sim.subscribe("achievement", self.record_achievement)
+        sim.subscribe("land_bought", self.record_land)
+
+    def record_plant(self, plant):
+        """Journal a plant's full record after it was added or changed"""
+        self.record("plant", plant=plant.to_dict())
+
+    def record_removal(self, plant):
+        """Journal a plant being removed"""
+        self.record("remove", position=plant["position"])
+
+    def record_achievement(self, achievement):
+        """Journal an earned achievement"""
+        self.record("achievement", achievement=achievement)
+
+    def record_land(self, chunk):
+        """Journal a chunk of land being bought"""
+        self.record("land", chunk=list(chunk))
+
+    def record(self, kind, **data):
+        """Queue one journal entry"""
+        if not self.recording:
+            return
+        self.seq += 1
+        self.entries_since_save += 1
+        entry = {"seq": self.seq, "tick": self.sim.tick_count, "time": time.time(), "kind": kind}
+        entry.update(data)
+        with self.condition:
+            self.pending.append(json.dumps(entry, separators=(",", ":")) + "\n")
+            self.condition.notify_all()
+
+    def sync_economy(self):
+        """Queue the economy fields that changed since the last call"""
+        if not self.recording:
+            return
+        current = economy_state(self.sim)
+        changed = {name: value for name, value in current.items() if self.economy[name] != value}
+        if changed:
+            self.economy = current
+            self.record("economy", fields=changed)
+
+    def mark_save(self):
+        """Return the sequence number a save taken now includes"""
+        self.entries_since_save = 0
+        return self.seq
+
+    def restart(self, entries=()):
+        """Resume recording from the simulation's current state, e.g. after a load"""
+        # Continue numbering after entries already in the file so replays never skip them
+        self.seq = max([self.seq] + [entry["seq"] for entry in entries])
+        self.economy = economy_state(self.sim)
+        self.recording = True
+
+    def compact(self, seq):
+        """Drop entries up to seq once a save including them is on disk"""
+        with self.condition:
+            self.compact_after = seq
+            self.condition.notify_all()
+
+    def close(self, timeout=None):
+        """Write queued entries and stop the worker thread"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join(timeout)
+
+    def run(self):
+        """Worker loop: append queued lines and compact the file when asked"""
+        f = open(self.path, "a", encoding="utf-8")
+        try:
+            while True:
+                with self.condition:
+                    self.condition.wait_for(lambda: self.pending or self.compact_after is not None or self.closed)
+                    lines, self.pending = self.pending, []
+                    compact_after, self.compact_after = self.compact_after, None
+                    closed = self.closed
+
+                if lines:
+                    f.writelines(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                if compact_after is not None:
+                    f.close()
+                    kept = [entry for entry in read_journal(self.path) if entry["seq"] > compact_after]
+                    write_atomic(self.path, "".join(json.dumps(entry, separators=(",", ":")) + "\n"
+                                                    for entry in kept).encode("utf-8"))
+                    f = open(self.path, "a", encoding="utf-8")
+
+                if closed and not lines:
+                    return
+        finally:
+            f.close()
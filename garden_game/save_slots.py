@@ -0,0 +1,140 @@
+"""Save slots with a metadata index.
+
+Every save file is a slot. A small JSON index next to the slots holds what the
+load dialog shows for each one - level, money, day, plant count, when it was
+saved and a thumbnail image - so listing dozens of slots reads one small file
+instead of opening every save. The index also remembers the most recently
+used slot, which can be read into memory on a background thread ahead of time
+so that loading it does not wait on the disk. Thumbnails are copied out of the
+framebuffer on the main thread, but scaled and encoded by the save writer.
+"""
+import copy
+import json
+import os
+import threading
+
+import numpy as np
+from panda3d.core import PNMImage, StringStream
+
+from save_format import read_save
+
+SLOT_DIRECTORY = "saves"
+THUMBNAIL_SIZE = (160, 90)
+
+
+def encode_index(index):
+    """Encode the slot index as JSON bytes"""
+    return json.dumps(index, indent=1).encode("utf-8")
+
+
+def slot_metadata(path, snapshot, thumbnail=None):
+    """Return the index entry describing a save snapshot"""
+    return {
+        "path": path,
+        "level": snapshot["level"],
+        "money": snapshot["money"],
+        "day_count": snapshot["day_count"],
+        "plants": len(snapshot["plants"]["id"]),
+        "saved_at": snapshot["saved_at"],
+        "thumbnail": thumbnail
+    }
+
+
+def capture_frame(window):
+    """Copy the window's last frame into a RAM-only texture, or return None"""
+    return window.getScreenshot() if window is not None else None
+
+
+def encode_thumbnail(frame, size=THUMBNAIL_SIZE):
+    """Scale a captured frame down and encode it as PNG bytes"""
+    screenshot = PNMImage()
+    if not frame.store(screenshot):
+        raise IOError("Could not read the captured frame")
+    thumbnail = PNMImage(size[0], size[1])
+    thumbnail.quickFilterFrom(screenshot)
+    stream = StringStream()
+    if not thumbnail.write(stream, "thumbnail.png"):
+        raise IOError("Could not encode the thumbnail")
+    return stream.getData()
+
+
+class SaveSlots:
+    """Index of save slots and a background preload of the most recent one"""
+
+    def __init__(self, directory=SLOT_DIRECTORY):
+        self.directory = directory
+        self.index_path = os.path.join(directory, "index.json")
+        os.makedirs(directory, exist_ok=True)
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self.index = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.index = {"slots": {}, "recent": None}
+        self.preloaded = {}  # path -> (modification time, save data)
+
+    def slot_path(self, name):
+        """Return the save file of a named slot"""
+        return os.path.join(self.directory, f"{name}.sav")
+
+    def thumbnail_path(self, name):
+        """Return the thumbnail image of a named slot"""
+        return os.path.join(self.directory, f"{name}.png")
+
+    def name_of(self, path):
+        """Return the slot name of a save file"""
+        return os.path.splitext(os.path.basename(path))[0]
+
+    def record(self, path, snapshot, thumbnail=None, recent=True):
+        """Describe a finished save in the index, optionally as the most recent slot"""
+        name = self.name_of(path)
+        if thumbnail is None:
+            thumbnail = self.index["slots"].get(name, {}).get("thumbnail")
+        self.index["slots"][name] = slot_metadata(path, snapshot, thumbnail)
+        if recent:
+            self.index["recent"] = name
+        self.preloaded.pop(path, None)
+
+    def touch(self, path):
+        """Make a slot the most recently used one"""
+        name = self.name_of(path)
+        if name in self.index["slots"]:
+            self.index["recent"] = name
+
+    def snapshot(self):
+        """Return a copy of the index for the save writer"""
+        return copy.deepcopy(self.index)
+
+    def listing(self):
+        """Return (name, metadata) for every slot whose file exists, newest first"""
+        slots = [(name, meta) for name, meta in self.index["slots"].items() if os.path.exists(meta["path"])]
+        return sorted(slots, key=lambda slot: slot[1]["saved_at"], reverse=True)
+
+    def recent_path(self):
+        """Return the save file of the most recently used slot, if any"""
+        meta = self.index["slots"].get(self.index["recent"])
+        return meta["path"] if meta else None
+
+    def preload(self, path=None):
+        """Read a slot (by default the most recent one) into memory on a background thread"""
+        path = path or self.recent_path()
+        if path and os.path.exists(path) and path not in self.preloaded:
+            threading.Thread(target=self.read_into_cache, args=(path,), name="slot_preload", daemon=True).start()
+
+    def read_into_cache(self, path):
+        """Read a save fully into memory and cache it"""
+        try:
+            mtime = os.path.getmtime(path)
+            save_data = read_save(path)
+            if isinstance(save_data.get("plants"), np.ndarray):
+                # Copy the records out of the memory map so loading never touches the disk
+                save_data["plants"] = np.array(save_data["plants"])
+            self.preloaded[path] = (mtime, save_data)
+        except Exception:
+            pass
+
+    def read(self, path):
+        """Return a slot's save data, from the preload cache when it is still current"""
+        cached = self.preloaded.pop(path, None)
+        if cached and os.path.exists(path) and os.path.getmtime(path) == cached[0]:
+            return cached[1]
+        return read_save(path)
@@ -0,0 +1,89 @@
+"""Event scheduler in simulation ticks.
+
+Periodic and random game events (weather rolls, day rollover, pest spawns,
+disease onset, auto-save) are kept in one binary heap ordered by the tick they
+are due, instead of each being polled every tick. Random events follow Poisson
+processes: their next time is sampled from an exponential distribution, so a
+tick with nothing due costs a single comparison, and GardenSimulation can skip
+straight to the next due event when nothing else needs per-tick work.
+"""
+import heapq
+
+
+class ScheduledEvent:
+    """Handle for a scheduled callback"""
+
+    __slots__ = ("time", "callback", "interval", "cancelled")
+
+    def __init__(self, time, callback, interval):
+        self.time = time
+        self.callback = callback
+        self.interval = interval  # Ticks between repeats, or None for one-shot events
+        self.cancelled = False
+
+
+class EventScheduler:
+    """Binary heap of callbacks keyed by simulation tick"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.queue = []  # (time, sequence, event)
+        self.sequence = 0  # Keeps events due on the same tick in scheduling order
+
+    def __len__(self):
+        return len(self.queue)
+
+    def schedule_at(self, time, callback, interval=None):
+        """Run callback at a tick, then every interval ticks if given"""
+        event = ScheduledEvent(time, callback, interval)
+        self.push(event)
+        return event
+
+    def schedule_in(self, delay, callback, interval=None):
+        """Run callback after delay ticks, then every interval ticks if given"""
+        return self.schedule_at(self.now + delay, callback, interval)
+
+    def schedule_every(self, interval, callback):
+        """Run callback every interval ticks, starting one interval from now"""
+        return self.schedule_at(self.now + interval, callback, interval)
+
+    def cancel(self, event):
+        """Stop an event from running; cancelled events are dropped lazily"""
+        if event is not None:
+            event.cancelled = True
+
+    def push(self, event):
+        """Add an event to the heap"""
+        heapq.heappush(self.queue, (event.time, self.sequence, event))
+        self.sequence += 1
+
+    def next_time(self):
+        """Return the tick of the next live event, or None"""
+        while self.queue and self.queue[0][2].cancelled:
+            heapq.heappop(self.queue)
+        return self.queue[0][0] if self.queue else None
+
+    def run_until(self, time):
+        """Run every event due at or before a tick, in time order"""
+        queue = self.queue
+        while queue and queue[0][0] <= time:
+            event = heapq.heappop(queue)[2]
+            if event.cancelled:
+                continue
+            self.now = event.time
+            event.callback()
+            if event.interval and not event.cancelled:
+                event.time += event.interval
+                self.push(event)
+        self.now = time
+
+    def shift(self, delta):
+        """Move every event and the current time by delta ticks"""
+        for _, _, event in self.queue:
+            event.time += delta
+        self.queue = [(event.time, sequence, event) for _, sequence, event in self.queue]
+        self.now += delta
+
+    def clear(self):
+        """Drop every event"""
+        self.queue = []
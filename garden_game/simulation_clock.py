@@ -0,0 +1,47 @@
+"""Fixed-timestep clock that drives GardenSimulation from wall time.
+
+Every rule in the simulation is expressed per tick, so the clock converts the
+variable frame time reported by Panda3D into a whole number of ticks. Left over
+time is carried in an accumulator to the next frame, which makes simulated
+time depend only on wall time and the game speed, never on the frame rate.
+"""
+
+TICK_RATE = 60  # Simulation ticks per second at normal speed
+
+
+class SimulationClock:
+    """Accumulate frame time and hand out fixed simulation ticks"""
+
+    def __init__(self, tick_rate=TICK_RATE, max_frame_time=0.25, max_ticks_per_frame=1000):
+        self.tick_rate = tick_rate
+        self.max_frame_time = max_frame_time  # Longer hitches are not caught up
+        self.max_ticks_per_frame = max_ticks_per_frame  # Keeps turbo from spiralling
+        self.speed = 1.0
+        self.paused = False
+        self.accumulator = 0.0  # Owed ticks, including the fractional part
+
+    def set_speed(self, speed):
+        """Set the game speed multiplier (0.5 = slow motion, 100 = turbo)"""
+        self.speed = max(0.0, speed)
+
+    def advance(self, dt):
+        """Add one frame of wall time and return the ticks to simulate"""
+        if self.paused:
+            return 0
+
+        self.accumulator += min(dt, self.max_frame_time) * self.speed * self.tick_rate
+        ticks = int(self.accumulator)
+
+        # When a frame owes more ticks than the budget allows, drop the excess
+        # instead of carrying it forward: simulated time slows down rather than
+        # each frame taking longer than the last.
+        if ticks > self.max_ticks_per_frame:
+            ticks = self.max_ticks_per_frame
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= ticks
+        return ticks
+
+    def ticks_to_seconds(self, ticks):
+        """Convert simulation ticks to seconds of normal-speed time"""
+        return ticks / self.tick_rate
@@ -0,0 +1,135 @@
+"""Vectorized rain and snow.
+
+Every drop or flake is a row in NumPy position and velocity arrays that are
+integrated together each frame. The result is written straight into the
+vertex buffer of a single Geom through a memoryview of its
+GeomVertexArrayData, so tens of thousands of particles cost one draw call and
+a few array operations. Rain is drawn as short line streaks along each drop's
+velocity, snow as points. The vertex buffer holds every head, then every
+rain tail, so each frame is a couple of contiguous array writes.
+"""
+import numpy as np
+from panda3d.core import (BoundingBox, Geom, GeomLines, GeomNode, GeomPoints, GeomVertexData,
+                          GeomVertexFormat, Point3, TransparencyAttrib)
+
+MAX_PARTICLES = 50000
+AREA_HALF_SIZE = 25.0  # Particles fall over a square this far either side of the origin
+CEILING = 20.0
+STREAK_TIME = 0.03  # Seconds of travel a rain streak spans
+
+# weather -> (particle count, style, colour, fall speed, sideways drift)
+WEATHER_STYLES = {
+    "Rainy": (20000, "rain", (0.3, 0.6, 1.0, 0.6), 18.0, 0.5),
+    "Stormy": (50000, "rain", (0.4, 0.5, 0.8, 0.7), 25.0, 4.0),
+    "Snowy": (30000, "snow", (1.0, 1.0, 1.0, 0.9), 1.5, 0.6)
+}
+
+
+def line_primitive(count):
+    """Return lines joining vertex i (a head) to vertex count + i (its tail)"""
+    primitive = GeomLines(Geom.UHStatic)
+    primitive.setIndexType(Geom.NTUint32)
+    indices = primitive.modifyVertices()
+    indices.uncleanSetNumRows(count * 2)
+    pairs = np.frombuffer(memoryview(indices), np.uint32).reshape(-1, 2)
+    pairs[:, 0] = np.arange(count)
+    pairs[:, 1] = pairs[:, 0] + count
+    return primitive
+
+
+class WeatherParticles:
+    """Rain and snow particles simulated in NumPy and drawn as one Geom"""
+
+    def __init__(self, parent, capacity=MAX_PARTICLES, seed=None):
+        self.capacity = capacity
+        self.rng = np.random.default_rng(seed)
+        self.weather = None
+        self.count = 0
+        self.style = None
+        self.drift = 0.0
+        self.time = 0.0
+        self.positions = np.zeros((capacity, 3), np.float32)
+        self.velocities = np.zeros((capacity, 3), np.float32)
+        self.step = np.zeros((capacity, 3), np.float32)  # Scratch space for velocity * dt
+        self.phases = self.rng.uniform(0, 2 * np.pi, capacity).astype(np.float32)
+
+        self.vdata = GeomVertexData("weather", GeomVertexFormat.getV3(), Geom.UHDynamic)
+        self.vdata.uncleanSetNumRows(capacity * 2)
+        self.node = GeomNode("weather_particles")
+        self.node.addGeom(Geom(self.vdata))
+        node = self.node
+        node.setBounds(BoundingBox(Point3(-AREA_HALF_SIZE, -AREA_HALF_SIZE, 0),
+                                   Point3(AREA_HALF_SIZE, AREA_HALF_SIZE, CEILING)))
+        node.setFinal(True)  # Never recompute bounds from the moving vertices
+
+        self.root = parent.attachNewNode(node)
+        self.root.setTransparency(TransparencyAttrib.MAlpha)
+        self.root.setLightOff()
+        self.root.setDepthWrite(False)
+        self.root.setBin("fixed", 10)
+        self.root.hide()
+
+    def set_weather(self, weather):
+        """Switch particle count and style for a weather type"""
+        self.weather = weather
+        style = WEATHER_STYLES.get(weather)
+        if style is None:
+            self.count = 0
+            self.root.hide()
+            return
+
+        count, self.style, color, speed, self.drift = style
+        self.count = min(count, self.capacity)
+        self.respawn(np.arange(self.count), spread=True)
+        velocities = self.velocities[:self.count]
+        velocities[:, 0] = self.drift
+        velocities[:, 1] = 0.0
+        velocities[:, 2] = -speed * self.rng.uniform(0.8, 1.2, self.count)
+
+        # A Geom cannot change primitive type, so swap in a new one over the same vertices
+        if self.style == "rain":
+            primitive = line_primitive(self.count)
+        else:
+            primitive = GeomPoints(Geom.UHStatic)
+            primitive.addConsecutiveVertices(0, self.count)
+        geom = Geom(self.vdata)
+        geom.addPrimitive(primitive)
+        self.node.setGeom(0, geom)
+        self.root.setColor(*color)
+        self.root.setRenderModeThickness(1 if self.style == "rain" else 2)
+        self.root.show()
+
+    def respawn(self, rows, spread=False):
+        """Place particles at random spots at the top, or anywhere in the column if spread"""
+        count = len(rows)
+        self.positions[rows, 0] = self.rng.uniform(-AREA_HALF_SIZE, AREA_HALF_SIZE, count)
+        self.positions[rows, 1] = self.rng.uniform(-AREA_HALF_SIZE, AREA_HALF_SIZE, count)
+        low = 0.0 if spread else CEILING * 0.9
+        self.positions[rows, 2] = self.rng.uniform(low, CEILING, count)
+
+    def update(self, dt):
+        """Integrate every particle and upload the vertex buffer"""
+        if not self.count:
+            return
+        self.time += dt
+        count = self.count
+        positions = self.positions[:count]
+        velocities = self.velocities[:count]
+        step = self.step[:count]
+
+        # Snowflakes sway around their drift; rain falls straight
+        if self.style == "snow":
+            velocities[:, 0] = self.drift + np.sin(self.time + self.phases[:count])
+        np.multiply(velocities, dt, out=step)
+        positions += step
+
+        landed = np.flatnonzero(positions[:, 2] < 0.0)
+        if len(landed):
+            self.respawn(landed)
+
+        # Heads, then tails trailing them along the velocity
+        vertices = np.frombuffer(memoryview(self.vdata.modifyArray(0)), np.float32).reshape(-1, 3)
+        vertices[:count] = positions
+        if self.style == "rain":
+            np.multiply(velocities, -STREAK_TIME, out=step)
+            np.add(positions, step, out=vertices[count:count * 2])